@@ -2,63 +2,137 @@
 Main ``linkml`` entrypoint
 
 Gathers all the other linkml click entrypoints and puts them under ``linkml`` :)
+
+Subcommands are imported only when they are run, so that ``linkml --help`` or a single
+``linkml generate`` subcommand does not import every generator and its dependencies.
 """
 
+import importlib
+
 import click
 
 from linkml._version import __version__
-from linkml.converter.cli import cli as linkml_convert
-from linkml.generators.csvgen import cli as gen_csv
-from linkml.generators.dbmlgen import cli as gen_dbml
-from linkml.generators.docgen import cli as gen_doc
-from linkml.generators.dotgen import cli as gen_graphviz
-from linkml.generators.erdiagramgen import cli as gen_erdiagram
-from linkml.generators.excelgen import cli as gen_excel
-from linkml.generators.golanggen import cli as gen_golang
-from linkml.generators.golrgen import cli as gen_golr_views
-from linkml.generators.graphqlgen import cli as gen_graphql
-from linkml.generators.javagen import cli as gen_java
-from linkml.generators.jsonldcontextgen import cli as gen_jsonld_context
-from linkml.generators.jsonldgen import cli as gen_jsonld
-from linkml.generators.jsonschemagen import cli as gen_json_schema
-from linkml.generators.linkmlgen import cli as gen_linkml
-from linkml.generators.namespacegen import cli as gen_namespaces
-from linkml.generators.openapigen import cli as gen_openapi
-from linkml.generators.owlgen import cli as gen_owl
-from linkml.generators.panderagen import cli as gen_pandera
-from linkml.generators.plantumlgen import cli as gen_plantuml
-from linkml.generators.prefixmapgen import cli as gen_prefix_map
-from linkml.generators.projectgen import cli as gen_project
-from linkml.generators.protogen import cli as gen_proto
-from linkml.generators.pydanticgen import cli as gen_pydantic
-from linkml.generators.pythongen import cli as gen_python
-from linkml.generators.rdfgen import cli as gen_rdf
-from linkml.generators.rustgen.cli import cli as gen_rust
-from linkml.generators.shaclgen import cli as gen_shacl
-from linkml.generators.shexgen import cli as gen_shex
-from linkml.generators.sparqlgen import cli as gen_sparql
-from linkml.generators.sqlalchemygen import cli as gen_sqla
-from linkml.generators.sqltablegen import cli as gen_sqltables
-from linkml.generators.sqlvalidationgen import cli as gen_sqlvalidation
-from linkml.generators.sssomgen import cli as gen_sssom
-from linkml.generators.summarygen import cli as gen_summary
-from linkml.generators.terminusdbgen import cli as gen_terminusdb
-from linkml.generators.typescriptgen import cli as gen_typescript
-from linkml.generators.yamlgen import cli as gen_yaml
-from linkml.generators.yarrrmlgen import cli as gen_yarrrml
-from linkml.linter.cli import main as linkml_lint
-from linkml.utils.execute_tutorial import cli as run_tutorial
-from linkml.utils.schema_fixer import main as linkml_schema_fixer
-from linkml.utils.sqlutils import main as linkml_sqldb
-from linkml.validator.cli import cli as linkml_validate
-from linkml.workspaces.example_runner import cli as linkml_run_examples
+
+
+class LazyGroup(click.Group):
+    """
+    A click group whose subcommands are imported when they are first used
+
+    Each lazy subcommand is given by the import path of its command (``module:attribute``) and the
+    first paragraph of its help, so that listing the subcommands with ``--help`` does not import them.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name][0].split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attribute), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # As click.Group.format_commands, with a stand-in for each command that has not been imported yet
+        commands = [
+            (name, self.commands.get(name) or click.Command(name, help=self.lazy_subcommands[name][1]))
+            for name in self.list_commands(ctx)
+        ]
+        commands = [(name, cmd) for name, cmd in commands if not cmd.hidden]
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            with formatter.section("Commands"):
+                formatter.write_dl([(name, cmd.get_short_help_str(limit)) for name, cmd in commands])
+
+
+COMMANDS = {
+    "convert": (
+        "linkml.converter.cli:cli",
+        "Converts instance data to and from different LinkML Runtime serialization formats.",
+    ),
+    "lint": ("linkml.linter.cli:main", "Run linter on SCHEMA."),
+    "sqldb": ("linkml.utils.sqlutils:main", "Run the LinkML SQL CLI."),
+    "fix": ("linkml.utils.schema_fixer:main", "Apply schema-fixer commands."),
+    "examples": (
+        "linkml.workspaces.example_runner:cli",
+        "Process a folder of examples and a folder of counter examples.",
+    ),
+    "validate": (
+        "linkml.validator.cli:cli",
+        "Validate data against a LinkML schema, or validate a schema against the metamodel.",
+    ),
+}
+"""Top-level ``linkml`` commands: import path and first paragraph of help"""
+
+GENERATORS = {
+    "jsonld-context": (
+        "linkml.generators.jsonldcontextgen:cli",
+        "Generate jsonld @context definition from LinkML model",
+    ),
+    "prefix-map": ("linkml.generators.prefixmapgen:cli", "Generate jsonld @context definition from LinkML model"),
+    "csv": ("linkml.generators.csvgen:cli", "Generate CSV/TSV file from LinkML model"),
+    "graphviz": ("linkml.generators.dotgen:cli", "Generate graphviz representations of the LinkML model"),
+    "golang": ("linkml.generators.golanggen:cli", "Generate Golang structs from a LinkML schema."),
+    "golr-views": ("linkml.generators.golrgen:cli", "Generate GOLR representation of a LinkML model"),
+    "graphql": ("linkml.generators.graphqlgen:cli", "Generate graphql representation of a LinkML model"),
+    "java": ("linkml.generators.javagen:cli", "Generate java classes to represent a LinkML model"),
+    "jsonld": ("linkml.generators.jsonldgen:cli", "Generate JSONLD file from LinkML schema."),
+    "json-schema": ("linkml.generators.jsonschemagen:cli", "Generate JSON Schema representation of a LinkML model"),
+    "doc": ("linkml.generators.docgen:cli", "Generate documentation folder from a LinkML YAML schema"),
+    "namespaces": (
+        "linkml.generators.namespacegen:cli",
+        "Generate a namespace manager for all of the prefixes represented in a LinkML model",
+    ),
+    "openapi": (
+        "linkml.generators.openapigen:cli",
+        "Generate an OpenAPI v3.0.3 spec with resources modelled with LinkML.",
+    ),
+    "owl": ("linkml.generators.owlgen:cli", "Generate an OWL representation of a LinkML model"),
+    "plantuml": ("linkml.generators.plantumlgen:cli", "Generate a UML representation of a LinkML model."),
+    "proto": ("linkml.generators.protogen:cli", "Generate proto representation of LinkML model"),
+    "python": ("linkml.generators.pythongen:cli", "Generate python classes to represent a LinkML model"),
+    "pydantic": ("linkml.generators.pydanticgen:cli", "Generate pydantic classes to represent a LinkML model"),
+    "pandera": ("linkml.generators.panderagen:cli", "Generate Pandera classes to represent a LinkML model"),
+    "rdf": ("linkml.generators.rdfgen:cli", "Generate an RDF representation of a LinkML model"),
+    "rust": ("linkml.generators.rustgen.cli:cli", ""),
+    "shex": ("linkml.generators.shexgen:cli", "Generate a ShEx Schema for a LinkML model"),
+    "shacl": ("linkml.generators.shaclgen:cli", "Generate SHACL turtle from a LinkML model"),
+    "sparql": ("linkml.generators.sparqlgen:cli", "Generate SPARQL queries for validation"),
+    "typescript": ("linkml.generators.typescriptgen:cli", "Generate typescript interfaces and types"),
+    "terminusdb": ("linkml.generators.terminusdbgen:cli", "Generate TerminusDB JSON-LD schema from a LinkML model"),
+    "yaml": ("linkml.generators.yamlgen:cli", "Validate input and produce fully resolved yaml equivalent"),
+    "erdiagram": ("linkml.generators.erdiagramgen:cli", "Generate a mermaid ER diagram from a schema."),
+    "sqla": ("linkml.generators.sqlalchemygen:cli", "Generate SQL DDL representation"),
+    "sqltables": ("linkml.generators.sqltablegen:cli", "Generate SQL DDL representation."),
+    "sqlvalidation": ("linkml.generators.sqlvalidationgen:cli", "Generate SQL validation queries from LinkML schema."),
+    "summary": ("linkml.generators.summarygen:cli", "Generate TSV summary files for viewing in Excel and the like"),
+    "project": ("linkml.generators.projectgen:cli", "Generate an entire project LinkML schema"),
+    "excel": ("linkml.generators.excelgen:cli", "Generate Excel representation of a LinkML model"),
+    "sssom": ("linkml.generators.sssomgen:cli", "Generate SSSOM TSV to represent a LinkML model"),
+    "linkml": ("linkml.generators.linkmlgen:cli", ""),
+    "dbml": ("linkml.generators.dbmlgen:cli", "CLI for LinkML to DBML generator."),
+    "yarrrml": ("linkml.generators.yarrrmlgen:cli", "Generate YARRRML mappings from a LinkML schema."),
+}
+"""``linkml generate`` subcommands: import path and first paragraph of help"""
+
+DEV_COMMANDS = {
+    "tutorial": (
+        "linkml.utils.execute_tutorial:cli",
+        "Execute a tutorial markdown file (eg. those in the /docs/intro/ directory) and save the outputs in the given "
+        "directory",
+    ),
+}
+"""``linkml dev`` subcommands: import path and first paragraph of help"""
 
 # --------------------------------------------------
 # Command groups
 # --------------------------------------------------
 
 
-@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS, context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(__version__, "-V", "--version")
 def linkml():
     """
@@ -66,7 +140,7 @@ def linkml():
     """
 
 
-@linkml.group()
+@linkml.group(cls=LazyGroup, lazy_subcommands=GENERATORS)
 @click.version_option(__version__, "-V", "--version")
 def generate():
     """
@@ -74,65 +148,9 @@ def generate():
     """
 
 
-@linkml.group()
+@linkml.group(cls=LazyGroup, lazy_subcommands=DEV_COMMANDS)
 @click.version_option(__version__, "-V", "--version")
 def dev():
     """
     Helper tools for linkml development
     """
-
-
-# --------------------------------------------------
-# Add commands to groups
-# --------------------------------------------------
-
-# Top-level linkml commands
-linkml.add_command(linkml_convert, name="convert")
-linkml.add_command(linkml_lint, name="lint")
-linkml.add_command(linkml_sqldb, name="sqldb")
-linkml.add_command(linkml_schema_fixer, name="fix")
-linkml.add_command(linkml_run_examples, name="examples")
-linkml.add_command(linkml_validate, name="validate")
-
-# Generators
-generate.add_command(gen_jsonld_context, name="jsonld-context")
-generate.add_command(gen_prefix_map, name="prefix-map")
-generate.add_command(gen_csv, name="csv")
-generate.add_command(gen_graphviz, name="graphviz")
-generate.add_command(gen_golang, name="golang")
-generate.add_command(gen_golr_views, name="golr-views")
-generate.add_command(gen_graphql, name="graphql")
-generate.add_command(gen_java, name="java")
-generate.add_command(gen_jsonld, name="jsonld")
-generate.add_command(gen_json_schema, name="json-schema")
-generate.add_command(gen_doc, name="doc")
-generate.add_command(gen_namespaces, name="namespaces")
-generate.add_command(gen_openapi, name="openapi")
-generate.add_command(gen_owl, name="owl")
-generate.add_command(gen_plantuml, name="plantuml")
-generate.add_command(gen_proto, name="proto")
-generate.add_command(gen_python, name="python")
-generate.add_command(gen_pydantic, name="pydantic")
-generate.add_command(gen_pandera, name="pandera")
-generate.add_command(gen_rdf, name="rdf")
-generate.add_command(gen_rust, name="rust")
-generate.add_command(gen_shex, name="shex")
-generate.add_command(gen_shacl, name="shacl")
-generate.add_command(gen_sparql, name="sparql")
-generate.add_command(gen_typescript, name="typescript")
-generate.add_command(gen_terminusdb, name="terminusdb")
-generate.add_command(gen_yaml, name="yaml")
-generate.add_command(gen_erdiagram, name="erdiagram")
-generate.add_command(gen_sqla, name="sqla")
-generate.add_command(gen_sqltables, name="sqltables")
-generate.add_command(gen_sqlvalidation, name="sqlvalidation")
-generate.add_command(gen_summary, name="summary")
-generate.add_command(gen_project, name="project")
-generate.add_command(gen_excel, name="excel")
-generate.add_command(gen_sssom, name="sssom")
-generate.add_command(gen_linkml, name="linkml")
-generate.add_command(gen_dbml, name="dbml")
-generate.add_command(gen_yarrrml, name="yarrrml")
-
-# Dev helpers
-dev.add_command(run_tutorial, name="tutorial")
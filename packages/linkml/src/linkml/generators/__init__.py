@@ -3,23 +3,50 @@ Generators translate between a SchemaDefinition and an alternative
 representation such as JsonSchema
 """
 
-from linkml.generators.javagen import JavaGenerator
-from linkml.generators.jsonldcontextgen import ContextGenerator
-from linkml.generators.jsonldgen import JSONLDGenerator
-from linkml.generators.jsonschemagen import JsonSchemaGenerator
-from linkml.generators.openapigen import OpenApiGenerator
-from linkml.generators.owlgen import OwlSchemaGenerator
-from linkml.generators.panderagen import PanderaDataframeGenerator, PolarsSchemaDataframeGenerator
-from linkml.generators.pydanticgen import PydanticGenerator
-from linkml.generators.pythongen import PythonGenerator
-from linkml.generators.rdfgen import RDFGenerator
-from linkml.generators.rustgen import RustGenerator
-from linkml.generators.shaclgen import ShaclGenerator
-from linkml.generators.shexgen import ShExGenerator
-from linkml.generators.sqlalchemygen import SQLAlchemyGenerator
-from linkml.generators.sqltablegen import SQLTableGenerator
-from linkml.generators.sqlvalidationgen import SQLValidationGenerator
-from linkml.generators.typedbgen import TypeDBGenerator
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from linkml.generators.javagen import JavaGenerator
+    from linkml.generators.jsonldcontextgen import ContextGenerator
+    from linkml.generators.jsonldgen import JSONLDGenerator
+    from linkml.generators.jsonschemagen import JsonSchemaGenerator
+    from linkml.generators.openapigen import OpenApiGenerator
+    from linkml.generators.owlgen import OwlSchemaGenerator
+    from linkml.generators.panderagen import PanderaDataframeGenerator, PolarsSchemaDataframeGenerator
+    from linkml.generators.pydanticgen import PydanticGenerator
+    from linkml.generators.pythongen import PythonGenerator
+    from linkml.generators.rdfgen import RDFGenerator
+    from linkml.generators.rustgen import RustGenerator
+    from linkml.generators.shaclgen import ShaclGenerator
+    from linkml.generators.shexgen import ShExGenerator
+    from linkml.generators.sqlalchemygen import SQLAlchemyGenerator
+    from linkml.generators.sqltablegen import SQLTableGenerator
+    from linkml.generators.sqlvalidationgen import SQLValidationGenerator
+    from linkml.generators.typedbgen import TypeDBGenerator
+
+# Generators are imported when first used, so that importing one generator (as each ``linkml generate``
+# subcommand does) does not import all of them
+_GENERATOR_MODULES = {
+    "JavaGenerator": "linkml.generators.javagen",
+    "ContextGenerator": "linkml.generators.jsonldcontextgen",
+    "JSONLDGenerator": "linkml.generators.jsonldgen",
+    "JsonSchemaGenerator": "linkml.generators.jsonschemagen",
+    "OpenApiGenerator": "linkml.generators.openapigen",
+    "OwlSchemaGenerator": "linkml.generators.owlgen",
+    "PanderaDataframeGenerator": "linkml.generators.panderagen",
+    "PolarsSchemaDataframeGenerator": "linkml.generators.panderagen",
+    "PydanticGenerator": "linkml.generators.pydanticgen",
+    "PythonGenerator": "linkml.generators.pythongen",
+    "RDFGenerator": "linkml.generators.rdfgen",
+    "RustGenerator": "linkml.generators.rustgen",
+    "ShaclGenerator": "linkml.generators.shaclgen",
+    "ShExGenerator": "linkml.generators.shexgen",
+    "SQLAlchemyGenerator": "linkml.generators.sqlalchemygen",
+    "SQLTableGenerator": "linkml.generators.sqltablegen",
+    "SQLValidationGenerator": "linkml.generators.sqlvalidationgen",
+    "TypeDBGenerator": "linkml.generators.typedbgen",
+}
 
 __all__ = [
     "csvgen",
@@ -69,3 +96,18 @@ __all__ = [
 # GENERATOR_BASE = "0.9"
 
 # PYTHON_GEN_VERSION = GENERATOR_BASE + ".0"
+
+
+def __getattr__(name: str):
+    if name in _GENERATOR_MODULES:
+        return getattr(importlib.import_module(_GENERATOR_MODULES[name]), name)
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,70 @@
+"""
+Build the elements of a schema in worker processes
+
+Template-based generators build a result for each class, slot or enum of a schema independently
+of the others (see :mod:`.build`), then assemble the results in order.  :func:`build_elements` runs
+those builds in forked worker processes.
+
+Workers inherit the generator, and the schemaview it holds, as they were when the workers were forked:
+neither is pickled, only the indices of the elements go to the workers and only the build results
+come back.  Results are returned in the order of the elements, so the assembled output does not
+depend on the number of processes.
+
+A build run in a worker cannot change the generator in the parent process, so anything a build
+collects on the generator must be returned as part of its result.
+"""
+
+import logging
+import multiprocessing
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CHUNKS_PER_PROCESS = 4
+"""Elements are sent to the workers in this many chunks per process, to spread uneven builds"""
+
+_worker_build: Callable | None = None
+_worker_elements: list = []
+
+
+def _init_worker(build: Callable, elements: list) -> None:
+    # Forked workers inherit the build and the elements, so neither is ever pickled
+    global _worker_build, _worker_elements
+    _worker_build = build
+    _worker_elements = elements
+
+
+def _build(i: int):
+    return _worker_build(_worker_elements[i])
+
+
+def build_elements(build: Callable[[T], R], elements: Iterable[T], processes: int = 1) -> list[R]:
+    """
+    Build each element, in worker processes if more than one process is asked for
+
+    :param build: builds one element, usually a bound method of the generator
+    :param elements: elements to build
+    :param processes: number of worker processes; 1 (or fewer) builds the elements in this process
+    :return: the build results, in the order of the elements
+    """
+    elements = list(elements)
+    processes = min(processes or 1, len(elements))
+    if processes > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        logger.warning("Building elements in this process, as worker processes cannot share the schema")
+        processes = 1
+    if processes <= 1:
+        return [build(element) for element in elements]
+    chunksize = ceil(len(elements) / (processes * CHUNKS_PER_PROCESS))
+    with ProcessPoolExecutor(
+        processes,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(build, elements),
+    ) as executor:
+        return list(executor.map(_build, range(len(elements)), chunksize=chunksize))
@@ -3,6 +3,7 @@ Generate CSVs
 """
 
 import os
+import sys
 from csv import DictWriter
 from dataclasses import dataclass
 from io import StringIO
@@ -101,7 +102,8 @@ class CsvGenerator(Generator):
 @click.option("--root", "-r", multiple=True, help="Class(es) to transform")
 def cli(yamlfile, root=None, **args):
     """Generate CSV/TSV file from LinkML model"""
-    print(CsvGenerator(yamlfile, **args).serialize(classes=root, **args))
+    CsvGenerator(yamlfile, **args).serialize_to(sys.stdout, classes=root, **args)
+    print()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ from collections.abc import Iterable, Iterator
 from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +13,7 @@ import click
 from jinja2 import Environment, FileSystemLoader, Template
 
 from linkml._version import __version__
+from linkml.generators.common.pipeline import build_elements
 from linkml.generators.erdiagramgen import ERDiagramGenerator
 from linkml.generators.plantumlgen import PlantumlGenerator
 from linkml.utils.generator import Generator, shared_arguments
@@ -176,6 +178,9 @@ class DocGenerator(Generator):
     preserve_names: bool = False
     """If true, preserve LinkML element names in docs instead of camelcase/underscore."""
 
+    processes: int = 1
+    """Number of processes to render pages in, see :func:`~linkml.generators.common.pipeline.build_elements`"""
+
     def __post_init__(self):
         dialect = self.dialect
         if dialect is not None:
@@ -251,17 +256,16 @@ class DocGenerator(Generator):
         if self._is_single_file_format(self.format):
             self.logger.info(f"{self.format} is a single-page format, skipping non-index elements")
             return
+        # Pages are keyed by the file they are written to: as when they were written one after another,
+        # the last page for a file is the one written
+        pages: dict[tuple[str, str], tuple[Template, dict[str, Any]]] = {}
         self.logger.debug("Processing Schemas...")
         template = self._get_template("schema")
         for schema_name in sv.imports_closure():
             self.logger.debug(f"  Generating doc for {schema_name}")
             imported_schema = sv.schema_map.get(schema_name)
-            out_str = template.render(gen=self, schema=imported_schema, schemaview=sv, **template_vars)
-            self._write(
-                out_str,
-                f"{directory}/{SCHEMA_SUBFOLDER}" if self.subfolder_type_separation else directory,
-                imported_schema.name,
-            )
+            subfolder = f"{directory}/{SCHEMA_SUBFOLDER}" if self.subfolder_type_separation else directory
+            pages[(subfolder, imported_schema.name)] = (template, {"schema": imported_schema})
         self.logger.debug("Processing Classes...")
         template = self._get_template("class")
         for cn, c in sv.all_classes().items():
@@ -269,8 +273,8 @@ class DocGenerator(Generator):
                 continue
             n = self.name(c)
             self.logger.debug(f"  Generating doc for {n}")
-            out_str = template.render(gen=self, element=c, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{CLASS_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
+            subfolder = f"{directory}/{CLASS_SUBFOLDER}" if self.subfolder_type_separation else directory
+            pages[(subfolder, n)] = (template, {"element": c})
         self.logger.debug("Processing Slots...")
         template = self._get_template("slot")
         for sn, s in sv.all_slots().items():
@@ -279,8 +283,8 @@ class DocGenerator(Generator):
             n = self.name(s)
             self.logger.debug(f"  Generating doc for {n}")
             s = sv.induced_slot(sn)
-            out_str = template.render(gen=self, element=s, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{SLOT_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
+            subfolder = f"{directory}/{SLOT_SUBFOLDER}" if self.subfolder_type_separation else directory
+            pages[(subfolder, n)] = (template, {"element": s})
         self.logger.debug("Processing Enums...")
         template = self._get_template("enum")
         for en, e in sv.all_enums().items():
@@ -288,8 +292,8 @@ class DocGenerator(Generator):
                 continue
             n = self.name(e)
             self.logger.debug(f"  Generating doc for {n}")
-            out_str = template.render(gen=self, element=e, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{ENUM_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
+            subfolder = f"{directory}/{ENUM_SUBFOLDER}" if self.subfolder_type_separation else directory
+            pages[(subfolder, n)] = (template, {"element": e})
         self.logger.debug("Processing Types...")
         template = self._get_template("type")
         for tn, t in sv.all_types().items():
@@ -298,8 +302,8 @@ class DocGenerator(Generator):
             n = self.name(t)
             self.logger.debug(f"  Generating doc for {n}")
             t = sv.induced_type(tn)
-            out_str = template.render(gen=self, element=t, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{TYPE_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
+            subfolder = f"{directory}/{TYPE_SUBFOLDER}" if self.subfolder_type_separation else directory
+            pages[(subfolder, n)] = (template, {"element": t})
         self.logger.debug("Processing Subsets...")
         template = self._get_template("subset")
         for _, s in sv.all_subsets().items():
@@ -307,8 +311,24 @@ class DocGenerator(Generator):
                 continue
             n = self.name(s)
             self.logger.debug(f"  Generating doc for {n}")
-            out_str = template.render(gen=self, element=s, schemaview=sv, **template_vars)
-            self._write(out_str, f"{directory}/{SUBSET_SUBFOLDER}" if self.subfolder_type_separation else directory, n)
+            subfolder = f"{directory}/{SUBSET_SUBFOLDER}" if self.subfolder_type_separation else directory
+            pages[(subfolder, n)] = (template, {"element": s})
+        build_elements(
+            partial(self._write_page, template_vars=template_vars),
+            [(template, subfolder, n, render_args) for (subfolder, n), (template, render_args) in pages.items()],
+            self.processes,
+        )
+
+    def _write_page(self, page: tuple[Template, str, str, dict[str, Any]], template_vars: dict[str, Any]) -> None:
+        """
+        Renders the page of one element or schema and writes it to a directory
+
+        :param page: template, directory, base name and the element or schema to render
+        :param template_vars: variables passed to every template
+        """
+        template, directory, name, render_args = page
+        out_str = template.render(gen=self, schemaview=self.schemaview, **render_args, **template_vars)
+        self._write(out_str, directory, name)
 
     def _write(self, out_str: str, directory: str, name: str) -> None:
         """
@@ -1193,6 +1213,13 @@ Set to true for truncated descriptions, and false to display full descriptions."
     show_default=True,
     help="Preserve original LinkML names in documentation output (e.g., for page titles, links, and file names).",
 )
+@click.option(
+    "--processes",
+    "-j",
+    default=1,
+    show_default=True,
+    help="Number of processes to render pages in",
+)
 @click.version_option(__version__, "-V", "--version")
 @click.command(name="doc")
 def cli(
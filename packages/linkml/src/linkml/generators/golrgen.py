@@ -8,6 +8,7 @@ See the golr-views directory in this repo for examples
 """
 
 import os
+import sys
 from dataclasses import dataclass
 
 import click
@@ -105,7 +106,8 @@ class GolrSchemaGenerator(Generator):
 @click.version_option(__version__, "-V", "--version")
 def cli(yamlfile, dir=None, **args):
     """Generate GOLR representation of a LinkML model"""
-    print(GolrSchemaGenerator(yamlfile, directory=dir, **args).serialize(directory=dir, **args))
+    GolrSchemaGenerator(yamlfile, directory=dir, **args).serialize_to(sys.stdout, directory=dir, **args)
+    print()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import logging
 import os
 import re
+import sys
 from dataclasses import dataclass
 
 import click
@@ -31,6 +32,11 @@ class GraphqlGenerator(Generator):
         super().__post_init__()
 
     def visit_schema(self, **kwargs) -> str:
+        if self.strict_naming:
+            # Fail before anything has been written, rather than part way through a streamed output
+            for enum in self.schema.enums.values():
+                for value in enum.permissible_values:
+                    self.name_compatiblity.compatible(value)
         return self.generate_header()
 
     def generate_header(self) -> str:
@@ -114,7 +120,8 @@ class GraphqlGenerator(Generator):
 def cli(yamlfile, **args):
     """Generate graphql representation of a LinkML model"""
     generator = GraphqlGenerator(yamlfile, **args)
-    print(generator.serialize(**args))
+    generator.serialize_to(sys.stdout, **args)
+    print()
 
 
 if __name__ == "__main__":
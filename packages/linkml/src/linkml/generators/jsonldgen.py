@@ -13,7 +13,7 @@ from linkml import METAMODEL_CONTEXT_URI
 from linkml._version import __version__
 from linkml.generators.jsonldcontextgen import ContextGenerator
 from linkml.utils.deprecation import deprecated_fields
-from linkml.utils.generator import Generator, shared_arguments
+from linkml.utils.generator import Generator, SchemaContext, shared_arguments
 from linkml_runtime.linkml_model.meta import (
     ClassDefinition,
     ClassDefinitionName,
@@ -64,8 +64,14 @@ class JSONLDGenerator(Generator):
     """Override for metamodel context URI/path. When None, uses METAMODEL_CONTEXT_URI."""
 
     def __post_init__(self) -> None:
-        self.original_schema = deepcopy(self.schema)
-        super().__post_init__()
+        if isinstance(self.schema, SchemaContext):
+            # The visitor rewrites the schema in place, so work on a copy of the shared one
+            self.original_schema = self.schema
+            super().__post_init__()
+            self.schema = deepcopy(self.schema)
+        else:
+            self.original_schema = deepcopy(self.schema)
+            super().__post_init__()
 
     def _add_type(self, node: YAMLRoot) -> dict:
         if self.format == "jsonld":
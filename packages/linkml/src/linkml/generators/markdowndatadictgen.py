@@ -11,6 +11,7 @@ import hashlib
 import logging
 import os
 import re
+import sys
 import urllib.request
 import zlib
 from collections.abc import Callable
@@ -1592,7 +1593,8 @@ def pad_heading(text: str) -> str:
 def cli(yamlfile, **kwargs):
     """Generate markdown documentation of a LinkML model"""
     gen = MarkdownDataDictGen(yamlfile, **kwargs)
-    print(gen.serialize(**kwargs))
+    gen.serialize_to(sys.stdout, **kwargs)
+    print()
 
 
 if __name__ == "__main__":
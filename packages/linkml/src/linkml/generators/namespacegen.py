@@ -1,4 +1,5 @@
 import os
+import sys
 from dataclasses import dataclass
 
 import click
@@ -200,7 +201,8 @@ def curie(identifier) -> str:
 @click.command(name="namespaces")
 def cli(yamlfile, **args):
     """Generate a namespace manager for all of the prefixes represented in a LinkML model"""
-    print(NamespaceGenerator(yamlfile, **args).serialize(**args))
+    NamespaceGenerator(yamlfile, **args).serialize_to(sys.stdout, **args)
+    print()
 
 
 if __name__ == "__main__":
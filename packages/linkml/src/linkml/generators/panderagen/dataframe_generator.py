@@ -11,6 +11,7 @@ from typing import ClassVar
 
 from jinja2 import Environment, PackageLoader
 
+from linkml.generators.common.pipeline import build_elements
 from linkml.generators.oocodegen import OOCodeGenerator, OODocument
 from linkml_runtime.linkml_model.meta import TypeDefinition
 from linkml_runtime.utils.compile_python import compile_python
@@ -58,6 +59,9 @@ class DataframeGenerator(OOCodeGenerator, ABC):
     backing_form: str = "serialization"
     """specific storage format that may differ from specified inlined flags"""
 
+    processes: int = 1
+    """number of processes to build classes in, see :func:`~linkml.generators.common.pipeline.build_elements`"""
+
     def __post_init__(self):
         super().__post_init__()
         if self.TYPE_MAP is None:
@@ -290,33 +294,31 @@ class DataframeGenerator(OOCodeGenerator, ABC):
         return oodoc
 
     def append_classes(self, oodoc: OODocument):
-        classes = []
-
-        for c in self.class_handler.ordered_classes():
-            if c.name in self.schemaview.all_enums():
-                continue
-            cn = c.name
-            safe_cn = self.get_class_name(cn)
-            annotations = {}
-            identifier_or_key_slot = self.slot_handler.get_identifier_or_key_slot(cn)
-            if identifier_or_key_slot:
-                annotations["identifier_key_slot"] = identifier_or_key_slot.name
-            ooclass = DataframeClass(
-                name=safe_cn,
-                description=c.description,
-                package=self.package,
-                fields=[],
-                all_fields=[],
-                source_class=c,
-                annotations=annotations,
-            )
-
-            self.append_mixins(c, ooclass)
-            self.append_slots(c, ooclass)
+        all_enums = self.schemaview.all_enums()
+        classes = [c for c in self.class_handler.ordered_classes() if c.name not in all_enums]
+        oodoc.classes = build_elements(self._build_class, classes, self.processes)
+
+    def _build_class(self, c) -> DataframeClass:
+        cn = c.name
+        safe_cn = self.get_class_name(cn)
+        annotations = {}
+        identifier_or_key_slot = self.slot_handler.get_identifier_or_key_slot(cn)
+        if identifier_or_key_slot:
+            annotations["identifier_key_slot"] = identifier_or_key_slot.name
+        ooclass = DataframeClass(
+            name=safe_cn,
+            description=c.description,
+            package=self.package,
+            fields=[],
+            all_fields=[],
+            source_class=c,
+            annotations=annotations,
+        )
 
-            classes.append(ooclass)
+        self.append_mixins(c, ooclass)
+        self.append_slots(c, ooclass)
 
-        oodoc.classes = classes
+        return ooclass
 
     def append_mixins(self, schemaview_class, ooclass: DataframeClass) -> None:
         if schemaview_class.mixin:
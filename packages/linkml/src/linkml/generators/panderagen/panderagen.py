@@ -144,6 +144,7 @@ DATAFRAME_GROUP = [
     help=f"Generator class to use. Options: {list(GENERATOR_CLASSES.keys())} (not used with --package)",
     default="PanderaDataframeGenerator",
 )
+@click.option("--processes", "-j", default=1, show_default=True, help="Number of processes to build classes in")
 @click.version_option(__version__, "-V", "--version")
 @click.argument("yamlfile")
 @click.command(name="gen-pandera")
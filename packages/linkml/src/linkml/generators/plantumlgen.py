@@ -6,6 +6,7 @@ https://plantuml.com/
 
 import base64
 import os
+import sys
 import zlib
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -499,7 +500,7 @@ class PlantumlGenerator(Generator):
 def cli(yamlfile, **args):
     """Generate a UML representation of a LinkML model.
     PlantUML code print out only if no directory provided."""
-    print(PlantumlGenerator(yamlfile, **args).serialize(**args), end="")
+    PlantumlGenerator(yamlfile, **args).serialize_to(sys.stdout, **args)
 
 
 if __name__ == "__main__":
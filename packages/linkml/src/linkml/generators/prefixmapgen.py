@@ -4,6 +4,7 @@ Generate JSON-LD contexts
 """
 
 import os
+import sys
 from dataclasses import dataclass, field
 
 import click
@@ -117,4 +118,5 @@ class PrefixGenerator(Generator):
 @click.version_option(__version__, "-V", "--version")
 def cli(yamlfile, **args):
     """Generate jsonld @context definition from LinkML model"""
-    print(PrefixGenerator(yamlfile, **args).serialize(**args))
+    PrefixGenerator(yamlfile, **args).serialize_to(sys.stdout, **args)
+    print()
@@ -1,6 +1,9 @@
 import logging
+import multiprocessing
+import time
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
@@ -22,7 +25,8 @@ from linkml.generators.pythongen import PythonGenerator
 from linkml.generators.shaclgen import ShaclGenerator
 from linkml.generators.shexgen import ShExGenerator
 from linkml.generators.sqltablegen import SQLTableGenerator
-from linkml.utils.generator import Generator
+from linkml.utils.buildcache import BuildCache, build_key, schema_files
+from linkml.utils.generator import Generator, SchemaContext
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +59,18 @@ GEN_MAP = {
     "excel": (ExcelGenerator, "excel/{name}.xlsx", {"output": "{parent}/{name}.xlsx"}),
 }
 
+# Generator arguments that change how a schema is loaded.  A generator given any of these loads the schema itself
+# rather than using the shared SchemaContext
+LOADING_ARGS = {
+    "base_dir",
+    "importmap",
+    "useuris",
+    "mergeimports",
+    "metadata",
+    "source_file_date",
+    "source_file_size",
+}
+
 
 @lru_cache
 def get_local_imports(schema_path: Path, dir: Path):
@@ -81,6 +97,10 @@ class ProjectConfiguration:
     includes: list[str] = None
     excludes: list[str] = None
     mergeimports: bool = None
+    processes: int = 1
+    """Number of generators to run at once, each in a process of its own"""
+    force: bool = False
+    """Regenerate every artefact, even those the build cache has as up to date"""
 
 
 class ProjectGenerator:
@@ -88,10 +108,22 @@ class ProjectGenerator:
     Generates complete project folders
 
     Note this doesn't conform to overall generator framework, as it is a meta-generator
+
+    Each schema is loaded once into a :class:`SchemaContext` shared by all generators that load it the same way.
+
+    A :class:`BuildCache` in the project directory records what each artefact was generated from.  Artefacts whose
+    schema files, generator and options are unchanged are not regenerated, unless ``force`` is set.
     """
 
     @staticmethod
-    def generate(schema_path: str, config: ProjectConfiguration = ProjectConfiguration()):
+    def generate(schema_path: str, config: ProjectConfiguration = ProjectConfiguration()) -> dict[str, float]:
+        """
+        Generate the project artefacts for a schema
+
+        :param schema_path: path to the schema
+        :param config: project configuration
+        :return: wall time in seconds spent in each generator, for the artefacts that were regenerated
+        """
         if config.directory is None:
             raise Exception("Must pass directory")
         output_dir = Path(config.directory)
@@ -101,6 +133,11 @@ class ProjectGenerator:
         else:
             all_schemas = get_local_imports(schema_path, Path(schema_path).parent)
         logger.debug(f"ALL_SCHEMAS = {all_schemas}")
+        cache = BuildCache(output_dir, force=config.force)
+        contexts: dict[tuple, SchemaContext] = {}
+        files: dict[str, list[Path]] = {}
+        jobs = []
+        keys = []
         for gen_name, (gen_cls, gen_path_fmt, default_gen_args) in GEN_MAP.items():
             if config.includes is not None and config.includes != [] and gen_name not in config.includes:
                 logger.info(f"Skipping {gen_name} as not in inclusion list: {config.includes}")
@@ -121,15 +158,12 @@ class ProjectGenerator:
                     **default_gen_args,
                     **config.generator_args.get(gen_name, {}),
                 }
-                gen: Generator
 
                 # special check for output key because ExcelGenerator and
                 # SSSOMGenerator read in output file name during initialization
                 if "output" in all_gen_args:
                     all_gen_args["output"] = all_gen_args["output"].format(name=name, parent=parent_dir)
 
-                gen = gen_cls(local_path, **all_gen_args)
-
                 serialize_args = {"mergeimports": config.mergeimports}
                 for k, v in all_gen_args.items():
                     # all ARG_DICT values are interpolatable
@@ -137,18 +171,104 @@ class ProjectGenerator:
                         v = v.format(name=name, parent=parent_dir)
                     serialize_args[k] = v
                 logger.info(f" {gen_name} ARGS: {serialize_args}")
-                gen_dump = gen.serialize(**serialize_args)
 
-                if gen_name != "excel":
-                    if gen_path_full.suffix != "":
-                        logger.info(f"  WRITING TO: {gen_path_full}")
-                        with open(gen_path_full, "w", encoding="UTF-8") as stream:
-                            stream.write(gen_dump)
-                else:
-                    # special handling for excel generator
-                    # we do not need to route the output
-                    # into a file like the other generators
-                    gen.serialize(**serialize_args)
+                if local_path not in files:
+                    files[local_path] = schema_files(local_path)
+                key = build_key(files[local_path], gen_cls, all_gen_args, serialize_args)
+                if cache.is_current(gen_path_full, key):
+                    logger.info(f" {gen_name}: {gen_path_full.name} is up to date")
+                    continue
+
+                schema = local_path
+                if not LOADING_ARGS.intersection(all_gen_args):
+                    schema = _schema_context(contexts, str(local_path), gen_cls)
+                jobs.append((gen_name, gen_cls, schema, all_gen_args, serialize_args, gen_path_full))
+                keys.append(key)
+
+        processes = config.processes or 1
+        if processes > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Running generators one at a time, as worker processes cannot share the loaded schemas")
+            processes = 1
+        timings: dict[str, float] = defaultdict(float)
+        try:
+            if processes > 1:
+                # Load every schema before the workers are forked, so that they share it
+                for context in contexts.values():
+                    context.loader
+                    context.schemaview
+                with ProcessPoolExecutor(
+                    processes,
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_worker,
+                    initargs=(jobs,),
+                ) as executor:
+                    futures = [executor.submit(_run_job, i) for i in range(len(jobs))]
+                    for job, key, future in zip(jobs, keys, futures):
+                        timings[job[0]] += future.result()
+                        cache.record(job[-1], key)
+            else:
+                for job, key in zip(jobs, keys):
+                    timings[job[0]] += _run_generator(*job)
+                    cache.record(job[-1], key)
+        finally:
+            cache.save()
+        logger.info(f"Build cache: {cache.hits} up to date, {cache.misses} generated")
+        return dict(timings)
+
+
+def _schema_context(contexts: dict[tuple, SchemaContext], local_path: str, gen_cls: type[Generator]) -> SchemaContext:
+    """The shared context for a schema, loaded with the defaults of a generator class"""
+    defaults = {f.name: f.default for f in fields(gen_cls)}
+    key = (local_path, defaults["useuris"], defaults["mergeimports"], defaults["metadata"])
+    if key not in contexts:
+        contexts[key] = SchemaContext(
+            local_path,
+            useuris=defaults["useuris"],
+            mergeimports=defaults["mergeimports"],
+            metadata=defaults["metadata"],
+        )
+    return contexts[key]
+
+
+_worker_jobs: list[tuple] = []
+
+
+def _init_worker(jobs: list[tuple]) -> None:
+    # Forked workers inherit the jobs, so the schema contexts in them are never pickled
+    global _worker_jobs
+    _worker_jobs = jobs
+
+
+def _run_job(i: int) -> float:
+    return _run_generator(*_worker_jobs[i])
+
+
+def _run_generator(
+    gen_name: GENERATOR_NAME,
+    gen_cls: type[Generator],
+    schema: str | SchemaContext,
+    all_gen_args: ARG_DICT,
+    serialize_args: ARG_DICT,
+    gen_path_full: Path,
+) -> float:
+    """Run one generator and write its output, returning the wall time it took"""
+    start = time.perf_counter()
+    gen = gen_cls(schema, **all_gen_args)
+    gen_dump = gen.serialize(**serialize_args)
+
+    if gen_name != "excel":
+        if gen_path_full.suffix != "":
+            logger.info(f"  WRITING TO: {gen_path_full}")
+            with open(gen_path_full, "w", encoding="UTF-8") as stream:
+                stream.write(gen_dump)
+    else:
+        # special handling for excel generator
+        # we do not need to route the output
+        # into a file like the other generators
+        gen.serialize(**serialize_args)
+    elapsed = time.perf_counter() - start
+    logger.info(f" {gen_name}: {gen_path_full.name} in {elapsed:.2f}s")
+    return elapsed
 
 
 @click.command(name="project")
@@ -172,6 +292,18 @@ class ProjectGenerator:
     show_default=True,
     help="Merge imports into source file",
 )
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate all artefacts, including those the build cache has as up to date",
+)
+@click.option(
+    "--processes",
+    "-j",
+    default=1,
+    show_default=True,
+    help="Number of generators to run at once, each in a process of its own",
+)
 @log_level_option
 @click.argument("yamlfile")
 @click.version_option(__version__, "-V", "--version")
@@ -183,6 +315,8 @@ def cli(
     config_file,
     mergeimports,
     generator_arguments: str,
+    processes: int,
+    force: bool,
     **kwargs,
 ):
     """
@@ -245,8 +379,12 @@ def cli(
     if dir is not None:
         project_config.directory = dir
     project_config.mergeimports = mergeimports
+    project_config.processes = processes
+    project_config.force = force
     gen = ProjectGenerator()
-    gen.generate(yamlfile, project_config)
+    timings = gen.generate(yamlfile, project_config)
+    for gen_name, elapsed in timings.items():
+        logger.info(f"{gen_name}: {elapsed:.2f}s")
 
 
 if __name__ == "__main__":
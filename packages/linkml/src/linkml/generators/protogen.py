@@ -1,5 +1,6 @@
 import os
 import re
+import sys
 from dataclasses import dataclass, field
 
 import click
@@ -374,7 +375,8 @@ class ProtoGenerator(Generator):
 @click.command(name="proto")
 def cli(yamlfile, **args):
     """Generate proto representation of LinkML model"""
-    print(ProtoGenerator(yamlfile, **args).serialize(**args))
+    ProtoGenerator(yamlfile, **args).serialize_to(sys.stdout, **args)
+    print()
 
 
 if __name__ == "__main__":
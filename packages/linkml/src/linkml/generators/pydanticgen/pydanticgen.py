@@ -16,6 +16,7 @@ from jinja2 import ChoiceLoader, Environment, FileSystemLoader, Template
 
 from linkml._version import __version__
 from linkml.generators.common.lifecycle import LifecycleMixin
+from linkml.generators.common.pipeline import build_elements
 from linkml.generators.common.subproperty import get_subproperty_values
 from linkml.generators.common.type_designators import get_accepted_type_designator_values, get_type_designator_value
 from linkml.generators.oocodegen import OOCodeGenerator
@@ -34,6 +35,7 @@ from linkml.generators.pydanticgen.template import (
     PydanticTemplateModel,
 )
 from linkml.utils.generator import shared_arguments
+from linkml.utils.modulecache import module_cache, module_key
 from linkml_runtime.linkml_model.meta import (
     ClassDefinition,
     ElementName,
@@ -392,6 +394,14 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
     slot's range type (string, uriorcurie, uri).
     """
 
+    processes: int = 1
+    """
+    Number of processes to build classes in.
+
+    Classes are built in forked worker processes when this is more than 1,
+    see :func:`~linkml.generators.common.pipeline.build_elements`
+    """
+
     # ObjectVars (identical to pythongen)
     gen_classvars: bool = True
     gen_slots: bool = True
@@ -405,6 +415,7 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
     # Private attributes
     _predefined_slot_values: dict[str, dict[str, str]] | None = None
     _class_bases: dict[str, list[str]] | None = None
+    _class_slot_values: dict[str, dict[str, str]] = field(default_factory=dict)
 
     def __post_init__(self):
         super().__post_init__()
@@ -412,15 +423,24 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
     def compile_module(self, **kwargs) -> ModuleType:
         """
         Compiles generated python code to a module
+
+        The module is shared with every generator of this class with the same options and schema,
+        see :mod:`linkml.utils.modulecache`
         :return:
         """
+        key = module_key(self, **kwargs)
+        module = module_cache.get(key)
+        if module is not None:
+            return module
         pycode = self.serialize(**kwargs)
         try:
-            return compile_python(pycode)
+            module = compile_python(pycode)
         except NameError as e:
             logger.error(f"Code:\n{pycode}")
             logger.error(f"Error compiling generated python code: {e}")
             raise e
+        module_cache.put(key, module, pycode)
+        return module
 
     def _get_classes(self, sv: SchemaView) -> tuple[list[ClassDefinition], list[ClassDefinition] | None]:
         all_classes = sv.all_classes(imports=True).values()
@@ -511,6 +531,11 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
 
         return result
 
+    def _build_class(self, cls: ClassDefinition) -> ClassResult:
+        cls = self.before_generate_class(cls, self.schemaview)
+        result = self.generate_class(cls)
+        return self.after_generate_class(result, self.schemaview)
+
     def _generate_union_class(self, cls: ClassDefinition) -> ClassResult:
         """Generate a union type alias for classes with union_of"""
         # Validate that union_of has at least 2 types
@@ -587,7 +612,7 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
                 del slot_args["alias"]
 
         slot_args["description"] = slot.description.replace('"', '\\"') if slot.description is not None else None
-        predef = self.predefined_slot_values.get(self._get_class_python_name(cls.name), {}).get(slot.name, None)
+        predef = self._class_predefined_slot_values(cls.name).get(slot.name, None)
         if predef is not None:
             slot_args["predefined"] = str(predef)
 
@@ -660,28 +685,40 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
         :return: Dictionary of dictionaries with predefined slot values for each class
         """
         if self._predefined_slot_values is None:
-            sv = self.schemaview
-            ifabsent_processor = PydanticIfAbsentProcessor(sv)
             slot_values = defaultdict(dict)
-            for class_def in sv.all_classes().values():
-                class_python_name = self._get_class_python_name(class_def.name)
-                for slot_name in sv.class_slots(class_def.name):
-                    slot = sv.induced_slot(slot_name, class_def.name)
-                    if slot.designates_type:
-                        target_value = get_type_designator_value(sv, slot, class_def)
-                        slot_values[class_python_name][slot.name] = f'"{target_value}"'
-                        if slot.multivalued:
-                            slot_values[class_python_name][slot.name] = (
-                                "[" + slot_values[class_python_name][slot.name] + "]"
-                            )
-                    elif slot.ifabsent is not None:
-                        value = ifabsent_processor.process_slot(slot, class_def)
-                        slot_values[class_python_name][slot.name] = value
-
-                self._predefined_slot_values = slot_values
+            for class_def in self.schemaview.all_classes().values():
+                class_slot_values = self._class_predefined_slot_values(class_def.name)
+                if class_slot_values:
+                    slot_values[self._get_class_python_name(class_def.name)].update(class_slot_values)
+            self._predefined_slot_values = slot_values
 
         return self._predefined_slot_values
 
+    def _class_predefined_slot_values(self, class_name: str) -> dict[str, str]:
+        """
+        Predefined slot values of one class.
+
+        Computed one class at a time, so that classes built in worker processes
+        each compute their own rather than all of them before the workers are forked.
+        """
+        if self._predefined_slot_values is not None:
+            return self._predefined_slot_values.get(self._get_class_python_name(class_name), {})
+        if class_name not in self._class_slot_values:
+            sv = self.schemaview
+            class_def = sv.get_class(class_name)
+            slot_values = {}
+            for slot_name in sv.class_slots(class_name) if class_def is not None else []:
+                slot = sv.induced_slot(slot_name, class_name)
+                if slot.designates_type:
+                    target_value = get_type_designator_value(sv, slot, class_def)
+                    slot_values[slot.name] = f'"{target_value}"'
+                    if slot.multivalued:
+                        slot_values[slot.name] = "[" + slot_values[slot.name] + "]"
+                elif slot.ifabsent is not None:
+                    slot_values[slot.name] = PydanticIfAbsentProcessor(sv).process_slot(slot, class_def)
+            self._class_slot_values[class_name] = slot_values
+        return self._class_slot_values[class_name]
+
     @property
     def class_bases(self) -> dict[str, list[str]]:
         """
@@ -1142,7 +1179,6 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
         )
 
         # schema classes
-        class_results = []
         source_classes, imported_classes = self._get_classes(sv)
         source_classes = self.sort_classes(source_classes, imported_classes)
         # Don't want to generate classes when class_uri is linkml:Any, will
@@ -1150,11 +1186,11 @@ class PydanticGenerator(OOCodeGenerator, LifecycleMixin):
         source_classes = [c for c in source_classes if c.class_uri != "linkml:Any"]
         source_classes = self.before_generate_classes(source_classes, sv)
         self.sorted_class_names = [self._get_class_python_name(c.name) for c in source_classes]
-        for cls in source_classes:
-            cls = self.before_generate_class(cls, sv)
-            result = self.generate_class(cls)
-            result = self.after_generate_class(result, sv)
-            class_results.append(result)
+        if self.processes > 1:
+            # compute the bases before the workers are forked, rather than once in each worker
+            _ = self.class_bases
+        class_results = build_elements(self._build_class, source_classes, self.processes)
+        for result in class_results:
             if result.imports is not None:
                 imports += result.imports
             if result.injected_classes is not None:
@@ -1391,6 +1427,13 @@ Available templates to override:
     default=False,
     help="Use empty list for optional multivalued defaults instead of None (default behavior).",
 )
+@click.option(
+    "--processes",
+    "-j",
+    default=1,
+    show_default=True,
+    help="Number of processes to build classes in",
+)
 @click.version_option(__version__, "-V", "--version")
 @click.command(name="pydantic")
 def cli(
@@ -2,6 +2,7 @@ import keyword
 import logging
 import os
 import re
+import sys
 from collections.abc import Callable, Iterator
 from copy import copy
 from dataclasses import dataclass
@@ -16,7 +17,8 @@ from linkml._version import __version__
 from linkml.generators.pydanticgen.template import Import, Imports, ObjectImport
 from linkml.generators.python.python_ifabsent_processor import PythonIfAbsentProcessor
 from linkml.utils.deprecation import deprecated_fields, deprecation_warning
-from linkml.utils.generator import Generator, shared_arguments
+from linkml.utils.generator import Generator, SchemaContext, shared_arguments
+from linkml.utils.modulecache import module_cache, module_key
 from linkml_runtime import SchemaView
 from linkml_runtime.linkml_model import linkml_files
 from linkml_runtime.linkml_model.meta import (
@@ -73,11 +75,17 @@ class PythonGenerator(Generator):
     def __post_init__(self) -> None:
         if isinstance(self.schema, Path):
             self.schema = str(self.schema)
-        self.sourcefile = self.schema
-        # Forward importmap so URI-style imports (e.g. ``ex:schema/core`` backed
-        # by ``--importmap``) resolve to local files instead of falling through
-        # to HTTP on the first lazy access via ``PythonIfAbsentProcessor``.
-        self.schemaview = SchemaView(self.schema, base_dir=self.base_dir, importmap=self.importmap)
+        if isinstance(self.schema, SchemaContext):
+            self.sourcefile = self.schema.source
+            self.schemaview = self.schema.copy_schemaview()
+        else:
+            self.sourcefile = self.schema
+            # Forward importmap so URI-style imports (e.g. ``ex:schema/core`` backed
+            # by ``--importmap``) resolve to local files instead of falling through
+            # to HTTP on the first lazy access via ``PythonIfAbsentProcessor``.
+            self.schemaview = SchemaView(self.schema, base_dir=self.base_dir, importmap=self.importmap)
+            # Read the imports before the SchemaLoader does, so that it can copy them
+            self.schemaview.imports_closure(inject_metadata=False)
         self.ifabsent_processor = PythonIfAbsentProcessor(self.schemaview)
         super().__post_init__()
         if self.format is None:
@@ -87,6 +95,9 @@ class PythonGenerator(Generator):
         if not self.schema.source_file and isinstance(self.sourcefile, str) and "\n" not in self.sourcefile:
             self.schema.source_file = os.path.basename(self.sourcefile)
 
+    def _schemaloader_schemaview(self) -> SchemaView | None:
+        return None if isinstance(self.schema, SchemaContext) else self.schemaview
+
     def slot_name(self, name: str) -> str:
         """Python-safe slot identifier. Appends a trailing underscore (PEP 8)
         if the underscored name collides with a Python reserved keyword, so
@@ -102,15 +113,24 @@ class PythonGenerator(Generator):
     def compile_module(self, **kwargs) -> ModuleType:
         """
         Compiles generated python code to a module
+
+        The module is shared with every generator of this class with the same options and schema,
+        see :mod:`linkml.utils.modulecache`
         :return:
         """
+        key = module_key(self, **kwargs)
+        module = module_cache.get(key)
+        if module is not None:
+            return module
         pycode = self.serialize(**kwargs)
         try:
-            return compile_python(pycode)
+            module = compile_python(pycode)
         except NameError as e:
             logger.error(f"Code:\n{pycode}")
             logger.error(f"Error compiling generated python code: {e}")
             raise e
+        module_cache.put(key, module, pycode)
+        return module
 
     def visit_schema(self, **kwargs) -> None:
         # Add explicitly declared prefixes
@@ -1622,7 +1642,8 @@ def cli(
     if validate:
         mod = gen.compile_module()
         logger.info(f"Module {mod} compiled successfully")
-    print(gen.serialize(**args))
+    gen.serialize_to(sys.stdout, **args)
+    print()
 
 
 if __name__ == "__main__":
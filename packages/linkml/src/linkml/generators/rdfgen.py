@@ -6,6 +6,7 @@ Generate a JSON LD representation of the model
 """
 
 import os
+import sys
 import urllib.parse as urlparse
 from copy import deepcopy
 from dataclasses import dataclass
@@ -91,7 +92,8 @@ class RDFGenerator(Generator):
 @click.version_option(__version__, "-V", "--version")
 def cli(yamlfile, **kwargs):
     """Generate an RDF representation of a LinkML model"""
-    print(RDFGenerator(yamlfile, **kwargs).serialize(**kwargs))
+    RDFGenerator(yamlfile, **kwargs).serialize_to(sys.stdout, **kwargs)
+    print()
 
 
 if __name__ == "__main__":
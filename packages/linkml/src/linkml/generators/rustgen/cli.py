@@ -55,6 +55,13 @@ from linkml.utils.generator import shared_arguments
     type=click.Path(dir_okay=True),
     help="Output directory (crate mode) or .rs file (file mode)",
 )
+@click.option(
+    "-j",
+    "--processes",
+    default=1,
+    show_default=True,
+    help="Number of processes to build classes in",
+)
 @click.version_option(__version__, "-V", "--version")
 @click.command(name="rust")
 def cli(
@@ -6,6 +6,7 @@ from typing import Literal, overload
 from jinja2 import Environment
 
 from linkml.generators.common.lifecycle import LifecycleMixin
+from linkml.generators.common.pipeline import build_elements
 from linkml.generators.common.subproperty import is_uri_range
 from linkml.generators.common.template import ObjectImport
 from linkml.generators.common.type_designators import get_accepted_type_designator_values
@@ -407,6 +408,13 @@ class RustGenerator(Generator, LifecycleMixin):
 
     expand_subproperty_of: bool = True
     """If True, expand subproperty_of to Rust enums with slot descendants"""
+    processes: int = 1
+    """
+    Number of processes to build classes in.
+
+    Classes are built in forked worker processes when this is more than 1,
+    see :func:`~linkml.generators.common.pipeline.build_elements`
+    """
 
     _environment: Environment | None = None
     _subproperty_enums: dict = None  # Cache for generated subproperty enums
@@ -557,6 +565,15 @@ class RustGenerator(Generator, LifecycleMixin):
         res = self.after_generate_class(res, self.schemaview)
         return res
 
+    def _build_class(self, cls: ClassDefinition) -> tuple[ClassResult, dict]:
+        """
+        Generate a class, along with the subproperty enums first generated for it,
+        since a class generated in a worker process cannot add them to :attr:`._subproperty_enums` itself
+        """
+        known = set(self._subproperty_enums)
+        res = self.generate_class(cls)
+        return res, {key: enum for key, enum in self._subproperty_enums.items() if key not in known}
+
     def gen_struct_or_subtype_enum(self, cls: ClassDefinition) -> RustStructOrSubtypeEnum | None:
         descendants = class_real_descendants(self.schemaview, cls.name)
         td = self.schemaview.get_type_designator_slot(cls.name)
@@ -904,7 +921,11 @@ class RustGenerator(Generator, LifecycleMixin):
                 break
 
         classes = self.before_generate_classes(classes, sv)
-        classes = [self.generate_class(c) for c in classes]
+        built = build_elements(self._build_class, classes, self.processes)
+        for _, subproperty_enums in built:
+            for key, enum in subproperty_enums.items():
+                self._subproperty_enums.setdefault(key, enum)
+        classes = [res for res, _ in built]
         classes = self.after_generate_classes(classes, sv)
 
         # Collect subproperty enums generated during class processing
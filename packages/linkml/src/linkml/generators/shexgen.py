@@ -1,6 +1,7 @@
 """Generate ShEx definition of a model"""
 
 import os
+import sys
 import urllib.parse as urlparse
 from dataclasses import dataclass, field
 
@@ -261,7 +262,8 @@ class ShExGenerator(Generator):
 @click.version_option(__version__, "-V", "--version")
 def cli(yamlfile, **args):
     """Generate a ShEx Schema for a  LinkML model"""
-    print(ShExGenerator(yamlfile, **args).serialize(**args))
+    ShExGenerator(yamlfile, **args).serialize_to(sys.stdout, **args)
+    print()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import os
+import sys
 from dataclasses import dataclass
 from datetime import date
 
@@ -185,7 +186,8 @@ class SSSOMGenerator(Generator):
 @click.version_option(__version__, "-V", "--version")
 def cli(yamlfile, **kwargs):
     """Generate SSSOM TSV to represent a LinkML model"""
-    print(SSSOMGenerator(yamlfile, **kwargs).serialize(**kwargs))
+    SSSOMGenerator(yamlfile, **kwargs).serialize_to(sys.stdout, **kwargs)
+    print()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """Generate Summary Spreadsheets"""
 
 import os
+import sys
 from csv import DictWriter
 from dataclasses import dataclass
 from io import StringIO
@@ -89,7 +90,8 @@ class SummaryGenerator(Generator):
 @click.command(name="summary")
 def cli(yamlfile, **args):
     """Generate TSV summary files for viewing in Excel and the like"""
-    print(SummaryGenerator(yamlfile, **args).serialize(**args))
+    SummaryGenerator(yamlfile, **args).serialize_to(sys.stdout, **args)
+    print()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 
 import click
@@ -162,7 +163,8 @@ class TerminusdbGenerator(Generator):
 @click.command(name="terminusdb")
 def cli(yamlfile, **args):
     """Generate TerminusDB JSON-LD schema from a LinkML model"""
-    print(TerminusdbGenerator(yamlfile, **args).serialize(**args))
+    TerminusdbGenerator(yamlfile, **args).serialize_to(sys.stdout, **args)
+    print()
 
 
 if __name__ == "__main__":
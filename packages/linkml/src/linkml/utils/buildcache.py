@@ -0,0 +1,115 @@
+"""
+Build cache for generated artefacts
+
+A :class:`BuildCache` records, for each artefact written to a directory, a hash of everything that went into
+generating it: the schema and every local file it imports, the generator class and the linkml version, and the
+generator options.  An artefact whose hash has not changed since it was last written does not need regenerating.
+
+Imports that are not local files (``linkml:types``, URLs, CURIEs resolved through an importmap) are hashed by name
+only.  Those that ship with linkml are covered by the linkml version.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from linkml._version import __version__
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = ".linkml-build-cache.json"
+
+
+def schema_files(schema_path: str | Path) -> list[Path]:
+    """
+    The schema file and the local files it imports, directly or indirectly
+
+    :param schema_path: path to the schema
+    :return: paths, in the order they are first imported
+    """
+    files = []
+    pending = [Path(schema_path).resolve()]
+    while pending:
+        path = pending.pop()
+        if path in files:
+            continue
+        files.append(path)
+        with open(path, encoding="utf-8") as stream:
+            schema = yaml.load(stream, Loader=SafeLoader) or {}
+        for imp in reversed(schema.get("imports") or []):
+            imp_path = path.parent / f"{imp}.yaml"
+            if imp_path.is_file():
+                pending.append(imp_path.resolve())
+    return files
+
+
+def build_key(files: list[Path], generator: type, *options: Any) -> str:
+    """
+    Hash of everything that goes into generating an artefact
+
+    :param files: the :func:`schema_files` of the schema
+    :param generator: generator class
+    :param options: generator options, which must be JSON serializable or have a stable ``str``
+    :return: hex digest
+    """
+    h = hashlib.sha256()
+    h.update(f"{generator.__module__}.{generator.__qualname__} {generator.generatorversion} {__version__}".encode())
+    h.update(json.dumps(options, sort_keys=True, default=str).encode())
+    for path in files:
+        h.update(str(path.relative_to(files[0].parent) if path.is_relative_to(files[0].parent) else path).encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class BuildCache:
+    """
+    The build keys of the artefacts in a directory, kept in a JSON file in that directory
+    """
+
+    def __init__(self, directory: str | Path, force: bool = False) -> None:
+        """
+        :param directory: directory the artefacts are written to
+        :param force: treat every artefact as out of date
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / CACHE_FILE_NAME
+        self.keys: dict[str, str] = {}
+        if self.path.exists():
+            try:
+                self.keys = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                logger.warning(f"Ignoring unreadable build cache {self.path}")
+        self.force = force
+        self.hits = 0
+        self.misses = 0
+
+    def _name(self, artefact: Path) -> str:
+        return Path(artefact).resolve().relative_to(self.directory.resolve()).as_posix()
+
+    def is_current(self, artefact: Path, key: str) -> bool:
+        """
+        True if the artefact exists and was generated with this key.  Counts a hit or a miss.
+        """
+        current = not self.force and Path(artefact).exists() and self.keys.get(self._name(artefact)) == key
+        if current:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return current
+
+    def record(self, artefact: Path, key: str) -> None:
+        """Record the key an artefact was generated with"""
+        self.keys[self._name(artefact)] = key
+
+    def save(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as stream:
+            json.dump(self.keys, stream, indent=2, sort_keys=True)
@@ -20,9 +20,10 @@ import logging
 import os
 import re
 import sys
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping
+from copy import deepcopy
 from dataclasses import dataclass, field
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import ClassVar, TextIO, Union, cast
 
@@ -78,6 +79,58 @@ def _resolved_metamodel(mergeimports):
     return metamodel
 
 
+@dataclass
+class SchemaContext:
+    """
+    A schema loaded once and shared by several generators
+
+    Pass a context in place of a schema to skip reading and resolving the schema in each generator.
+    SchemaLoader-based generators share the resolved :attr:`loader`, which they do not modify.  It is resolved from
+    copies of the schemas read into :attr:`schemaview`, so no file is read twice.
+    SchemaView-based generators may modify their view, so each gets its own :meth:`copy_schemaview`
+    of the schemas read here.
+    """
+
+    source: str
+    """File name or URI of the schema"""
+
+    useuris: bool | None = None
+    mergeimports: bool | None = True
+    metadata: bool = True
+    base_dir: str | None = None
+    importmap: str | Mapping[str, str] | None = None
+
+    @cached_property
+    def loader(self) -> SchemaLoader:
+        """Resolved SchemaLoader, loaded the first time it is asked for"""
+        loader = SchemaLoader(
+            self.source,
+            self.base_dir,
+            useuris=self.useuris,
+            importmap=self.importmap,
+            mergeimports=self.mergeimports,
+            metadata=self.metadata,
+            schemaview=self.schemaview,
+        )
+        loader.resolve()
+        return loader
+
+    @cached_property
+    def schemaview(self) -> SchemaView:
+        """SchemaView with all imports read, loaded the first time it is asked for.  Do not modify."""
+        sv = SchemaView(self.source, importmap=self.importmap, base_dir=self.base_dir)
+        # Leave the schemas as read, so that the loader can copy them
+        sv.imports_closure(inject_metadata=False)
+        return sv
+
+    def copy_schemaview(self) -> SchemaView:
+        """A SchemaView of copies of the schemas in :attr:`schemaview`, which the caller may modify"""
+        schema_map = deepcopy(self.schemaview.schema_map)
+        sv = SchemaView(schema_map[self.schemaview.schema.name], importmap=self.importmap, base_dir=self.base_dir)
+        sv.schema_map = schema_map
+        return sv
+
+
 @dataclass
 class Generator(metaclass=abc.ABCMeta):
     """
@@ -86,9 +139,9 @@ class Generator(metaclass=abc.ABCMeta):
     For usage `Generator Docs <https://linkml.io/linkml/generators/>`_
     """
 
-    schema: Union[str, TextIO, SchemaDefinition, "Generator", Path]
+    schema: Union[str, TextIO, SchemaDefinition, "Generator", Path, SchemaContext]
     """metamodel compliant schema.  Can be URI, file name, actual schema, another generator, an
-        open file or a pre-parsed schema"""
+        open file, a pre-parsed schema or a shared SchemaContext"""
 
     # ClassVars
     generatorname: ClassVar[str] = None
@@ -207,8 +260,11 @@ class Generator(metaclass=abc.ABCMeta):
         if self.uses_schemaloader:
             self._initialize_using_schemaloader(schema)
         else:
-            self.logger.info(f"Using SchemaView with im={self.importmap} // base_dir={self.base_dir}")
-            self.schemaview = SchemaView(schema, importmap=self.importmap, base_dir=self.base_dir)
+            if isinstance(schema, SchemaContext):
+                self.schemaview = schema.copy_schemaview()
+            else:
+                self.logger.info(f"Using SchemaView with im={self.importmap} // base_dir={self.base_dir}")
+                self.schemaview = SchemaView(schema, importmap=self.importmap, base_dir=self.base_dir)
             if self.include:
                 if isinstance(self.include, str | Path):
                     self.include = SchemaView(self.include, importmap=self.importmap, base_dir=self.base_dir).schema
@@ -221,7 +277,7 @@ class Generator(metaclass=abc.ABCMeta):
 
         self._init_namespaces()
 
-    def _initialize_using_schemaloader(self, schema: Union[str, TextIO, SchemaDefinition, "Generator"]):
+    def _initialize_using_schemaloader(self, schema: Union[str, TextIO, SchemaDefinition, "Generator", SchemaContext]):
         # currently generators are very liberal in what they accept, including
         # other generators.
         # See https://github.com/linkml/linkml/issues/923 for discussion on how
@@ -240,23 +296,27 @@ class Generator(metaclass=abc.ABCMeta):
             self.schema_defaults = gen.schema_defaults
             self.logger = gen.logger
         else:
-            if isinstance(schema, SchemaDefinition):
-                # schemaloader based methods require schemas to have been created via SchemaLoader,
-                # which prepopulates some fields (e.g. definition_url). If the schema has not been processed through the
-                # loader, then roundtrip
-                schema = schema._as_dict
-            loader = SchemaLoader(
-                schema,
-                self.base_dir,
-                useuris=self.useuris,
-                importmap=self.importmap,
-                logger=self.logger,
-                mergeimports=self.mergeimports,
-                metadata=self.metadata,
-                source_file_date=self.source_file_date,
-                source_file_size=self.source_file_size,
-            )
-            loader.resolve()
+            if isinstance(schema, SchemaContext):
+                loader = schema.loader
+            else:
+                if isinstance(schema, SchemaDefinition):
+                    # schemaloader based methods require schemas to have been created via SchemaLoader,
+                    # which prepopulates some fields (e.g. definition_url). If the schema has not been processed
+                    # through the loader, then roundtrip
+                    schema = schema._as_dict
+                loader = SchemaLoader(
+                    schema,
+                    self.base_dir,
+                    useuris=self.useuris,
+                    importmap=self.importmap,
+                    logger=self.logger,
+                    mergeimports=self.mergeimports,
+                    metadata=self.metadata,
+                    source_file_date=self.source_file_date,
+                    source_file_size=self.source_file_size,
+                    schemaview=self._schemaloader_schemaview(),
+                )
+                loader.resolve()
             self.schema = loader.schema
             self.synopsis = loader.synopsis
             self.loaded = loader.loaded
@@ -268,6 +328,14 @@ class Generator(metaclass=abc.ABCMeta):
             self.schema_location = loader.schema_location
             self.schema_defaults = loader.schema_defaults
 
+    def _schemaloader_schemaview(self) -> SchemaView | None:
+        """
+        A SchemaView that has read the schema files, and not modified them, for the SchemaLoader to copy them from
+
+        Override in generators that read the schema into a SchemaView of their own before it is loaded.
+        """
+        return None
+
     def _init_namespaces(self):
         if self.namespaces is None:
             self.namespaces = Namespaces()
@@ -289,8 +357,45 @@ class Generator(metaclass=abc.ABCMeta):
         :param kwargs: Generator specific parameters
         :return: Generated output
         """
-        out = ""
+        out = "".join(self._visit_all(**kwargs)).rstrip()
+        if not (out.count("\n") == 0 and out.startswith("http")):
+            out += "\n"
+        return out
+
+    def serialize_to(self, fp: TextIO, **kwargs) -> None:
+        """
+        Write the output of :meth:`serialize` to an open file, such as ``sys.stdout``
+
+        Output from the visitor methods is written as it is generated, rather than collected into one string first.
+        Generators that override :meth:`serialize` have their output written once it is complete.
 
+        :param fp: file to write to
+        :param kwargs: Generator specific parameters
+        """
+        if type(self).serialize is not Generator.serialize:
+            fp.write(self.serialize(**kwargs))
+            return
+        # Trailing whitespace is held back until more output follows, so that the end of the output can be stripped
+        # as serialize does
+        head = ""
+        multiline = False
+        pending = ""
+        for sub_out in self._visit_all(**kwargs):
+            text = pending + sub_out
+            stripped = text.rstrip()
+            if stripped:
+                fp.write(stripped)
+                if len(head) < 4:
+                    head += stripped[:4]
+                multiline = multiline or "\n" in stripped
+                pending = text[len(stripped) :]
+            else:
+                pending = text
+        if multiline or not head.startswith("http"):
+            fp.write("\n")
+
+    def _visit_all(self, **kwargs) -> Iterator[str]:
+        """The output of each visit to the schema and its elements, in order"""
         deprecation_map = {"emit_metadata": "metadata", "head": "metadata"}
         for flag in deprecation_map:
             if flag in kwargs:
@@ -304,7 +409,7 @@ class Generator(metaclass=abc.ABCMeta):
         # See https://github.com/linkml/linkml/issues/923
         sub_out = self.visit_schema(**kwargs)
         if sub_out is not None:
-            out += sub_out
+            yield sub_out
         for sn, ss in (
             sorted(self.schema.subsets.items(), key=lambda s: s[0].lower())
             if self.visits_are_sorted
@@ -312,7 +417,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_subset(ss)
             if sub_out is not None:
-                out += sub_out
+                yield sub_out
         for tn, typ in (
             sorted(self.schema.types.items(), key=lambda s: s[0].lower())
             if self.visits_are_sorted
@@ -320,7 +425,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_type(typ)
             if sub_out is not None:
-                out += sub_out
+                yield sub_out
         for enum in (
             sorted(self.schema.enums.values(), key=lambda e: e.name.lower())
             if self.visits_are_sorted
@@ -328,7 +433,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_enum(enum)
             if sub_out is not None:
-                out += sub_out
+                yield sub_out
         for sn, slot in (
             sorted(self.schema.slots.items(), key=lambda c: c[0].lower())
             if self.visits_are_sorted
@@ -336,7 +441,7 @@ class Generator(metaclass=abc.ABCMeta):
         ):
             sub_out = self.visit_slot(self.aliased_slot_name(slot), slot)
             if sub_out is not None:
-                out += sub_out
+                yield sub_out
         for cls in (
             sorted(self.schema.classes.values(), key=lambda c: c.name.lower())
             if self.visits_are_sorted
@@ -345,21 +450,17 @@ class Generator(metaclass=abc.ABCMeta):
             cls_out = self.visit_class(cls)
             if cls_out:
                 if isinstance(cls_out, str):
-                    out += cls_out
+                    yield cls_out
                 for slot in self.all_slots(cls) if self.visit_all_class_slots else self.own_slots(cls):
                     sub_out = self.visit_class_slot(cls, self.aliased_slot_name(slot), slot)
                     if sub_out is not None:
-                        out += sub_out
+                        yield sub_out
                 sub_out = self.end_class(cls)
                 if sub_out is not None:
-                    out += sub_out
+                    yield sub_out
         sub_out = self.end_schema(**kwargs)
         if sub_out is not None:
-            out += sub_out
-        out = out.rstrip()
-        if not (out.count("\n") == 0 and out.startswith("http")):
-            out += "\n"
-        return out
+            yield sub_out
 
     def visit_schema(self, **kwargs) -> str | None:
         """Visited once at the beginning of generation
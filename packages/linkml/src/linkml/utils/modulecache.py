@@ -0,0 +1,172 @@
+"""
+Cache of the python modules compiled from generated code
+
+Generating the python or pydantic code for a schema takes far longer than loading the schema, and the validator,
+converter, SQL store, example runner and SHACL plugin each compile a module for the schema they are given.  The
+:data:`module_cache` shared by :meth:`PythonGenerator.compile_module` and :meth:`PydanticGenerator.compile_module`
+keeps each compiled module under a :func:`module_key`: a hash of the generator class, the linkml version, the
+generator options and the content of the schema and its imports.  A generator whose key is already in the cache
+returns the cached module without generating any code.
+
+The most recently used modules are kept in memory.  If the ``LINKML_MODULE_CACHE_DIR`` environment variable names a
+directory, the generated code is also written there, one ``.py`` file per key, and later processes load it from
+there instead of generating it again.  Those files are imported like any other, so python caches their bytecode.
+The files of a development install of linkml are not part of the key: clear that directory after changing them.
+"""
+
+import dataclasses
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from linkml._version import __version__
+from linkml_runtime.dumpers import json_dumper
+
+if TYPE_CHECKING:
+    from linkml.utils.generator import Generator
+
+logger = logging.getLogger(__name__)
+
+MODULE_CACHE_DIR_ENV = "LINKML_MODULE_CACHE_DIR"
+
+# Generator fields that do not change the generated code, or whose effect is part of the schema content
+_NON_OPTION_FIELDS = frozenset(
+    [
+        "schema",
+        "schemaview",
+        "include",
+        "base_dir",
+        "importmap",
+        "namespaces",
+        "metamodel",
+        "emit_prefixes",
+        "source_file_date",
+        "source_file_size",
+        "logger",
+        "log_level",
+        "verbose",
+        "stacktrace",
+        "output",
+        "processes",
+    ]
+)
+
+# Schema metadata recorded when the schema is loaded, rather than part of its content
+_LOAD_TIME_SLOTS = ["generation_date", "source_file_date", "source_file_size"]
+
+
+def module_key(generator: "Generator", **kwargs: Any) -> str:
+    """
+    Hash of everything that goes into the code a generator generates
+
+    :param generator: generator whose schema has been loaded, but which has not yet generated anything
+    :param kwargs: arguments that will be passed to ``serialize``
+    :return: hex digest
+    """
+    gen_cls = type(generator)
+    options = {
+        f.name: getattr(generator, f.name)
+        for f in dataclasses.fields(generator)
+        if f.init and f.name not in _NON_OPTION_FIELDS and not f.name.startswith("_")
+    }
+    h = hashlib.sha256()
+    h.update(f"{gen_cls.__module__}.{gen_cls.__qualname__} {gen_cls.generatorversion} {__version__}".encode())
+    h.update(json.dumps([options, kwargs], sort_keys=True, default=str).encode())
+    if generator.uses_schemaloader:
+        # SchemaLoader merges the imports into the schema
+        schemas = [generator.schema]
+    else:
+        schemas = generator.schemaview.all_schema()
+    for schema in schemas:
+        content = json_dumper.to_dict(schema)
+        for slot in _LOAD_TIME_SLOTS:
+            content.pop(slot, None)
+        h.update(json.dumps(content, default=str).encode())
+    return h.hexdigest()
+
+
+class ModuleCache:
+    """
+    Compiled modules, by :func:`module_key`, kept in memory and optionally as python files in a directory
+    """
+
+    def __init__(self, directory: str | Path | None = None, maxsize: int = 32) -> None:
+        """
+        :param directory: directory to keep the generated code in, so that other processes can use it
+        :param maxsize: number of modules kept in memory
+        """
+        self.directory = Path(directory) if directory else None
+        self.maxsize = maxsize
+        self.modules: OrderedDict[str, ModuleType] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"linkml_{key}.py"
+
+    def get(self, key: str, module_name: str = "test") -> ModuleType | None:
+        """
+        The module compiled under a key, if it is in memory or in the cache directory
+
+        :param key: :func:`module_key` of the generator
+        :param module_name: name to give a module loaded from the cache directory
+        :return: the module, registered in ``sys.modules`` under its name, or None
+        """
+        module = self.modules.get(key)
+        if module is None and self.directory is not None and self._path(key).exists():
+            spec = importlib.util.spec_from_file_location(module_name, self._path(key))
+            module = importlib.util.module_from_spec(spec)
+            # Registered before it is run, as compile_python does, so that its classes can be resolved by module
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+            self._remember(key, module)
+        if module is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.modules.move_to_end(key)
+        sys.modules[module.__name__] = module
+        return module
+
+    def put(self, key: str, module: ModuleType, source: str) -> None:
+        """
+        Keep a module compiled under a key, and write its source to the cache directory
+
+        :param key: :func:`module_key` of the generator
+        :param module: module compiled from the source
+        :param source: the generated code
+        """
+        self._remember(key, module)
+        if self.directory is not None:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                # Written under a temporary name and renamed, so other processes never see a partial file
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+                ) as stream:
+                    stream.write(source)
+                os.replace(stream.name, self._path(key))
+            except OSError as e:
+                logger.warning(f"Could not write generated code to the module cache {self.directory}: {e}")
+
+    def _remember(self, key: str, module: ModuleType) -> None:
+        self.modules[key] = module
+        self.modules.move_to_end(key)
+        while len(self.modules) > self.maxsize:
+            self.modules.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget the modules kept in memory.  Files in the cache directory are kept."""
+        self.modules.clear()
+
+
+module_cache = ModuleCache(os.environ.get(MODULE_CACHE_DIR_ENV))
+"""The cache shared by the generators' ``compile_module``"""
@@ -1,4 +1,6 @@
 import copy
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import TextIO
@@ -64,9 +66,6 @@ def load_raw_schema(
     :returns: Un-processed Schema Definition object
     """
 
-    def _name_from_url(url) -> str:
-        return urlparse(url).path.rsplit("/", 1)[-1].rsplit(".", 1)[0]
-
     if emit_metadata is not None:
         deprecation_warning("metadata-flag")
         metadata = emit_metadata
@@ -101,6 +100,33 @@ def load_raw_schema(
         schema = copy.deepcopy(data)
     else:
         raise ValueError("Unrecognized input to raw loader")
+    return _complete_raw_schema(schema, schema_metadata, metadata)
+
+
+def copy_parsed_schema(parsed: SchemaDefinition, source_file: str, metadata: bool | None = True) -> SchemaDefinition:
+    """Load a schema file from a SchemaDefinition it has already been parsed into, such as one in a SchemaView
+
+    Gives the same raw schema as ``load_raw_schema(source_file)`` without reading the file again.
+
+    :param parsed: the schema as read from source_file.  It is copied, not modified
+    :param source_file: absolute path of the schema file
+    :param metadata: False suppresses the source-file metadata, as in :func:`load_raw_schema`
+    :returns: Un-processed Schema Definition object
+    """
+    schema_metadata = FileInfo()
+    fstat = os.stat(source_file)
+    schema_metadata.source_file = source_file
+    schema_metadata.source_file_date = time.ctime(fstat.st_mtime)
+    schema_metadata.source_file_size = fstat.st_size
+    schema_metadata.base_path = os.path.dirname(source_file)
+    return _complete_raw_schema(copy.deepcopy(parsed), schema_metadata, metadata)
+
+
+def _complete_raw_schema(
+    schema: SchemaDefinition | None, schema_metadata: FileInfo, metadata: bool | None
+) -> SchemaDefinition:
+    def _name_from_url(url) -> str:
+        return urlparse(url).path.rsplit("/", 1)[-1].rsplit(".", 1)[0]
 
     if schema is None:
         raise ValueError("Empty schema - cannot process")
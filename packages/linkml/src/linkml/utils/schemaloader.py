@@ -8,12 +8,14 @@ from pathlib import Path
 from typing import Any, TextIO, cast
 from urllib.parse import urlparse
 
+from hbreader import HBType, detect_type
 from jsonasobj2 import values
 
 from linkml.utils.deprecation import deprecation_warning
 from linkml.utils.mergeutils import merge_classes, merge_schemas, merge_slots, slot_usage_name
-from linkml.utils.rawloader import load_raw_schema
+from linkml.utils.rawloader import copy_parsed_schema, load_raw_schema
 from linkml.utils.schemasynopsis import SchemaSynopsis
+from linkml_runtime import SchemaView
 from linkml_runtime.linkml_model.meta import (
     ClassDefinition,
     ClassDefinitionName,
@@ -49,6 +51,7 @@ class SchemaLoader:
         emit_metadata: bool | None = None,
         source_file_date: str | None = None,
         source_file_size: int | None = None,
+        schemaview: SchemaView | None = None,
     ) -> None:
         """Constructor - load and process a YAML or pre-processed schema
 
@@ -64,10 +67,20 @@ class SchemaLoader:
         :param emit_metadata: True means include source file, size and date
         :param source_file_date: modification of source file
         :param source_file_size: size of source file
+        :param schemaview: SchemaView that has already read the schema.  Files it has read are copied from it
+            rather than read again.  It is not modified.
         """
         self.logger = logger if logger is not None else lgr
+        # Schemas already parsed, by absolute file name
+        self.parsed_schemas: dict[str, SchemaDefinition] = {}
+        if schemaview is not None:
+            for parsed in schemaview.schema_map.values():
+                if parsed.source_file:
+                    self.parsed_schemas[os.path.abspath(parsed.source_file)] = parsed
         if isinstance(data, SchemaDefinition):
             self.schema = data
+        elif source_file_date is None and source_file_size is None:
+            self.schema = self._load_raw_schema(data, base_dir, merge_modules=mergeimports)
         else:
             self.schema = load_raw_schema(
                 data,
@@ -98,6 +111,18 @@ class SchemaLoader:
             )
             self.metadata = emit_metadata
 
+    def _load_raw_schema(
+        self, data: str | TextIO | dict | Path, base_dir: str | None, **kwargs: Any
+    ) -> SchemaDefinition:
+        """load_raw_schema, copying the schema from ``parsed_schemas`` if the file has already been read"""
+        if isinstance(data, Path):
+            data = str(data)
+        if self.parsed_schemas and isinstance(data, str) and detect_type(data, base_dir) is HBType.FILENAME:
+            fname = os.path.abspath(data if os.path.isabs(data) or not base_dir else os.path.join(base_dir, data))
+            if fname in self.parsed_schemas:
+                return copy_parsed_schema(self.parsed_schemas[fname], fname, metadata=kwargs.get("metadata", True))
+        return load_raw_schema(data, base_dir=base_dir, **kwargs)
+
     def _resolve_string_import(self, mapped: str) -> "str | dict[str, Any]":
         """Expand CURIEs and re-apply the importmap to a string import target.
 
@@ -154,9 +179,9 @@ class SchemaLoader:
                 )
                 loaded_schema = (str(imp), import_schemadefinition.version)
             else:
-                import_schemadefinition = load_raw_schema(
+                import_schemadefinition = self._load_raw_schema(
                     mapped + ".yaml",
-                    base_dir=os.path.dirname(self.schema.source_file) if self.schema.source_file else self.base_dir,
+                    os.path.dirname(self.schema.source_file) if self.schema.source_file else self.base_dir,
                     merge_modules=self.merge_modules,
                     metadata=self.metadata,
                 )
@@ -22,3 +22,17 @@ class Loader(ABC):
         :rtype: Iterator[Any]
         """
         pass
+
+    def iter_instances_with_location(self) -> Iterator[tuple[Any, int | None]]:
+        """Lazily load data instances from the source along with their location
+
+        Loaders that can cheaply determine where an instance starts in the source
+        (e.g. a line number) should override this. The default implementation
+        reports no location.
+
+        :return: Iterator over ``(instance, line)`` tuples, where ``line`` is 1-based
+            or ``None`` if unknown
+        :rtype: Iterator[tuple[Any, int | None]]
+        """
+        for instance in self.iter_instances():
+            yield instance, None
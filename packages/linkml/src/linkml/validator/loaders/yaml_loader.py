@@ -2,13 +2,41 @@ from collections.abc import Iterator
 from typing import Any
 
 import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import SequenceEndEvent, SequenceStartEvent, StreamEndEvent
+from yaml.resolver import Resolver
 
 from linkml.validator.loaders.loader import Loader
 
+try:
+    from yaml import CParser
+
+    class _StreamingSafeLoader(CParser, Composer, SafeConstructor, Resolver):
+        """Safe loader backed by libyaml which can also compose individual nodes.
+
+        ``yaml.CSafeLoader`` composes whole documents in C and does not expose
+        ``compose_node``. Mixing in the pure-Python ``Composer`` on top of the C
+        event parser lets us build one node at a time while keeping the fast parser.
+        """
+
+        def __init__(self, stream) -> None:
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    _StreamingSafeLoader = yaml.SafeLoader
+
 
 class YamlLoader(Loader):
     """A loader for instances serialized as YAML
 
+    Documents are read event by event: when the root of a document is a sequence, each
+    element is constructed and yielded as soon as it has been parsed, so a large top-level
+    list is never materialized in memory as a whole. libyaml is used when available.
+
     :param source: Path to YAML source
     """
 
@@ -24,9 +52,37 @@ class YamlLoader(Loader):
         :return: Iterator over data instances
         :rtype: Iterator[Any]
         """
+        for instance, _ in self.iter_instances_with_location():
+            yield instance
+
+    def iter_instances_with_location(self) -> Iterator[tuple[Any, int | None]]:
+        """Lazily yield instances from YAML source along with the line they start on.
+
+        :return: Iterator over ``(instance, line)`` tuples, where ``line`` is 1-based
+        :rtype: Iterator[tuple[Any, int | None]]
+        """
         with open(self.source) as source_file:
-            for document in yaml.safe_load_all(source_file):
-                if isinstance(document, list):
-                    yield from document
-                else:
-                    yield document
+            loader = _StreamingSafeLoader(source_file)
+            try:
+                # StreamStartEvent
+                loader.get_event()
+                while not loader.check_event(StreamEndEvent):
+                    # DocumentStartEvent
+                    loader.get_event()
+                    if loader.check_event(SequenceStartEvent):
+                        loader.get_event()
+                        while not loader.check_event(SequenceEndEvent):
+                            yield self._construct(loader)
+                        loader.get_event()
+                    else:
+                        yield self._construct(loader)
+                    # DocumentEndEvent
+                    loader.get_event()
+                    loader.anchors = {}
+            finally:
+                loader.dispose()
+
+    @staticmethod
+    def _construct(loader) -> tuple[Any, int]:
+        node = loader.compose_node(None, None)
+        return loader.construct_document(node), node.start_mark.line + 1
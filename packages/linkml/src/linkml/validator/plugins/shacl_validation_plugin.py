@@ -4,7 +4,7 @@ from typing import Any
 
 import rdflib
 
-from linkml.generators import PythonGenerator, ShaclGenerator
+from linkml.generators import ShaclGenerator
 from linkml.validator.plugins.validation_plugin import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
 from linkml.validator.validation_context import ValidationContext
@@ -63,9 +63,7 @@ class ShaclValidationPlugin(ValidationPlugin):
 
         shacl_graph = self._shacl_graph(context)
         if isinstance(instance, dict):
-            pygen = PythonGenerator(context._schema)
-            mod = pygen.compile_module()
-            py_cls = getattr(mod, context._target_class)
+            py_cls = context.python_class()
             if self.raise_on_conversion_error:
                 instance = py_cls(**instance)
             else:
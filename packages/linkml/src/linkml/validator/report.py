@@ -31,6 +31,7 @@ class ValidationResult(BaseModel):
     message: str
     instance: Any | None = None
     instance_index: int | None = None
+    instance_line: int | None = None
     instantiates: str | None = None
     context: list[str] = []
 
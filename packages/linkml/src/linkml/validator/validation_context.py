@@ -6,7 +6,7 @@ from functools import lru_cache
 import jsonschema
 from jsonschema.protocols import Validator
 
-from linkml.generators import JsonSchemaGenerator, PydanticGenerator
+from linkml.generators import JsonSchemaGenerator, PydanticGenerator, PythonGenerator
 from linkml.generators.jsonschemagen import JsonSchema
 from linkml.utils.datautils import infer_root_class
 from linkml_runtime import SchemaView
@@ -147,6 +147,14 @@ class ValidationContext:
             extra_fields="forbid" if closed else "ignore" if closed is None else "allow",
         ).compile_module()
 
+    def python_class(self):
+        module = self._python_module()
+        return module.__dict__[self._target_class]
+
+    @lru_cache
+    def _python_module(self):
+        return PythonGenerator(self._schema).compile_module()
+
     def _get_target_class(self, target_class: str | None = None) -> str:
         if target_class is None:
             return infer_root_class(self._schema_view)
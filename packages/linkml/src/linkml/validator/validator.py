@@ -100,12 +100,14 @@ class Validator:
             plugin.pre_process(context)
 
         has_failure = False
-        for index, instance in enumerate(loader.iter_instances()):
+        for index, (instance, line) in enumerate(loader.iter_instances_with_location()):
             for plugin in self._validation_plugins:
                 for result in plugin.process(instance, context):
                     if result.severity == Severity.FATAL or (self.strict and result.severity == Severity.ERROR):
                         has_failure = True
                     result.instance_index = index
+                    if line is not None:
+                        result.instance_line = line
                     yield result
                     if has_failure:
                         break
@@ -1,11 +1,11 @@
 import io
-import json
 from abc import ABC, abstractmethod
+from typing import TextIO
 
 from json_flattener import GlobalConfig, flatten_to_csv
 from pydantic import BaseModel
 
-from linkml_runtime.dumpers.dumper_root import Dumper
+from linkml_runtime.dumpers.dumper_root import Dumper, _iter_collection
 from linkml_runtime.dumpers.json_dumper import JSONDumper
 from linkml_runtime.linkml_model.meta import SchemaDefinition, SlotDefinitionName
 from linkml_runtime.utils.boolean_utils import convert_booleans_for_output, get_boolean_config
@@ -14,6 +14,7 @@ from linkml_runtime.utils.list_utils import (
     check_data_for_delimiter,
     enhance_configmap_for_multivalued_primitives,
     get_list_config,
+    get_multivalued_primitive_slots,
     strip_whitespace_from_lists,
 )
 from linkml_runtime.utils.schemaview import SchemaView
@@ -26,9 +27,43 @@ class DelimitedFileDumper(Dumper, ABC):
     def delimiter(self):
         pass
 
-    def dumps(
+    def dump(self, element: BaseModel | YAMLRoot, to_file: str, **kwargs) -> None:
+        """
+        Write element to to_file as CSV/TSV, one row at a time
+
+        :param element: LinkML object to be dumped
+        :param to_file: file to dump to
+        :param kwargs: arguments of :meth:`dumps`
+        """
+        with open(to_file, "w", encoding="UTF-8") as output_file:
+            self.dump_to_stream(element, output_file, **kwargs)
+
+    def dumps(self, element: BaseModel | YAMLRoot, **kwargs) -> str:
+        """Return element formatted as CSV lines
+
+        Args:
+            element: The element to dump
+            index_slot: The slot that indexes the top-level objects
+            schema: The schema definition
+            schemaview: The schema view
+            list_wrapper: Override wrapper style for lists (square, curly, paren, none)
+            list_delimiter: Override delimiter character between list items
+            list_strip_whitespace: Override whether to strip whitespace around delimiters
+            refuse_delimiter_in_data: Override whether to raise on delimiter-in-data conflicts
+            boolean_output: Output format for booleans (true, yes, 1, on, etc.)
+            **kwargs: Additional arguments passed to flatten_to_csv
+
+        Returns:
+            CSV/TSV formatted string
+        """
+        output = io.StringIO()
+        self.dump_to_stream(element, output, **kwargs)
+        return output.getvalue()
+
+    def dump_to_stream(
         self,
         element: BaseModel | YAMLRoot,
+        output: TextIO,
         index_slot: SlotDefinitionName = None,
         schema: SchemaDefinition = None,
         schemaview: SchemaView | None = None,
@@ -38,11 +73,16 @@ class DelimitedFileDumper(Dumper, ABC):
         refuse_delimiter_in_data: bool = None,
         boolean_output: str = None,
         **kwargs,
-    ) -> str:
-        """Return element formatted as CSV lines
+    ) -> None:
+        """Write element to an open text stream as CSV/TSV lines
+
+        The members of ``index_slot`` are converted and transformed one object at a
+        time, in a single walk of the collection, and then flattened and written by
+        json_flattener, which needs all rows to know the columns of the header.
 
         Args:
             element: The element to dump
+            output: Text stream to write to
             index_slot: The slot that indexes the top-level objects
             schema: The schema definition
             schemaview: The schema view
@@ -52,13 +92,7 @@ class DelimitedFileDumper(Dumper, ABC):
             refuse_delimiter_in_data: Override whether to raise on delimiter-in-data conflicts
             boolean_output: Output format for booleans (true, yes, 1, on, etc.)
             **kwargs: Additional arguments passed to flatten_to_csv
-
-        Returns:
-            CSV/TSV formatted string
         """
-        json_dumper = JSONDumper()
-        element_j = json.loads(json_dumper.dumps(element))
-        objs = element_j[index_slot]
         if schemaview is None:
             schemaview = SchemaView(schema)
 
@@ -69,16 +103,12 @@ class DelimitedFileDumper(Dumper, ABC):
             list_strip_whitespace=list_strip_whitespace,
             refuse_delimiter_in_data=refuse_delimiter_in_data,
         )
-
-        if lc.refuse_delimiter_in_data:
-            check_data_for_delimiter(objs, lc.inner_delimiter, schemaview, index_slot)
-
-        if lc.strip_whitespace:
-            objs = [strip_whitespace_from_lists(obj) for obj in objs]
+        multivalued_slots = (
+            get_multivalued_primitive_slots(schemaview, index_slot) if lc.refuse_delimiter_in_data else None
+        )
 
         # Convert booleans to the specified output format
         bc = get_boolean_config(schemaview, boolean_output=boolean_output)
-        objs = [convert_booleans_for_output(obj, bc.output_true, bc.output_false) for obj in objs]
 
         configmap = get_configmap(schemaview, index_slot)
         configmap = enhance_configmap_for_multivalued_primitives(
@@ -91,6 +121,14 @@ class DelimitedFileDumper(Dumper, ABC):
             csv_list_markers=lc.list_markers,
             csv_inner_delimiter=lc.inner_delimiter,
         )
-        output = io.StringIO()
-        flatten_to_csv(objs, output, config=config, **kwargs)
-        return output.getvalue()
+        json_dumper = JSONDumper()
+
+        rows = []
+        for obj in _iter_collection(element, index_slot):
+            row = json_dumper.to_dict(obj)
+            if lc.refuse_delimiter_in_data:
+                check_data_for_delimiter([row], lc.inner_delimiter, schemaview, index_slot, multivalued_slots)
+            if lc.strip_whitespace:
+                row = strip_whitespace_from_lists(row)
+            rows.append(convert_booleans_for_output(row, bc.output_true, bc.output_false))
+        flatten_to_csv(rows, output, config=config, **kwargs)
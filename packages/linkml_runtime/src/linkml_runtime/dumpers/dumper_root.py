@@ -1,10 +1,23 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Any
 
 from pydantic import BaseModel
 
+from linkml_runtime.linkml_model.meta import SlotDefinitionName
 from linkml_runtime.utils.yamlutils import YAMLRoot
 
 
+def _iter_collection(element: BaseModel | YAMLRoot | dict, index_slot: SlotDefinitionName) -> Iterable[Any]:
+    """Return the members of the index slot of element, without copying them"""
+    objs = element.get(index_slot) if isinstance(element, dict) else getattr(element, index_slot, None)
+    if objs is None:
+        return []
+    if isinstance(objs, dict):
+        return objs.values()
+    return objs
+
+
 class Dumper(ABC):
     """Abstract base class for all dumpers"""
 
@@ -1,4 +1,5 @@
 import json
+from collections.abc import Iterator
 from datetime import date, datetime
 from decimal import Decimal
 
@@ -6,12 +7,196 @@ from deprecated.classic import deprecated
 from jsonasobj2 import JsonObj
 from pydantic import BaseModel
 
-from linkml_runtime.dumpers.dumper_root import Dumper
+from linkml_runtime.dumpers.dumper_root import Dumper, _iter_collection
+from linkml_runtime.linkml_model.meta import SlotDefinitionName
 from linkml_runtime.utils import formatutils
 from linkml_runtime.utils.context_utils import CONTEXTS_PARAM_TYPE
-from linkml_runtime.utils.formatutils import remove_empty_items
+from linkml_runtime.utils.formatutils import _decimal_as_number, _unnest_single_entry, remove_empty_items
 from linkml_runtime.utils.yamlutils import YAMLRoot, as_json_object
 
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _default(o):
+    """JSON ``default`` hook: render objects the encoder does not know natively"""
+    if isinstance(o, BaseModel):
+        return remove_empty_items(o.model_dump(), hide_protected_keys=True)
+    if isinstance(o, YAMLRoot):
+        return remove_empty_items(o, hide_protected_keys=True)
+    elif isinstance(o, Decimal):
+        # https://stackoverflow.com/questions/1960516/python-json-serialize-a-decimal-object
+        return str(o)
+    elif isinstance(o, datetime | date):
+        return str(o)
+    else:
+        return json.JSONDecoder().decode(o)
+
+
+def _json_key(k) -> str:
+    """Coerce a dictionary key the way ``json.dumps`` does"""
+    if isinstance(k, str):
+        return str.__str__(k)
+    if k is True:
+        return "true"
+    if k is False:
+        return "false"
+    if k is None:
+        return "null"
+    if isinstance(k, int):
+        return int.__repr__(k)
+    if isinstance(k, float):
+        return float.__repr__(k)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {k.__class__.__name__}")
+
+
+def _to_json_compatible(o):
+    """
+    Convert o into plain dicts, lists and scalars in a single recursive pass
+
+    The result is identical to ``json.loads(json.dumps(o, default=_default))``, without
+    producing or parsing any JSON text.
+    """
+    if type(o) in _PLAIN_TYPES:
+        return o
+    if isinstance(o, str):
+        return str.__str__(o)
+    if isinstance(o, dict):
+        return {_json_key(k): _to_json_compatible(v) for k, v in o.items()}
+    if isinstance(o, list | tuple):
+        return [_to_json_compatible(v) for v in o]
+    if isinstance(o, int):
+        return int(o)
+    if isinstance(o, float):
+        return float(o)
+    if isinstance(o, BaseModel):
+        return _remove_empty_items(o.model_dump(), inside=False)
+    if isinstance(o, YAMLRoot):
+        return _remove_empty_items(o, inside=False)
+    return _to_json_compatible(_default(o))
+
+
+def _remove_empty_items(obj, inside: bool = True):
+    """
+    Fused ``remove_empty_items(obj, hide_protected_keys=True)`` and :func:`_to_json_compatible`
+
+    The collapsing of single entries and the conversion of Decimals are shared with
+    ``remove_empty_items``; the walk itself must keep its other rules in step.
+
+    Walks a YAMLRoot tree once, dropping empty entries and emitting JSON-compatible values
+    as it goes, instead of building a cleaned copy that is then serialized and re-parsed.
+    Returns ``None`` when ``inside`` and the cleaned value is empty.
+    """
+    if type(obj) in _PLAIN_TYPES:
+        return obj
+    if isinstance(obj, JsonObj):
+        state = vars(obj)
+        if "_root" in state:
+            root = state["_root"]
+            if isinstance(root, list):
+                return _remove_empty_list_items(root, inside)
+            return _remove_empty_items(root, inside)
+        pairs = ((k, v) for k, v in state.items() if k != "_if_missing")
+    elif isinstance(obj, dict):
+        pairs = obj.items()
+    elif isinstance(obj, list):
+        return _remove_empty_list_items(obj, inside)
+    elif isinstance(obj, Decimal):
+        return _decimal_as_number(obj)
+    else:
+        return _to_json_compatible(obj)
+
+    obj_dict = {}
+    for k, v in pairs:
+        v = _remove_empty_items(v)
+        if v is not None and not (isinstance(v, dict | list) and not v):
+            obj_dict[k] = v
+
+    obj_dict = _unnest_single_entry(obj_dict, hide_protected_keys=True)
+    if not isinstance(obj_dict, dict):
+        return obj_dict
+    if not obj_dict and inside:
+        return None
+    if all(type(k) is str for k in obj_dict):
+        return obj_dict
+    return {_json_key(k): v for k, v in obj_dict.items()}
+
+
+def _remove_empty_list_items(obj: list, inside: bool):
+    obj_list = []
+    for e in obj:
+        if isinstance(e, str) and e == "_root":
+            continue
+        e = _remove_empty_items(e)
+        if e is not None and not (isinstance(e, dict | list) and not e):
+            obj_list.append(e)
+    return obj_list if obj_list or not inside else None
+
+
+def _encode(o, indent: bool = True) -> str:
+    """Encode an already JSON-compatible value"""
+    if indent:
+        return json.dumps(o, ensure_ascii=False, indent="  ")
+    return json.dumps(o, ensure_ascii=False, separators=(",", ":"))
+
+
+def _is_empty(v) -> bool:
+    return v is None or (isinstance(v, dict | list) and not v)
+
+
+def _iter_json_chunks(json_obj) -> Iterator[str]:
+    """
+    Yield the text of ``_encode(_to_json_compatible(json_obj))`` in pieces
+
+    Top-level fields are converted and encoded one at a time, and list-valued fields
+    one member at a time, so no copy of the whole document is ever held in memory.
+    """
+    if isinstance(json_obj, dict):
+        clean = False
+        pairs = json_obj.items()
+    elif isinstance(json_obj, YAMLRoot) and "_root" not in vars(json_obj):
+        clean = True
+        pairs = [(k, v) for k, v in vars(json_obj).items() if k != "_if_missing"]
+        if any(str(k).startswith("_") for k, _ in pairs):
+            # Protected keys may collapse the object (see _remove_empty_items)
+            pairs = None
+    else:
+        pairs = None
+    if pairs is None:
+        yield _encode(_to_json_compatible(json_obj))
+        return
+
+    convert = _remove_empty_items if clean else _to_json_compatible
+    sep = "{\n  "
+    for k, v in pairs:
+        key = _encode(_json_key(k))
+        if isinstance(v, list):
+            opened = False
+            for e in v:
+                if clean:
+                    if isinstance(e, str) and e == "_root":
+                        continue
+                    e = convert(e)
+                    if _is_empty(e):
+                        continue
+                else:
+                    e = convert(e)
+                yield f"{sep}{key}: [\n    " if not opened else ",\n    "
+                yield _encode(e).replace("\n", "\n    ")
+                opened = True
+                sep = ",\n  "
+            if opened:
+                yield "\n  ]"
+            elif not clean:
+                yield f"{sep}{key}: []"
+                sep = ",\n  "
+        else:
+            v = convert(v)
+            if clean and _is_empty(v):
+                continue
+            yield f"{sep}{key}: " + _encode(v).replace("\n", "\n  ")
+            sep = ",\n  "
+    yield "{}" if sep.startswith("{") else "\n}"
+
 
 class JSONDumper(Dumper):
     def dump(self, element: BaseModel | YAMLRoot, to_file: str, contexts: CONTEXTS_PARAM_TYPE = None, **kwargs) -> None:
@@ -29,7 +214,26 @@ class JSONDumper(Dumper):
         """
         if isinstance(element, BaseModel):
             element = element.model_dump()
-        super().dump(element, to_file, contexts=contexts, **kwargs)
+        inject_type = kwargs.get("inject_type", True)
+        with open(to_file, "w", encoding="UTF-8") as output_file:
+            for chunk in _iter_json_chunks(self._as_json_object(element, contexts, inject_type)):
+                output_file.write(chunk)
+
+    def dump_lines(self, element: BaseModel | YAMLRoot | dict, to_file: str, index_slot: SlotDefinitionName) -> None:
+        """
+        Write the members of the index slot of element to to_file as JSON Lines
+
+        Each member is converted and written on its own line as soon as it is reached,
+        so memory use is proportional to a single member rather than the whole collection.
+
+        :param element: container object
+        :param to_file: file to write to
+        :param index_slot: slot of the container holding the collection
+        """
+        with open(to_file, "w", encoding="UTF-8") as output_file:
+            for obj in _iter_collection(element, index_slot):
+                output_file.write(_encode(self.to_dict(obj), indent=False))
+                output_file.write("\n")
 
     def dumps(self, element: BaseModel | YAMLRoot, contexts: CONTEXTS_PARAM_TYPE = None, inject_type=True) -> str:
         """
@@ -45,29 +249,14 @@ class JSONDumper(Dumper):
         :param inject_type: if True (default), add a @type at the top level
         :return: JSON Object representing the element
         """
+        return _encode(_to_json_compatible(self._as_json_object(element, contexts, inject_type)))
 
-        def default(o):
-            if isinstance(o, BaseModel):
-                return remove_empty_items(o.model_dump(), hide_protected_keys=True)
-            if isinstance(o, YAMLRoot):
-                return remove_empty_items(o, hide_protected_keys=True)
-            elif isinstance(o, Decimal):
-                # https://stackoverflow.com/questions/1960516/python-json-serialize-a-decimal-object
-                return str(o)
-            elif isinstance(o, datetime | date):
-                return str(o)
-            else:
-                return json.JSONDecoder().decode(o)
-
+    @staticmethod
+    def _as_json_object(element: BaseModel | YAMLRoot, contexts: CONTEXTS_PARAM_TYPE, inject_type: bool):
         element_type = element.__class__.__name__
         if isinstance(element, BaseModel):
             element = element.model_dump()
-        return json.dumps(
-            as_json_object(element, contexts, inject_type=inject_type, element_type=element_type),
-            default=default,
-            ensure_ascii=False,
-            indent="  ",
-        )
+        return as_json_object(element, contexts, inject_type=inject_type, element_type=element_type)
 
     @staticmethod
     @deprecated("Use `utils/formatutils/remove_empty_items` instead")
@@ -98,9 +287,11 @@ class JSONDumper(Dumper):
         """
         return as_json_object(element, contexts, inject_type=inject_type)
 
-    def to_dict(self, element: BaseModel | YAMLRoot, **kwargs) -> JsonObj:
+    def to_dict(self, element: BaseModel | YAMLRoot, contexts: CONTEXTS_PARAM_TYPE = None, **_) -> dict:
         """
-        As dumps(), except returns a JsonObj, not a string
+        As dumps(), except returns a plain dictionary, not a string
+
+        The element is converted directly, without a JSON encode/decode round-trip.
 
         :param element: LinkML object to be emitted
         :param contexts: JSON-LD context(s) in the form of:
@@ -110,7 +301,6 @@ class JSONDumper(Dumper):
             * dict
             * JSON Object
             * A list containing elements of any type named above
-        :param inject_type: if True (default), add a @type at the top level
         :return: JSON Object representing the element
         """
-        return json.loads(self.dumps(element, inject_type=False, **kwargs))
+        return _to_json_compatible(self._as_json_object(element, contexts, inject_type=False))
@@ -1,7 +1,9 @@
 import logging
 import urllib
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
+import pyoxigraph as ox
 from curies import Converter
 from pydantic import BaseModel
 from rdflib import XSD, Graph, URIRef
@@ -9,7 +11,8 @@ from rdflib.namespace import RDF
 from rdflib.term import BNode, Literal, Node
 
 from linkml_runtime.dumpers.dumper_root import Dumper
-from linkml_runtime.linkml_model import ElementName, PermissibleValue, SlotDefinition
+from linkml_runtime.linkml_model import ElementName, EnumDefinition, PermissibleValue, SlotDefinition
+from linkml_runtime.utils.oxigraph_store import OxGraphName, OxigraphWriter
 from linkml_runtime.utils.rdf_canonicalize import canonicalize_rdf_graph
 from linkml_runtime.utils.schemaview import SchemaView
 from linkml_runtime.utils.yamlutils import YAMLRoot
@@ -17,6 +20,196 @@ from linkml_runtime.utils.yamlutils import YAMLRoot
 logger = logging.getLogger(__name__)
 
 
+class _SlotPlan(NamedTuple):
+    """How the values of one attribute of a class are turned into triples"""
+
+    predicate: URIRef | None
+    """Predicate of the triples, None for identifier slots, which aren't emitted as triples"""
+    range: ElementName
+    designates_type: bool
+
+
+class _ClassPlan(NamedTuple):
+    id_slot: SlotDefinition | None
+    percent_encoded: bool
+    """Whether identifiers of the class are percent encoded"""
+    slots: dict[str, _SlotPlan]
+    """Plans of the attributes of the class, filled in as they are first encountered"""
+
+
+class _DumpPlan:
+    """
+    The schema lookups needed to turn instances into triples
+
+    Predicates, class URIs, identifier slots and range kinds are resolved once per class, slot and range
+    and reused for every element of a dump, instead of being recomputed at each level of the recursion.
+    Triples are handed to ``emit`` as they are produced, children before the triple that links them.
+    """
+
+    def __init__(self, schemaview: SchemaView, emit: Callable[[tuple[Node, Node, Node]], Any]) -> None:
+        self.schemaview = schemaview
+        self.emit = emit
+        self.namespaces = schemaview.namespaces()
+        self.slot_name_map = schemaview.slot_name_mappings()
+        self.enums = schemaview.all_enums()
+        self.types = schemaview.all_types()
+        self._class_names: dict[type, str] = {}
+        self._classes: dict[str, _ClassPlan] = {}
+        self._class_uris: dict[str, URIRef] = {}
+        self._id_slots: dict[ElementName | None, tuple[SlotDefinition | None, bool]] = {}
+        self._datatypes: dict[ElementName, tuple[bool, URIRef | None]] = {}
+        self._enums: dict[ElementName, EnumDefinition] = {}
+        self._meanings: dict[str, URIRef] = {}
+
+    def triples(self, element: Any, target_type: ElementName = None) -> Node:
+        """
+        Emit the triples of element and return the node that represents it
+
+        :param element: element to represent in RDF
+        :param target_type: range of the slot holding element, if any
+        :return: root node as rdflib URIRef, BNode, or Literal
+        """
+        logger.debug("CONVERT: %s // %s // %s", element, type(element), target_type)
+        if target_type in self.enums:
+            return self._enum_node(element, target_type)
+        if target_type in self.types:
+            is_uri, datatype = self._datatype(target_type)
+            if is_uri:
+                return URIRef(self.schemaview.expand_curie(element))
+            return Literal(element, datatype=datatype) if datatype else Literal(element)
+        element_vars = {k: v for k, v in vars(element).items() if not k.startswith("_")}
+        if len(element_vars) == 0:
+            return self._as_uri(element, self._id_slot(target_type)[1])
+        cn = self._class_name(type(element))
+        plan = self._class_plan(cn)
+        if plan.id_slot is not None:
+            element_uri = self._as_uri(getattr(element, plan.id_slot.name), plan.percent_encoded)
+        else:
+            element_uri = BNode()
+        emit = self.emit
+        type_added = False
+        for k, v_or_list in element_vars.items():
+            if isinstance(v_or_list, list):
+                vs = v_or_list
+            elif isinstance(v_or_list, dict):
+                vs = v_or_list.values()
+            else:
+                vs = [v_or_list]
+            slot_plan = None
+            for v in vs:
+                if v is None:
+                    continue
+                if slot_plan is None:
+                    slot_plan = plan.slots.get(k) or self._slot_plan(cn, plan, k)
+                if slot_plan.predicate is not None:
+                    emit((element_uri, slot_plan.predicate, self.triples(v, slot_plan.range)))
+                    if slot_plan.designates_type:
+                        type_added = True
+        if not type_added:
+            emit((element_uri, RDF.type, self._class_uri(cn)))
+        return element_uri
+
+    def _enum_node(self, element: Any, target_type: ElementName) -> Node:
+        # Handle three cases for enum target types:
+        if isinstance(element, str):  # case 1: string, look up PermissibleValue
+            e = self._enums.get(target_type)
+            if e is None:
+                e = self._enums[target_type] = self.schemaview.get_enum(target_type)
+            element = e.permissible_values[element]
+        elif not isinstance(element, PermissibleValue):  # case 3: EnumDefinitionImpl .code
+            element = element.code
+        # 3) do nothing, element is already PermissibleValue (PermissibleValueImpl.code)
+
+        element: PermissibleValue
+        if element.meaning is not None:
+            meaning = self._meanings.get(element.meaning)
+            if meaning is None:
+                meaning = self._meanings[element.meaning] = URIRef(self.schemaview.expand_curie(element.meaning))
+            return meaning
+        else:
+            return Literal(element.text)
+
+    def _datatype(self, target_type: ElementName) -> tuple[bool, URIRef | None]:
+        """Return whether values of the type are URIs and, if not, the datatype of their literals"""
+        if target_type not in self._datatypes:
+            t = self.schemaview.get_type(target_type)
+            dt_uri = t.uri
+            if dt_uri:
+                if dt_uri in ("rdfs:Resource", "xsd:anyURI"):
+                    self._datatypes[target_type] = (True, None)
+                elif dt_uri == "xsd:string":
+                    self._datatypes[target_type] = (False, None)
+                else:
+                    if "xsd" not in self.namespaces:
+                        self.namespaces["xsd"] = XSD
+                    self._datatypes[target_type] = (False, self.namespaces.uri_for(dt_uri))
+            else:
+                logger.warning(f"No datatype specified for : {t.name}, using plain Literal")
+                self._datatypes[target_type] = (False, None)
+        return self._datatypes[target_type]
+
+    def _class_name(self, element_type: type) -> str:
+        cn = self._class_names.get(element_type)
+        if cn is None:
+            if hasattr(element_type, "class_name"):
+                cn = element_type.class_name
+            else:
+                nm = self.schemaview.class_name_mappings()
+                cls_name = element_type.__name__
+                if cls_name not in nm:
+                    raise ValueError(f"Class {cls_name} not found in schema")
+                cn = nm[cls_name].name
+            self._class_names[element_type] = cn
+        return cn
+
+    def _class_plan(self, cn: str) -> _ClassPlan:
+        plan = self._classes.get(cn)
+        if plan is None:
+            plan = self._classes[cn] = _ClassPlan(*self._id_slot(cn), {})
+        return plan
+
+    def _class_uri(self, cn: str) -> URIRef:
+        uri = self._class_uris.get(cn)
+        if uri is None:
+            uri = self._class_uris[cn] = URIRef(self.schemaview.get_uri(cn, expand=True))
+        return uri
+
+    def _slot_plan(self, cn: str, plan: _ClassPlan, k: str) -> _SlotPlan:
+        slot_name = k
+        if k in self.slot_name_map:
+            slot_name = self.slot_name_map[k].name
+        else:
+            logger.error(f"Slot {k} not in name map")
+        slot = self.schemaview.induced_slot(slot_name, cn)
+        predicate = None if slot.identifier else URIRef(self.schemaview.get_uri(slot, expand=True))
+        slot_plan = plan.slots[k] = _SlotPlan(predicate, slot.range, bool(slot.designates_type))
+        return slot_plan
+
+    def _id_slot(self, cn: ElementName | None) -> tuple[SlotDefinition | None, bool]:
+        """Return the identifier slot of class cn and whether its values are percent encoded"""
+        if cn not in self._id_slots:
+            id_slot = self.schemaview.get_identifier_slot(cn)
+            self._id_slots[cn] = (id_slot, bool(id_slot) and bool(self.schemaview.is_slot_percent_encoded(id_slot)))
+        return self._id_slots[cn]
+
+    def _as_uri(self, element_id: str, percent_encoded: bool) -> URIRef:
+        if percent_encoded:
+            return URIRef(urllib.parse.quote(element_id))
+        return self.namespaces.uri_for(element_id)
+
+
+def _nt_term(node: Node) -> str:
+    """Return node in N-Triples syntax"""
+    if isinstance(node, Literal):
+        lexical = str(node).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r")
+        if node.language:
+            return f'"{lexical}"@{node.language}'
+        if node.datatype:
+            return f'"{lexical}"^^<{node.datatype}>'
+        return f'"{lexical}"'
+    return node.n3()
+
+
 class RDFLibDumper(Dumper):
     """
     Dumps from elements (instances of a LinkML model) to an rdflib Graph
@@ -43,31 +236,7 @@ class RDFLibDumper(Dumper):
         :return:
         """
         g = Graph()
-        schemaview.imports_closure()  # ensure all imported sub-schemas are in schema_map before namespaces() caches
-        if isinstance(prefix_map, Converter):
-            # TODO replace with `prefix_map = prefix_map.bimap` after making minimum requirement on python 3.8
-            prefix_map = {record.prefix: record.uri_prefix for record in prefix_map.records}
-        logger.debug(f"PREFIXMAP={prefix_map}")
-        namespaces = schemaview.namespaces()
-        if prefix_map:
-            for k, v in prefix_map.items():
-                if k == "@base":
-                    namespaces._base = v
-                else:
-                    namespaces[k] = v
-                    g.namespace_manager.bind(k, URIRef(v))
-
-        for prefix in namespaces:
-            g.bind(prefix, URIRef(namespaces[prefix]))
-        # user can pass in base in prefixmap using '_base'. This gets set
-        # in namespaces as a plain dict assignment - explicitly call the setter
-        # to set the underlying "@base"
-        if "_base" in namespaces:
-            namespaces._base = namespaces["_base"]
-
-        if namespaces._base:
-            g.base = namespaces._base
-
+        self._prepare_namespaces(schemaview, prefix_map, g)
         self.inject_triples(element, schemaview, g)
         return g
 
@@ -77,89 +246,72 @@ class RDFLibDumper(Dumper):
         """
         Inject triples from conversion of element into a Graph
 
+        The triples are collected first and added to the graph in a single ``addN`` call.
+
         :param element: element to represent in RDF
         :param schemaview:
         :param graph:
         :param target_type:
         :return: root node as rdflib URIRef, BNode, or Literal
         """
-        namespaces = schemaview.namespaces()
-        slot_name_map = schemaview.slot_name_mappings()
-        logger.debug(f"CONVERT: {element} // {type(element)} // {target_type}")
-        if target_type in schemaview.all_enums():
-            # Handle three cases for enum target types:
-            if isinstance(element, str):  # case 1: string, look up PermissibleValue
-                e = schemaview.get_enum(target_type)
-                element = e.permissible_values[element]
-            elif not isinstance(element, PermissibleValue):  # case 3: EnumDefinitionImpl .code
-                element = element.code
-            # 3) do nothing, element is already PermissibleValue (PermissibleValueImpl.code)
-
-            element: PermissibleValue
-            if element.meaning is not None:
-                return URIRef(schemaview.expand_curie(element.meaning))
-            else:
-                return Literal(element.text)
-        if target_type in schemaview.all_types():
-            t = schemaview.get_type(target_type)
-            dt_uri = t.uri
-            if dt_uri:
-                if dt_uri in ("rdfs:Resource", "xsd:anyURI"):
-                    return URIRef(schemaview.expand_curie(element))
-                elif dt_uri == "xsd:string":
-                    return Literal(element)
-                else:
-                    if "xsd" not in namespaces:
-                        namespaces["xsd"] = XSD
-                    return Literal(element, datatype=namespaces.uri_for(dt_uri))
-            else:
-                logger.warning(f"No datatype specified for : {t.name}, using plain Literal")
-                return Literal(element)
-        element_vars = {k: v for k, v in vars(element).items() if not k.startswith("_")}
-        if len(element_vars) == 0:
-            id_slot = schemaview.get_identifier_slot(target_type)
-            return self._as_uri(element, id_slot, schemaview)
-            # return URIRef(schemaview.expand_curie(str(element)))
-        element_type = type(element)
-        if hasattr(element_type, "class_name"):
-            cn = element_type.class_name
-        else:
-            nm = schemaview.class_name_mappings()
-            cls_name = element_type.__name__
-            if cls_name not in nm:
-                raise ValueError(f"Class {cls_name} not found in schema")
-            cn = nm[cls_name].name
-        id_slot = schemaview.get_identifier_slot(cn)
-        if id_slot is not None:
-            element_id = getattr(element, id_slot.name)
-            element_uri = self._as_uri(element_id, id_slot, schemaview)
-        else:
-            element_uri = BNode()
-        type_added = False
-        for k, v_or_list in element_vars.items():
-            if isinstance(v_or_list, list):
-                vs = v_or_list
-            elif isinstance(v_or_list, dict):
-                vs = v_or_list.values()
-            else:
-                vs = [v_or_list]
-            for v in vs:
-                if v is None:
-                    continue
-                if k in slot_name_map:
-                    k = slot_name_map[k].name
-                else:
-                    logger.error(f"Slot {k} not in name map")
-                slot = schemaview.induced_slot(k, cn)
-                if not slot.identifier:
-                    slot_uri = URIRef(schemaview.get_uri(slot, expand=True))
-                    v_node = self.inject_triples(v, schemaview, graph, slot.range)
-                    graph.add((element_uri, slot_uri, v_node))
-                    if slot.designates_type:
-                        type_added = True
-        if not type_added:
-            graph.add((element_uri, RDF.type, URIRef(schemaview.get_uri(cn, expand=True))))
-        return element_uri
+        triples = []
+        node = _DumpPlan(schemaview, triples.append).triples(element, target_type)
+        graph.addN((s, p, o, graph) for s, p, o in triples)
+        return node
+
+    def dump_ntriples(
+        self,
+        element: BaseModel | YAMLRoot,
+        to_file: str,
+        schemaview: SchemaView,
+        prefix_map: dict[str, str] | Converter | None = None,
+    ) -> None:
+        """
+        Write element to to_file as N-Triples, without building an rdflib Graph
+
+        Each triple is written as soon as it is produced, so memory use does not grow with the number
+        of triples.  Unlike :meth:`dumps`, the output is neither canonicalized nor deduplicated.
+
+        :param element: element to represent in RDF
+        :param to_file: file to write to
+        :param schemaview:
+        :param prefix_map:
+        """
+        self._prepare_namespaces(schemaview, prefix_map)
+        with open(to_file, "w", encoding="UTF-8") as output_file:
+            write = output_file.write
+
+            def emit(triple: tuple[Node, Node, Node]) -> None:
+                s, p, o = triple
+                write(f"{_nt_term(s)} {_nt_term(p)} {_nt_term(o)} .\n")
+
+            _DumpPlan(schemaview, emit).triples(element)
+
+    def as_oxigraph_store(
+        self,
+        element: BaseModel | YAMLRoot,
+        schemaview: SchemaView,
+        prefix_map: dict[str, str] | Converter | None = None,
+        store: ox.Store | None = None,
+        graph_name: OxGraphName | None = None,
+    ) -> ox.Store:
+        """
+        Dumps from element to a pyoxigraph Store, without building an rdflib Graph
+
+        :param element: element to represent in RDF
+        :param schemaview:
+        :param prefix_map:
+        :param store: store to add the triples to, e.g. an on-disk ``pyoxigraph.Store(path)``; a new
+                      in-memory store if None
+        :param graph_name: graph of the store to add the triples to, the default graph if None
+        :return: the store
+        """
+        if store is None:
+            store = ox.Store()
+        self._prepare_namespaces(schemaview, prefix_map)
+        with OxigraphWriter(store, graph_name) as writer:
+            _DumpPlan(schemaview, writer.add).triples(element)
+        return store
 
     def dump(
         self,
@@ -200,8 +352,34 @@ class RDFLibDumper(Dumper):
         """
         return canonicalize_rdf_graph(self.as_rdf_graph(element, schemaview, prefix_map=prefix_map), output_format=fmt)
 
-    def _as_uri(self, element_id: str, id_slot: SlotDefinition | None, schemaview: SchemaView) -> URIRef:
-        if id_slot and schemaview.is_slot_percent_encoded(id_slot):
-            return URIRef(urllib.parse.quote(element_id))
-        else:
-            return schemaview.namespaces().uri_for(element_id)
+    @staticmethod
+    def _prepare_namespaces(
+        schemaview: SchemaView, prefix_map: dict[str, str] | Converter | None, graph: Graph | None = None
+    ) -> None:
+        """Apply prefix_map to the namespaces of schemaview and bind them in graph, if given"""
+        schemaview.imports_closure()  # ensure all imported sub-schemas are in schema_map before namespaces() caches
+        if isinstance(prefix_map, Converter):
+            # TODO replace with `prefix_map = prefix_map.bimap` after making minimum requirement on python 3.8
+            prefix_map = {record.prefix: record.uri_prefix for record in prefix_map.records}
+        logger.debug(f"PREFIXMAP={prefix_map}")
+        namespaces = schemaview.namespaces()
+        if prefix_map:
+            for k, v in prefix_map.items():
+                if k == "@base":
+                    namespaces._base = v
+                else:
+                    namespaces[k] = v
+                    if graph is not None:
+                        graph.namespace_manager.bind(k, URIRef(v))
+
+        if graph is not None:
+            for prefix in namespaces:
+                graph.bind(prefix, URIRef(namespaces[prefix]))
+        # user can pass in base in prefixmap using '_base'. This gets set
+        # in namespaces as a plain dict assignment - explicitly call the setter
+        # to set the underlying "@base"
+        if "_base" in namespaces:
+            namespaces._base = namespaces["_base"]
+
+        if namespaces._base and graph is not None:
+            graph.base = namespaces._base
@@ -1,20 +1,75 @@
 import yaml
+from jsonasobj2 import is_dict, items
 from pydantic import BaseModel
 
 from linkml_runtime.dumpers.dumper_root import Dumper
-from linkml_runtime.utils.formatutils import remove_empty_items
+from linkml_runtime.utils.formatutils import is_empty, remove_empty_items
 from linkml_runtime.utils.yamlutils import YAMLRoot
 
 
 class YAMLDumper(Dumper):
+    def dump(self, element: BaseModel | YAMLRoot, to_file: str, **kwargs) -> None:
+        """
+        Write element to to_file as YAML
+
+        Top-level slots are cleaned and emitted one at a time, and multivalued
+        top-level slots one member at a time, so the full document is never held
+        in memory. The output is identical to :meth:`dumps`.
+
+        :param element: LinkML object to be dumped
+        :param to_file: file to dump to
+        :param kwargs: extra arguments for ``yaml.dump``; if any are given the
+            document is rendered in one piece, as their effect on layout may span entries
+        """
+        dumper_safe_element = element.model_dump() if isinstance(element, BaseModel) else element
+        if kwargs or not is_dict(dumper_safe_element):
+            super().dump(element, to_file, **kwargs)
+            return
+        pairs = list(items(dumper_safe_element))
+        if any(str(k).startswith("_") for k, _ in pairs):
+            # Protected keys may collapse the object (see remove_empty_items)
+            super().dump(element, to_file, **kwargs)
+            return
+
+        with open(to_file, "w", encoding="UTF-8") as output_file:
+            written = False
+            for k, v in pairs:
+                if isinstance(v, list):
+                    opened = False
+                    for e in v:
+                        if isinstance(e, str) and e == "_root":
+                            continue
+                        e = remove_empty_items(e, hide_protected_keys=True, inside=True)
+                        if is_empty(e):
+                            continue
+                        if not opened:
+                            # A block sequence under a top-level key is not indented, so
+                            # each member renders exactly as a one-element top-level list
+                            output_file.write(self._dump_yaml({k: None}).removesuffix(" null\n") + "\n")
+                            opened = True
+                        output_file.write(self._dump_yaml([e]))
+                    written = written or opened
+                else:
+                    v = remove_empty_items(v, hide_protected_keys=True, inside=True)
+                    if is_empty(v):
+                        continue
+                    output_file.write(self._dump_yaml({k: v}))
+                    written = True
+            if not written:
+                output_file.write(self._dump_yaml({}))
+
     def dumps(self, element: BaseModel | YAMLRoot, **kwargs) -> str:
         """Return element formatted as a YAML string"""
         # Internal note: remove_empty_items will also convert Decimals to int/float;
         # this is necessary until https://github.com/yaml/pyyaml/pull/372 is merged
 
         dumper_safe_element = element.model_dump() if isinstance(element, BaseModel) else element
+        return self._dump_yaml(remove_empty_items(dumper_safe_element, hide_protected_keys=True), **kwargs)
+
+    @staticmethod
+    def _dump_yaml(data, **kwargs) -> str:
         return yaml.dump(
-            remove_empty_items(dumper_safe_element, hide_protected_keys=True),
+            data,
             Dumper=yaml.SafeDumper,
             sort_keys=False,
             allow_unicode=True,
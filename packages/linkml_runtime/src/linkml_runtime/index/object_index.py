@@ -11,10 +11,12 @@ This package provides:
 
 import inspect
 import logging
-from collections.abc import Iterator, Mapping
+from collections import OrderedDict
+from collections.abc import Iterator
 from typing import Any
 
 from linkml_runtime.utils import eval_utils
+from linkml_runtime.utils.formatutils import underscore
 from linkml_runtime.utils.schemaview import SchemaView
 from linkml_runtime.utils.yamlutils import YAMLRoot
 
@@ -52,38 +54,78 @@ class ObjectIndex:
     object with an identifier.
     """
 
-    def __init__(self, obj: YAMLRoot, schemaview: SchemaView):
+    def __init__(self, obj: YAMLRoot, schemaview: SchemaView, proxy_cache_size: int | None = None):
+        """
+        :param obj: tree-root/container object
+        :param schemaview: schema of obj
+        :param proxy_cache_size: maximum number of proxy objects kept for reuse, unbounded if None.
+                                 The least recently used ones are dropped first
+        """
         self._root_object = obj
         self._schemaview = schemaview
         self._class_map = schemaview.class_name_mappings()
-        self._source_object_cache: Mapping[str, Any] = {}
-        self._proxy_object_cache: Mapping[str, ProxyObject] = {}
-        self._child_to_parent: Mapping[str, list[tuple[str, str]]] = {}
-        self._index(obj)
+        self._proxy_cache_size = proxy_cache_size
+        self._source_object_cache: dict[tuple[str, Any], Any] = {}
+        self._proxy_object_cache: OrderedDict[tuple[str, Any], ProxyObject] = OrderedDict()
+        self._child_to_parent: dict[tuple[str, Any], list[tuple[str, Any]]] = {}
+        self._references: dict[tuple[str, tuple[str, Any]], list[Any]] = {}
+        """Objects that refer to an object without inlining it, by slot and primary key of the object"""
+        self._key_slots: dict[type, tuple[str, str | None]] = {}
+        self._anonymous_keys: dict[int, tuple[Any, tuple[str, str]]] = {}
+        """Primary keys of indexed objects without an identifier, by object id, as stringification is slow"""
+        self._slot_ranges: dict[str, dict[str, str]] = {}
+        self._module_classes: dict[Any, dict[str, type]] = {}
+        # Objects not yet indexed, with the slot and object they were found in; the tree is indexed
+        # incrementally, as lookups need it
+        self._unindexed: list[tuple[Any, str | None, Any]] = [(obj, None, None)]
+
+    def _index(self, until: tuple[str, Any] | None = None) -> None:
+        """
+        Index the remaining objects of the tree, or only until the object with primary key until is indexed
 
-    def _index(self, obj: Any, parent_key=None, parent=None):
-        if obj is None:
-            return None
-        if isinstance(obj, list):
-            return [self._index(v, parent_key, parent) for v in obj]
-        if isinstance(obj, dict):
-            return {k: self._index(v, parent_key, parent) for k, v in obj.items()}
-        cls_name = type(obj).__name__
-        if cls_name in self._class_map:
-            self._class_map[cls_name]
-            pk_val = self._key(obj)
-            self._source_object_cache[pk_val] = obj
-            if pk_val not in self._child_to_parent:
-                self._child_to_parent[pk_val] = []
-            self._child_to_parent[pk_val].append((parent_key, parent))
-            # id_slot = self._schemaview.get_identifier_slot(cls.name)
-            # if id_slot:
-            #    id_val = getattr(obj, id_slot.name)
-            #    self._source_object_cache[(cls.name, id_val)] = obj
-            for k, v in vars(obj).items():
-                self._index(v, k, obj)
-        else:
-            return obj
+        :param until: primary key of the object to look for
+        """
+        unindexed = self._unindexed
+        while unindexed:
+            obj, parent_key, parent = unindexed.pop()
+            if obj is None:
+                continue
+            if isinstance(obj, list):
+                unindexed.extend((v, parent_key, parent) for v in reversed(obj))
+                continue
+            if isinstance(obj, dict):
+                unindexed.extend((v, parent_key, parent) for v in reversed(obj.values()))
+                continue
+            if type(obj).__name__ in self._class_map:
+                pk_val = self._key(obj)
+                if self._key_slots[type(obj)][1] is None:
+                    self._anonymous_keys[id(obj)] = (obj, pk_val)
+                self._source_object_cache[pk_val] = obj
+                if pk_val not in self._child_to_parent:
+                    self._child_to_parent[pk_val] = []
+                self._child_to_parent[pk_val].append((parent_key, parent))
+                unindexed.extend((v, k, obj) for k, v in reversed(vars(obj).items()))
+                if pk_val == until:
+                    return
+            elif parent is not None:
+                in_range = self._slot_ranges_of(type(parent)).get(parent_key)
+                if in_range in self._class_map:
+                    # reference to an object that is not inlined
+                    ref_key = (parent_key, (in_range, obj))
+                    if ref_key not in self._references:
+                        self._references[ref_key] = []
+                    self._references[ref_key].append(parent)
+
+    def _source_object(self, k: tuple[str, Any]) -> Any:
+        """
+        Returns the domain object with primary key k, indexing the tree as far as needed to find it.
+
+        :param k: primary key
+        :return: domain object, or None if the tree has no such object
+        """
+        if k not in self._source_object_cache:
+            self._index(until=k)
+        return self._source_object_cache.get(k)
 
     def bless(self, obj: Any) -> "ProxyObject":
         """
@@ -108,12 +150,16 @@ class ObjectIndex:
             return obj
         k = self._key(obj)
         if k:
-            if k not in self._proxy_object_cache:
+            cache = self._proxy_object_cache
+            if k not in cache:
                 obj2 = ProxyObject(obj, _db=self)
-                self._proxy_object_cache[k] = obj2
+                cache[k] = obj2
+                if self._proxy_cache_size is not None and len(cache) > self._proxy_cache_size:
+                    cache.popitem(last=False)
                 return obj2
             else:
-                return self._proxy_object_cache[k]
+                cache.move_to_end(k)
+                return cache[k]
         else:
             return ProxyObject(obj, _db=self)
 
@@ -130,14 +176,59 @@ class ObjectIndex:
         :param obj:
         :return:
         """
-        cls_name = type(obj).__name__
-        cls = self._class_map[cls_name]
-        id_slot = self._schemaview.get_identifier_slot(cls.name)
-        if id_slot:
-            id_val = getattr(obj, id_slot.name)
-            return cls.name, id_val
-        else:
-            return cls.name, str(obj)
+        key_slot = self._key_slots.get(type(obj))
+        if key_slot is None:
+            cls = self._class_map[type(obj).__name__]
+            id_slot = self._schemaview.get_identifier_slot(cls.name)
+            key_slot = self._key_slots[type(obj)] = (cls.name, id_slot.name if id_slot else None)
+        cls_name, id_slot_name = key_slot
+        if id_slot_name:
+            return cls_name, getattr(obj, id_slot_name)
+        anonymous_key = self._anonymous_keys.get(id(obj))
+        if anonymous_key is not None and anonymous_key[0] is obj:
+            return anonymous_key[1]
+        return cls_name, str(obj)
+
+    def _slot_ranges_of(self, obj_type: type) -> dict[str, str]:
+        """
+        Returns the ranges of the induced slots of instances of obj_type, by attribute name.
+
+        :param obj_type: python class of a LinkML class
+        :return:
+        """
+        cls = self._class_map[obj_type.__name__]
+        ranges = self._slot_ranges.get(cls.name)
+        if ranges is None:
+            ranges = self._slot_ranges[cls.name] = {
+                underscore(slot.name): slot.range for slot in self._schemaview.class_induced_slots(cls.name)
+            }
+        return ranges
+
+    def _slot_range(self, obj_type: type, p: str) -> str | None:
+        """
+        Returns the range of attribute p of instances of obj_type.
+
+        :param obj_type: python class of a LinkML class
+        :param p: attribute name
+        :return: range of the induced slot
+        """
+        ranges = self._slot_ranges_of(obj_type)
+        if p not in ranges:
+            # raises ValueError if p is not a slot of the class
+            ranges[p] = self._schemaview.induced_slot(p, self._class_map[obj_type.__name__].name).range
+        return ranges[p]
+
+    def _python_class(self, module: Any, class_name: str) -> type | None:
+        """
+        Returns the python class of a LinkML class, from the module of the domain objects.
+
+        :param module:
+        :param class_name:
+        :return:
+        """
+        if module not in self._module_classes:
+            self._module_classes[module] = dict(inspect.getmembers(module, inspect.isclass))
+        return self._module_classes[module].get(class_name)
 
     @property
     def proxy_object_cache_size(self) -> int:
@@ -158,9 +249,11 @@ class ObjectIndex:
         Number of elements in source object cache.
 
         This should match the number of objects used
-        in the tree of the container used to initialize the index.
+        in the tree of the container used to initialize the index,
+        which is indexed completely.
         :return:
         """
+        self._index()
         return len(self._source_object_cache.keys())
 
     def clear_proxy_object_cache(self):
@@ -169,7 +262,23 @@ class ObjectIndex:
 
         :return:
         """
-        self._proxy_object_cache = {}
+        self._proxy_object_cache = OrderedDict()
+
+    def referencing_objects(self, obj: Any, slot_name: str) -> list[Any]:
+        """
+        Returns the domain objects that refer to obj through slot slot_name, without inlining it.
+
+        This indexes the whole tree.
+
+        :param obj: domain or proxy object, or its primary key
+        :param slot_name: attribute name of the slot
+        :return: referencing domain objects
+        """
+        if isinstance(obj, ProxyObject):
+            obj = obj._shadowed
+        k = obj if isinstance(obj, tuple) else self._key(obj)
+        self._index()
+        return self._references.get((slot_name, k), [])
 
     def eval_expr(self, expr: str, obj: Any = None, **kwargs) -> Any:
         """
@@ -208,12 +317,13 @@ class ProxyObject:
             return lambda: None
         if p.endswith("__inverse"):
             p = p.replace("__inverse", "")
-            return [v for k, v in self._parents if k == p]
+            db = self._db
+            referencing_objects = [db.bless(v) for v in db.referencing_objects(self._shadowed, p)]
+            return [v for k, v in self._parents if k == p] + referencing_objects
         obj = self._shadowed
-        cls = self._db._class_map[type(obj).__name__]
-        slot = self._db._schemaview.induced_slot(p, cls.name)
+        in_range = self._db._slot_range(type(obj), p)
         v = getattr(obj, p)
-        return self._map(v, slot.range)
+        return self._map(v, in_range)
 
     def __getattribute__(self, attribute):
         if attribute == "__dict__":
@@ -232,6 +342,7 @@ class ProxyObject:
         db = self._db
         obj = self._shadowed
         obj_id = db._key(obj)
+        db._index()
         rs = []
         for rel, parent in db._child_to_parent.get(obj_id, []):
             rs.append((rel, db.bless(parent)))
@@ -256,17 +367,15 @@ class ProxyObject:
         if in_range in self._db._class_map:
             # FK reference
             k = (in_range, obj)
-            cache = self._db._source_object_cache
-            if k in cache:
-                source_obj = cache[k]
+            source_obj = self._db._source_object(k)
+            if source_obj is not None:
                 return self._db.bless(source_obj)
             else:
                 module = inspect.getmodule(self._shadowed)
-                cls_dict = dict(inspect.getmembers(module, inspect.isclass))
-                if in_range not in cls_dict:
-                    logger.warning(f"Class {in_range} not found in {module}, classes: {cls_dict}")
+                cls = self._db._python_class(module, in_range)
+                if cls is None:
+                    logger.warning(f"Class {in_range} not found in {module}")
                     return obj
-                cls = cls_dict[in_range]
                 return cls(obj)
         return obj
 
@@ -1,12 +1,11 @@
-import json
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from json_flattener import GlobalConfig, unflatten_from_csv
 from pydantic import BaseModel
 
 from linkml_runtime.linkml_model.meta import SchemaDefinition, SlotDefinitionName
-from linkml_runtime.loaders.json_loader import JSONLoader
-from linkml_runtime.loaders.loader_root import Loader
+from linkml_runtime.loaders.loader_root import Loader, _list_adapter
 from linkml_runtime.utils.boolean_utils import coerce_boolean_values, get_boolean_config, get_boolean_slots
 from linkml_runtime.utils.csvutils import get_configmap
 from linkml_runtime.utils.list_utils import (
@@ -57,11 +56,20 @@ class DelimitedFileLoader(Loader, ABC):
         schemaview: SchemaView | None = None,
         **kwargs,
     ) -> dict | list[dict]:
-        json_str = self._get_json_str_to_load(source, index_slot, schema, schemaview, **kwargs)
-        return JSONLoader().load_as_dict(json_str)
+        objs = list(self._iter_dicts_to_load(source, index_slot, schema, schemaview, **kwargs))
+        return {index_slot: objs} if objs else {}
 
-    def load_any(self, *args, **kwargs) -> YAMLRoot | list[YAMLRoot]:
-        return self.load(*args, **kwargs)
+    def load_any(
+        self,
+        source: str,
+        target_class: type[BaseModel | YAMLRoot],
+        index_slot: SlotDefinitionName = None,
+        schema: SchemaDefinition = None,
+        schemaview: SchemaView | None = None,
+        **kwargs,
+    ) -> BaseModel | YAMLRoot | None:
+        data_as_dict = self.load_as_dict(source, index_slot, schema, schemaview, **kwargs)
+        return self._construct_target_class(data_as_dict, target_class)
 
     def loads(
         self,
@@ -71,23 +79,67 @@ class DelimitedFileLoader(Loader, ABC):
         schema: SchemaDefinition = None,
         schemaview: SchemaView | None = None,
         **kwargs,
-    ) -> str:
-        json_str = self._get_json_str_to_load(input, index_slot, schema, schemaview, **kwargs)
-        return JSONLoader().loads(json_str, target_class=target_class)
+    ) -> BaseModel | YAMLRoot:
+        return self.load(input, target_class, index_slot, schema, schemaview, **kwargs)
 
-    def load(
+    def iter_objects(
         self,
-        source: str,
+        source,
+        target_class: type[BaseModel | YAMLRoot],
+        index_slot: SlotDefinitionName = None,
+        schema: SchemaDefinition = None,
+        schemaview: SchemaView | None = None,
+        **kwargs,
+    ) -> Iterator[BaseModel | YAMLRoot]:
+        """
+        Lazily yield one instance of target_class per row of the delimited file
+
+        Unlike :meth:`load`, ``target_class`` is the class of the rows (the range of
+        ``index_slot``), not the container class. Rows are post-processed and
+        instantiated one at a time, so only a single object is built at once.
+
+        :param source: file name or open file handle
+        :param target_class: class to instantiate for every row
+        :param index_slot: slot of the container class that holds the rows
+        :param schema: schema the data conforms to
+        :param schemaview: SchemaView for the schema; built from ``schema`` if omitted
+        :return: iterator over instances of target_class
+        """
+        is_pydantic = issubclass(target_class, BaseModel)
+        for obj in self._iter_dicts_to_load(source, index_slot, schema, schemaview, **kwargs):
+            yield target_class.model_validate(obj) if is_pydantic else target_class(**obj)
+
+    def load_many(
+        self,
+        source,
         target_class: type[BaseModel | YAMLRoot],
         index_slot: SlotDefinitionName = None,
         schema: SchemaDefinition = None,
         schemaview: SchemaView | None = None,
         **kwargs,
-    ) -> str:
-        json_str = self._get_json_str_to_load(source, index_slot, schema, schemaview, **kwargs)
-        return JSONLoader().loads(json_str, target_class=target_class)
+    ) -> list[BaseModel] | list[YAMLRoot]:
+        """
+        Load the rows of the delimited file as a list of target_class instances
+
+        As with :meth:`iter_objects`, ``target_class`` is the class of the rows.
+        """
+        objs = self._iter_dicts_to_load(source, index_slot, schema, schemaview, **kwargs)
+        if issubclass(target_class, BaseModel):
+            return _list_adapter(target_class).validate_python(list(objs))
+        return [target_class(**obj) for obj in objs]
+
+    def iter_load(
+        self,
+        source,
+        target_class: type[BaseModel | YAMLRoot],
+        index_slot: SlotDefinitionName = None,
+        schema: SchemaDefinition = None,
+        schemaview: SchemaView | None = None,
+        **kwargs,
+    ) -> Iterator[BaseModel | YAMLRoot]:
+        return self.iter_objects(source, target_class, index_slot, schema, schemaview, **kwargs)
 
-    def _get_json_str_to_load(
+    def _iter_dicts_to_load(
         self,
         input,
         index_slot: SlotDefinitionName = None,
@@ -99,7 +151,14 @@ class DelimitedFileLoader(Loader, ABC):
         boolean_truthy: frozenset[str] | None = None,
         boolean_falsy: frozenset[str] | None = None,
         **kwargs,
-    ):
+    ) -> Iterator[dict]:
+        """
+        Yield the rows of the delimited file as cleaned, JSON-compatible dicts
+
+        Each row goes through list whitespace stripping, empty-string coercion,
+        boolean coercion and :meth:`Loader.json_clean` individually; rows that are
+        empty are skipped.
+        """
         if schemaview is None:
             schemaview = SchemaView(schema)
 
@@ -127,16 +186,17 @@ class DelimitedFileLoader(Loader, ABC):
         else:
             objs = unflatten_from_csv(input, config=config, **kwargs)
 
-        if lc.strip_whitespace:
-            objs = [strip_whitespace_from_lists(obj) for obj in objs]
-
-        # Coerce empty strings to null (per Discussion #1996)
-        objs = [_coerce_empty_to_none(obj) for obj in objs]
-
         # Schema-aware boolean coercion: only coerce for slots with range: boolean
         boolean_slots = get_boolean_slots(schemaview, index_slot)
         if boolean_slots:
             bc = get_boolean_config(schemaview, boolean_truthy=boolean_truthy, boolean_falsy=boolean_falsy)
-            objs = [coerce_boolean_values(obj, boolean_slots, bc.truthy_values, bc.falsy_values) for obj in objs]
 
-        return json.dumps({index_slot: objs})
+        for obj in objs:
+            if lc.strip_whitespace:
+                obj = strip_whitespace_from_lists(obj)
+            # Coerce empty strings to null (per Discussion #1996)
+            obj = _coerce_empty_to_none(obj)
+            if boolean_slots:
+                obj = coerce_boolean_values(obj, boolean_slots, bc.truthy_values, bc.falsy_values)
+            if obj:
+                yield self.json_clean(obj)
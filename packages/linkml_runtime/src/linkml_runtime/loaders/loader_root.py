@@ -2,23 +2,38 @@ from __future__ import annotations
 
 import os
 from abc import ABC, abstractmethod
+from functools import cache
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, TextIO
 
 from hbreader import FileInfo, hbread
 from jsonasobj2 import JsonObj, as_dict
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from linkml_runtime import URI_TO_LOCAL
 from linkml_runtime.utils.yamlutils import YAMLRoot
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
 CACHE_SIZE = 1024
 
 
+@cache
+def _list_adapter(target_class: type[BaseModel]) -> TypeAdapter:
+    """A (cached) validator for a list of target_class instances"""
+    return TypeAdapter(list[target_class])
+
+
+def _construct(target_class: type[YAMLRoot | BaseModel], data: dict | JsonObj) -> YAMLRoot | BaseModel:
+    """Construct a single target_class instance from a dictionary"""
+    if issubclass(target_class, BaseModel):
+        return target_class.model_validate(as_dict(data))
+    # as_dict hands plain dictionaries back unchanged -- only JsonObjs need converting
+    return target_class(**(data if type(data) is dict else as_dict(data)))
+
+
 class Loader(ABC):
     @staticmethod
     def json_clean(inp: Any) -> Any:
@@ -88,6 +103,49 @@ class Loader(ABC):
     def load_as_dict(self, *args, **kwargs) -> dict | list[dict]:
         raise NotImplementedError()
 
+    def load_many(
+        self, source: str | dict | TextIO | Path, target_class: type[BaseModel | YAMLRoot], **kwargs
+    ) -> list[BaseModel] | list[YAMLRoot]:
+        """
+        Load source as a list of instances of target_class
+
+        A source holding a single object yields a one element list.  Pydantic targets are validated as a
+        whole, with a single ``TypeAdapter(list[target_class])`` call.
+
+        :param source: source file/text/url to load
+        :param target_class: class of the individual instances
+        :param kwargs: passed to :meth:`load_as_dict`
+        :return: instances of target_class
+        """
+        data_as_dict = self.load_as_dict(source, **kwargs)
+        if not data_as_dict:
+            return []
+        if not isinstance(data_as_dict, list):
+            return [_construct(target_class, data_as_dict)]
+        if issubclass(target_class, BaseModel):
+            return _list_adapter(target_class).validate_python(data_as_dict)
+        return [_construct(target_class, x) for x in data_as_dict]
+
+    def iter_load(
+        self, source: str | dict | TextIO | Path, target_class: type[BaseModel | YAMLRoot], **kwargs
+    ) -> Iterator[BaseModel | YAMLRoot]:
+        """
+        Lazily yield the instances of target_class in source, constructing each one as it is requested
+
+        :param source: source file/text/url to load
+        :param target_class: class of the individual instances
+        :param kwargs: passed to :meth:`load_as_dict`
+        :return: iterator over instances of target_class
+        """
+        data_as_dict = self.load_as_dict(source, **kwargs)
+        if not data_as_dict:
+            return
+        if not isinstance(data_as_dict, list):
+            yield _construct(target_class, data_as_dict)
+            return
+        for x in data_as_dict:
+            yield _construct(target_class, x)
+
     @abstractmethod
     def load_any(
         self,
@@ -141,10 +199,8 @@ class Loader(ABC):
     ) -> BaseModel | YAMLRoot | list[BaseModel] | list[YAMLRoot] | None:
         if data_as_dict:
             if isinstance(data_as_dict, list):
-                if issubclass(target_class, YAMLRoot):
-                    return [target_class(**as_dict(x)) for x in data_as_dict]
-                if issubclass(target_class, BaseModel):
-                    return [target_class.model_validate(as_dict(x)) for x in data_as_dict]
+                if issubclass(target_class, YAMLRoot | BaseModel):
+                    return [_construct(target_class, x) for x in data_as_dict]
                 msg = f"Cannot load list of {target_class}"
                 raise ValueError(msg)
             if isinstance(data_as_dict, dict):
@@ -1,9 +1,10 @@
 import logging
 import urllib
-from copy import copy
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import Any, TextIO
+from typing import Any, NamedTuple, TextIO
 
+import pyoxigraph as ox
 from curies import Converter
 from hbreader import FileInfo
 from pydantic import BaseModel
@@ -21,7 +22,10 @@ from linkml_runtime.linkml_model import (
 )
 from linkml_runtime.loaders.loader_root import Loader
 from linkml_runtime.utils.formatutils import underscore
+from linkml_runtime.utils.namespaces import Namespaces
+from linkml_runtime.utils.oxigraph_store import OxigraphGraph
 from linkml_runtime.utils.schemaview import SchemaView
+from linkml_runtime.utils.uri_validator import validate_uri
 from linkml_runtime.utils.yamlutils import YAMLRoot
 
 logger = logging.getLogger(__name__)
@@ -36,6 +40,139 @@ class Pointer:
     obj: str
 
 
+class _SlotPlan(NamedTuple):
+    """How the objects of one predicate are read into one attribute of a class"""
+
+    slot: SlotDefinition
+    name: str
+    range_elements: list[ClassDefinitionName]
+    inlined: bool
+    range_class: ClassDefinitionName | None
+    """Range of the slot, if it is a class"""
+    range_id_slot: tuple[SlotDefinition | None, bool] | None
+    """Identifier slot of the range class and whether it is percent encoded, see _LoadPlan.id_slot"""
+    enum_meanings: dict[str, str]
+    """Text of the permissible values of the enums in the range, by their meaning"""
+
+
+class _LoadPlan:
+    """
+    The schema lookups needed to read a graph into instances
+
+    Induced slots, ranges, identifier slots and enum meanings are resolved once per predicate and class
+    and reused for every triple of the graph.
+    """
+
+    def __init__(self, schemaview: SchemaView) -> None:
+        self.schemaview = schemaview
+        self.namespaces = schemaview.namespaces()
+        self.classes = schemaview.all_classes()
+        self.uri_to_slot: dict[URIRef, SlotDefinition] = {
+            URIRef(schemaview.get_uri(s, expand=True)): s for s in schemaview.all_slots().values()
+        }
+        self.uri_to_class_map: dict[str, ClassDefinition] = {}
+        for cn, c in self.classes.items():
+            uri = schemaview.get_uri(c, expand=True)
+            if uri in self.uri_to_class_map:
+                c2 = self.uri_to_class_map[uri]
+                if c2.name in schemaview.class_ancestors(cn):
+                    continue
+                else:
+                    logger.error(f"Inconsistent URI to class map: {uri} -> {c2.name}, {c.name}")
+            self.uri_to_class_map[uri] = c
+        self._slots: dict[tuple[URIRef, ClassDefinitionName], _SlotPlan] = {}
+        self._id_slots: dict[ClassDefinitionName, tuple[SlotDefinition | None, bool]] = {}
+        self._type_designators: dict[ClassDefinitionName, URIRef | None] = {}
+        self._uri_bases: list[tuple[str, str]] | None = None
+
+    def slot(self, p: URIRef, cn: ClassDefinitionName) -> _SlotPlan:
+        """Return the plan for the objects of predicate p on instances of cn; p must be in uri_to_slot"""
+        plan = self._slots.get((p, cn))
+        if plan is None:
+            schemaview = self.schemaview
+            slot = schemaview.induced_slot(self.uri_to_slot[p].name, cn)
+            range_elements = schemaview.slot_applicable_range_elements(slot)
+            range_class = slot.range if slot.range in self.classes else None
+            enum_meanings = {}
+            if EnumDefinition.class_name in range_elements:
+                enums = schemaview.all_enums()
+                for enum_name in reversed(schemaview.slot_range_as_union(slot)):
+                    if enum_name not in enums:
+                        continue
+                    e = schemaview.get_enum(enum_name)
+                    if e is None:
+                        raise ValueError(f"no enum found for {slot.range}")
+                    # the first permissible value with a meaning wins, as does the first enum of the range
+                    for pv in reversed(e.permissible_values.values()):
+                        if pv.meaning is not None:
+                            enum_meanings[pv.meaning] = pv.text
+            plan = self._slots[(p, cn)] = _SlotPlan(
+                slot,
+                underscore(slot.name),
+                range_elements,
+                schemaview.is_inlined(slot),
+                range_class,
+                self.id_slot(range_class) if range_class else None,
+                enum_meanings,
+            )
+        return plan
+
+    def id_slot(self, cn: ClassDefinitionName) -> tuple[SlotDefinition | None, bool]:
+        """Return the identifier slot of cn and whether its values are percent encoded"""
+        if cn not in self._id_slots:
+            id_slot = self.schemaview.get_identifier_slot(cn)
+            self._id_slots[cn] = (id_slot, bool(id_slot) and bool(self.schemaview.is_slot_percent_encoded(id_slot)))
+        return self._id_slots[cn]
+
+    def type_designator(self, cn: ClassDefinitionName) -> URIRef | None:
+        """Return the predicate of the type designator slot of cn, if any"""
+        if cn not in self._type_designators:
+            type_designator_slot = self.schemaview.get_type_designator_slot(cn)
+            self._type_designators[cn] = (
+                URIRef(self.schemaview.get_uri(type_designator_slot, expand=True)) if type_designator_slot else None
+            )
+        return self._type_designators[cn]
+
+    def id_dict(self, node: VALID_SUBJECT, cn: ClassDefinitionName) -> ANYDICT:
+        id_slot, percent_encoded = self.id_slot(cn)
+        if not isinstance(node, BNode):
+            if id_slot is None:
+                raise Exception(f"no slot found for {cn}: bnode={node}")
+            id_val = self.uri_to_id(node, percent_encoded)
+            if id_val is None:
+                id_val = str(node)
+            return {id_slot.name: id_val}
+        else:
+            if id_slot is not None:
+                raise Exception(f"Unexpected blank node {node}, type {cn} expects {id_slot.name} identifier")
+            return {}
+
+    def uri_to_id(self, node: VALID_SUBJECT, percent_encoded: bool) -> str:
+        if percent_encoded:
+            return urllib.parse.unquote(node).replace(self.namespaces._base, "")
+        else:
+            return self.curie_for(node)
+
+    def curie_for(self, uri: URIRef) -> str | None:
+        """Same as Namespaces.curie_for, with the namespaces sorted once by decreasing length of their URI"""
+        if self._uri_bases is None:
+            # namespaces must not change after this point; prefix maps are applied before the first triple
+            uri_bases = [(str(uri_base), namespace) for namespace, uri_base in self.namespaces.items()]
+            self._uri_bases = sorted([b for b in uri_bases if b[0]], key=lambda b: -len(b[0]))
+        if not validate_uri(uri):
+            return self.namespaces.curie_for(uri)  # raises the usual error
+        uri_string = str(uri)
+        for uri_base, namespace in self._uri_bases:
+            if uri_string.startswith(uri_base):
+                if namespace == Namespaces._default_key:
+                    return uri_string.replace(uri_base, ":")
+                elif namespace == Namespaces._base_key:
+                    return uri_string.replace(uri_base, "")
+                else:
+                    return uri_string.replace(uri_base, namespace + ":")
+        return None
+
+
 class RDFLibLoader(Loader):
     """
     Loads objects from rdflib Graphs into the python target_class structure
@@ -45,7 +182,7 @@ class RDFLibLoader(Loader):
 
     def from_rdf_graph(
         self,
-        graph: Graph,
+        graph: Graph | OxigraphGraph,
         schemaview: SchemaView,
         target_class: type[BaseModel | YAMLRoot],
         prefix_map: dict[str, str] | Converter | None = None,
@@ -57,25 +194,45 @@ class RDFLibLoader(Loader):
         Loads objects from graph into lists of the python target_class structure,
         recursively walking RDF graph from instances of target_class.
 
-        :param graph: rdflib Graph that holds instances of target_class
+        :param graph: rdflib Graph, or graph of a pyoxigraph Store, that holds instances of target_class
         :param schemaview: schema to which graph conforms
         :param target_class: class which root nodes should instantiate
         :param prefix_map: additional prefix mappings for data objects
         :param ignore_unmapped_predicates: if True then a predicate that has no mapping to a slot does not raise an error
         :return: all instances of target class type
         """
+        return list(
+            self.iter_rdf_graph(
+                graph,
+                schemaview,
+                target_class,
+                prefix_map=prefix_map,
+                cast_literals=cast_literals,
+                allow_unprocessed_triples=allow_unprocessed_triples,
+                ignore_unmapped_predicates=ignore_unmapped_predicates,
+            )
+        )
+
+    def iter_rdf_graph(
+        self,
+        graph: Graph | OxigraphGraph,
+        schemaview: SchemaView,
+        target_class: type[BaseModel | YAMLRoot],
+        prefix_map: dict[str, str] | Converter | None = None,
+        cast_literals: bool = True,
+        allow_unprocessed_triples: bool = True,
+        ignore_unmapped_predicates: bool = False,
+    ) -> Iterator[BaseModel | YAMLRoot]:
+        """
+        Yield the instances of target_class in graph one at a time, see :meth:`from_rdf_graph`
+
+        The tree of each instance is walked and released before the next one, so memory use does not grow
+        with the number of instances.  Nodes shared by several instances are walked once for each of them.
+        Unprocessed triples are only detected, and reported, after the last instance.
+        """
         schemaview.imports_closure()  # ensure all imported sub-schemas are in schema_map before namespaces() caches
-        namespaces = schemaview.namespaces()
-        uri_to_class_map = {}
-        for cn, c in schemaview.all_classes().items():
-            uri = schemaview.get_uri(c, expand=True)
-            if uri in uri_to_class_map:
-                c2 = uri_to_class_map[uri]
-                if c2.name in schemaview.class_ancestors(cn):
-                    continue
-                else:
-                    logger.error(f"Inconsistent URI to class map: {uri} -> {c2.name}, {c.name}")
-            uri_to_class_map[uri] = c
+        plan = _LoadPlan(schemaview)
+        namespaces = plan.namespaces
         # data prefix map: supplements or overrides existing schema prefix map
         if isinstance(prefix_map, Converter):
             # TODO replace with `prefix_map = prefix_map.bimap` after making minimum requirement on python 3.8
@@ -87,129 +244,144 @@ class RDFLibLoader(Loader):
                 else:
                     namespaces[k] = v
                     graph.namespace_manager.bind(k, URIRef(v))
-        # Step 1: Create stub root dict-objects
+        # Step 1: find the root subjects
         target_class_uriref: URIRef = target_class.class_class_uri
-        root_dicts: list[ANYDICT] = []
         root_subjects: list[VALID_SUBJECT] = list(graph.subjects(RDF.type, target_class_uriref))
+        root_subject_set: set[VALID_SUBJECT] = set(root_subjects)
         logger.debug(f"ROOTS = {root_subjects}")
-        # Step 2: walk RDF graph starting from root subjects, constructing dict tree
-        node_tuples_to_visit: list[tuple[VALID_SUBJECT, ClassDefinitionName]]  ## nodes and their type still to visit
-        node_tuples_to_visit = [(subject, target_class.class_name) for subject in root_subjects]
-        uri_to_slot: dict[str, SlotDefinition]  ## lookup table for RDF predicates -> slots
-        uri_to_slot = {URIRef(schemaview.get_uri(s, expand=True)): s for s in schemaview.all_slots().values()}
-        processed: set[VALID_SUBJECT] = set()  ## track nodes already visited, or already scheduled
-        for n, _ in node_tuples_to_visit:
-            processed.add(n)
-        obj_map: dict[VALID_SUBJECT, ANYDICT] = {}  ## map from an RDF node to its dict representation
         unmapped_predicates = set()
-        processed_triples: set[tuple] = set()
-        while len(node_tuples_to_visit) > 0:
-            subject, subject_class = node_tuples_to_visit.pop()
-            processed.add(subject)
-            dict_obj = self._get_id_dict(subject, schemaview, subject_class)
-            if subject in root_subjects:
-                root_dicts.append(dict_obj)
-            obj_map[subject] = dict_obj
-            type_designator_slot = schemaview.get_type_designator_slot(subject_class)
-            if type_designator_slot:
-                td_iri = schemaview.get_uri(type_designator_slot, expand=True)
-                type_vals = list(graph.objects(subject, URIRef(td_iri)))
-                if len(type_vals) > 0:
-                    type_classes = [uri_to_class_map[str(x)] for x in type_vals]
-                    if len(type_classes) > 1:
-                        raise ValueError(f"Ambiguous types for {subject} == {type_classes}")
-                    logger.info(f"Replacing {subject_class} with {type_classes}")
-                    subject_class = type_classes[0].name
-            # process all triples for this node
-            for _, p, o in graph.triples((subject, None, None)):
-                processed_triples.add((subject, p, o))
-                logger.debug(f" Processing triple {subject} {p} {o}, subject type = {subject_class}")
-                if p == RDF.type:
-                    logger.debug(
-                        f"Ignoring RDF.type for {subject} {o}, we automatically infer this from {subject_class}"
-                    )
-                elif p not in uri_to_slot:
-                    if ignore_unmapped_predicates:
-                        unmapped_predicates.add(p)
+        visited: set[VALID_SUBJECT] = set()  ## nodes whose triples have been counted as processed
+        n_processed_triples = 0
+        for root_subject in reversed(root_subjects):
+            # Step 2: walk RDF graph starting from the root subject, constructing dict tree
+            ## nodes and their type still to visit
+            node_tuples_to_visit: list[tuple[VALID_SUBJECT, ClassDefinitionName]] = [
+                (root_subject, target_class.class_name)
+            ]
+            processed: set[VALID_SUBJECT] = {root_subject}  ## track nodes already visited, or already scheduled
+            obj_map: dict[VALID_SUBJECT, ANYDICT] = {}  ## map from an RDF node to its dict representation
+            root_dict = None
+            while len(node_tuples_to_visit) > 0:
+                subject, subject_class = node_tuples_to_visit.pop()
+                processed.add(subject)
+                dict_obj = plan.id_dict(subject, subject_class)
+                if subject == root_subject:
+                    root_dict = dict_obj
+                obj_map[subject] = dict_obj
+                count_triples = subject not in visited
+                visited.add(subject)
+                td_iri = plan.type_designator(subject_class)
+                if td_iri:
+                    type_vals = list(graph.objects(subject, td_iri))
+                    if len(type_vals) > 0:
+                        type_classes = [plan.uri_to_class_map[str(x)] for x in type_vals]
+                        if len(type_classes) > 1:
+                            raise ValueError(f"Ambiguous types for {subject} == {type_classes}")
+                        logger.info(f"Replacing {subject_class} with {type_classes}")
+                        subject_class = type_classes[0].name
+                # process all triples for this node
+                for _, p, o in graph.triples((subject, None, None)):
+                    if count_triples:
+                        n_processed_triples += 1
+                    logger.debug(f" Processing triple {subject} {p} {o}, subject type = {subject_class}")
+                    if p == RDF.type:
+                        logger.debug(
+                            f"Ignoring RDF.type for {subject} {o}, we automatically infer this from {subject_class}"
+                        )
+                    elif p not in plan.uri_to_slot:
+                        if ignore_unmapped_predicates:
+                            unmapped_predicates.add(p)
+                        else:
+                            raise MappingError(f"No pred for {p} {type(p)}")
                     else:
-                        raise MappingError(f"No pred for {p} {type(p)}")
-                else:
-                    slot = schemaview.induced_slot(uri_to_slot[p].name, subject_class)
-                    range_applicable_elements = schemaview.slot_applicable_range_elements(slot)
-                    is_inlined = schemaview.is_inlined(slot)
-                    slot_name = underscore(slot.name)
-                    if isinstance(o, Literal):
-                        if EnumDefinition.class_name in range_applicable_elements:
-                            logger.debug(f"Assuming no meaning assigned for value {o} for Enum {slot.range}")
-                        elif TypeDefinition.class_name not in range_applicable_elements:
-                            raise ValueError(
-                                f"Cannot map Literal {o} to a slot {slot.name} whose range {slot.range} is not a type;"
-                            )
-                        v = o.value
-                    elif isinstance(o, BNode):
-                        if not is_inlined:
-                            logger.error(f"blank nodes should be inlined; {slot_name}={o} in {subject}")
-                        v = Pointer(o)
-                    else:
-                        if ClassDefinition.class_name in range_applicable_elements:
-                            if slot.range in schemaview.all_classes():
-                                id_slot = schemaview.get_identifier_slot(slot.range)
-                                v = self._uri_to_id(o, id_slot, schemaview)
-                            else:
-                                v = namespaces.curie_for(o)
-                            if v is None:
-                                logger.debug(f"No CURIE for {p}={o} in {subject} [{subject_class}]")
-                                v = str(o)
-                        elif EnumDefinition.class_name in range_applicable_elements:
-                            range_union_elements = schemaview.slot_range_as_union(slot)
-                            enum_names = [e for e in range_union_elements if e in schemaview.all_enums()]
-                            # if a PV has a meaning URI declared, map this
-                            # back to a text representation
-                            v = namespaces.curie_for(o)
-                            for enum_name in enum_names:
-                                e = schemaview.get_enum(enum_name)
-                                if e is None:
-                                    raise ValueError(f"no enum found for {slot.range}: {o} (ns={v})")
-                                for pv in e.permissible_values.values():
-                                    if v == pv.meaning or str(o) == pv.meaning:
-                                        v = pv.text
-                                        break
-                        elif TypeDefinition.class_name in range_applicable_elements:
-                            if cast_literals:
-                                v = namespaces.curie_for(o)
-                                if v is None:
-                                    v = str(o)
-                                logger.debug(f"Casting {o} to string")
-                            else:
+                        slot_plan = plan.slot(p, subject_class)
+                        slot = slot_plan.slot
+                        range_applicable_elements = slot_plan.range_elements
+                        slot_name = slot_plan.name
+                        if isinstance(o, Literal):
+                            if EnumDefinition.class_name in range_applicable_elements:
+                                logger.debug(f"Assuming no meaning assigned for value {o} for Enum {slot.range}")
+                            elif TypeDefinition.class_name not in range_applicable_elements:
                                 raise ValueError(
-                                    f"Expected literal value ({range_applicable_elements}) for {slot_name}={o}"
+                                    f"Cannot map Literal {o} to a slot {slot.name} whose range {slot.range} is not a type;"
                                 )
-                        if is_inlined:
-                            # the object of the triple may not yet be processed;
-                            # we store a pointer to o, and then replace this later
+                            v = o.value
+                        elif isinstance(o, BNode):
+                            if not slot_plan.inlined:
+                                logger.error(f"blank nodes should be inlined; {slot_name}={o} in {subject}")
                             v = Pointer(o)
-                    if slot.multivalued:
-                        if slot_name not in dict_obj:
-                            dict_obj[slot_name] = []
-                        dict_obj[slot_name].append(v)
-                    else:
-                        dict_obj[slot_name] = v
-                    if o not in processed:
-                        # if o instantiates a class, add to list of nodes to be visited.
-                        # force type based on range constraint
-                        if slot.range in schemaview.all_classes():
-                            node_tuples_to_visit.append((o, ClassDefinitionName(slot.range)))
+                        else:
+                            if ClassDefinition.class_name in range_applicable_elements:
+                                if slot_plan.range_class:
+                                    v = plan.uri_to_id(o, slot_plan.range_id_slot[1])
+                                else:
+                                    v = plan.curie_for(o)
+                                if v is None:
+                                    logger.debug(f"No CURIE for {p}={o} in {subject} [{subject_class}]")
+                                    v = str(o)
+                            elif EnumDefinition.class_name in range_applicable_elements:
+                                # if a PV has a meaning URI declared, map this
+                                # back to a text representation
+                                v = plan.curie_for(o)
+                                enum_meanings = slot_plan.enum_meanings
+                                if v in enum_meanings:
+                                    v = enum_meanings[v]
+                                elif str(o) in enum_meanings:
+                                    v = enum_meanings[str(o)]
+                            elif TypeDefinition.class_name in range_applicable_elements:
+                                if cast_literals:
+                                    v = plan.curie_for(o)
+                                    if v is None:
+                                        v = str(o)
+                                    logger.debug(f"Casting {o} to string")
+                                else:
+                                    raise ValueError(
+                                        f"Expected literal value ({range_applicable_elements}) for {slot_name}={o}"
+                                    )
+                            if slot_plan.inlined:
+                                # the object of the triple may not yet be processed;
+                                # we store a pointer to o, and then replace this later
+                                v = Pointer(o)
+                        if slot.multivalued:
+                            if slot_name not in dict_obj:
+                                dict_obj[slot_name] = []
+                            dict_obj[slot_name].append(v)
+                        else:
+                            dict_obj[slot_name] = v
+                        if (
+                            o not in processed
+                            and slot_plan.range_class
+                            and (isinstance(v, Pointer) or o not in visited)
+                        ):
+                            # if o instantiates a class, add to list of nodes to be visited.
+                            # force type based on range constraint, unless o is itself a root.
+                            # References that are not inlined are only walked once over all roots
+                            processed.add(o)
+                            if o in root_subject_set:
+                                node_tuples_to_visit.append((o, target_class.class_name))
+                            else:
+                                node_tuples_to_visit.append((o, ClassDefinitionName(slot_plan.range_class)))
+
+            # Step 3: replace inline pointers with object dicts
+            self._replace_pointers(graph, root_dict, obj_map)
+            # Final step: translate dict into an instance of target_class
+            yield target_class(**root_dict)
+
         if unmapped_predicates:
             logger.info(f"Unmapped predicated: {unmapped_predicates}")
-        unprocessed_triples = set(graph.triples((None, None, None))) - processed_triples
-        logger.info(f"Triple processed = {len(processed_triples)}, unprocessed = {len(unprocessed_triples)}")
-        if len(unprocessed_triples) > 0:
+        n_unprocessed_triples = len(graph) - n_processed_triples
+        logger.info(f"Triple processed = {n_processed_triples}, unprocessed = {n_unprocessed_triples}")
+        if n_unprocessed_triples > 0:
             if not allow_unprocessed_triples:
-                for t in unprocessed_triples:
-                    logger.warning(f"  Unprocessed: {t}")
-                raise ValueError(f"Unprocessed triples: {len(unprocessed_triples)}")
+                for t in graph.triples((None, None, None)):
+                    if t[0] not in visited:
+                        logger.warning(f"  Unprocessed: {t}")
+                raise ValueError(f"Unprocessed triples: {n_unprocessed_triples}")
 
-        # Step 2: replace inline pointers with object dicts
+    @staticmethod
+    def _replace_pointers(
+        graph: Graph | OxigraphGraph, root_dict: ANYDICT, obj_map: dict[VALID_SUBJECT, ANYDICT]
+    ) -> None:
         def repl(v):
             if isinstance(v, Pointer):
                 v2 = obj_map.get(v.obj)
@@ -226,7 +398,7 @@ class RDFLibLoader(Loader):
             else:
                 return v
 
-        objs_to_visit: list[ANYDICT] = copy(root_dicts)
+        objs_to_visit: list[ANYDICT] = [root_dict]
         while len(objs_to_visit) > 0:
             obj = objs_to_visit.pop()
             logger.debug(f"Replacing pointers for  {obj}")
@@ -243,33 +415,10 @@ class RDFLibLoader(Loader):
                     if isinstance(v, dict):
                         objs_to_visit.append(v)
                 obj[k] = v
-        # Final step: translate dicts into instances of target_class
-        return [target_class(**x) for x in root_dicts]
-
-    def _get_id_dict(self, node: VALID_SUBJECT, schemaview: SchemaView, cn: ClassDefinitionName) -> ANYDICT:
-        id_slot = schemaview.get_identifier_slot(cn)
-        if not isinstance(node, BNode):
-            if id_slot is None:
-                raise Exception(f"no slot found for {cn}: bnode={node}")
-            id_val = self._uri_to_id(node, id_slot, schemaview)
-            # id_val = schemaview.namespaces().curie_for(node)
-            if id_val is None:
-                id_val = str(node)
-            return {id_slot.name: id_val}
-        else:
-            if id_slot is not None:
-                raise Exception(f"Unexpected blank node {node}, type {cn} expects {id_slot.name} identifier")
-            return {}
-
-    def _uri_to_id(self, node: VALID_SUBJECT, id_slot: SlotDefinition, schemaview: SchemaView) -> str:
-        if schemaview.is_slot_percent_encoded(id_slot):
-            return urllib.parse.unquote(node).replace(schemaview.namespaces()._base, "")
-        else:
-            return schemaview.namespaces().curie_for(node)
 
     def load(
         self,
-        source: str | TextIO | Graph,
+        source: str | TextIO | Graph | ox.Store,
         target_class: type[BaseModel | YAMLRoot],
         *,
         schemaview: SchemaView = None,
@@ -284,7 +433,7 @@ class RDFLibLoader(Loader):
         The assumption of all loaders is that the source contains exactly one instance of the
         target class. To load from graphs with multiple instances, use from_rdf_graph
 
-        :param source: RDF data source. Can be a file name, an open handle or an existing graph
+        :param source: RDF data source. Can be a file name, an open handle, an existing graph or a pyoxigraph Store
         :param target_class: LinkML class to load the RDF into
         :param schemaview: view over schema to guide instantiation
         :param prefix_map: map of prefixes used in data
@@ -293,18 +442,71 @@ class RDFLibLoader(Loader):
         :param kwargs: additional arguments passed to from_rdf_graph
         :return: Instance of target_class
         """
+        objs = self.load_many(
+            source, target_class, schemaview=schemaview, prefix_map=prefix_map, fmt=fmt, metadata=metadata, **kwargs
+        )
+        if len(objs) != 1:
+            raise DataNotFoundError(f"Got {len(objs)} of type {target_class} from source, expected exactly 1")
+        return objs[0]
+
+    def load_many(
+        self,
+        source: str | TextIO | Graph | ox.Store,
+        target_class: type[BaseModel | YAMLRoot],
+        *,
+        schemaview: SchemaView = None,
+        prefix_map: dict[str, str] | Converter | None = None,
+        fmt: str | None = "turtle",
+        metadata: FileInfo | None = None,
+        **kwargs,
+    ) -> list[BaseModel] | list[YAMLRoot]:
+        """
+        Load all the instances of target_class in the RDF in source
+
+        :param source: RDF data source. Can be a file name, an open handle, an existing graph or a pyoxigraph Store
+        :param target_class: LinkML class to load the RDF into
+        :param schemaview: view over schema to guide instantiation
+        :param prefix_map: map of prefixes used in data
+        :param fmt: format of source if it isn't an existing Graph
+        :param metadata: source information. Used by some loaders to record where information came from
+        :param kwargs: additional arguments passed to from_rdf_graph
+        :return: Instances of target_class
+        """
+        return list(
+            self.iter_load(
+                source, target_class, schemaview=schemaview, prefix_map=prefix_map, fmt=fmt, metadata=metadata, **kwargs
+            )
+        )
+
+    def iter_load(
+        self,
+        source: str | TextIO | Graph | ox.Store,
+        target_class: type[BaseModel | YAMLRoot],
+        *,
+        schemaview: SchemaView = None,
+        prefix_map: dict[str, str] | Converter | None = None,
+        fmt: str | None = "turtle",
+        metadata: FileInfo | None = None,
+        **kwargs,
+    ) -> Iterator[BaseModel | YAMLRoot]:
+        """
+        Yield the instances of target_class in the RDF in source one at a time, see :meth:`iter_rdf_graph`
+
+        Parameters are those of :meth:`load_many`
+        """
         if isinstance(source, Graph):
             g = source
+        elif isinstance(source, ox.Store):
+            g = OxigraphGraph(source)
         else:
             g = Graph()
             if "\n" in source:
                 g.parse(data=source, format=fmt)
             else:
                 g.parse(source, format=fmt)
-        objs = self.from_rdf_graph(g, schemaview=schemaview, target_class=target_class, prefix_map=prefix_map, **kwargs)
-        if len(objs) != 1:
-            raise DataNotFoundError(f"Got {len(objs)} of type {target_class} from source, expected exactly 1")
-        return objs[0]
+        yield from self.iter_rdf_graph(
+            g, schemaview=schemaview, target_class=target_class, prefix_map=prefix_map, **kwargs
+        )
 
     def loads(self, source: str, **kwargs) -> BaseModel | YAMLRoot:
         return self.load(source, **kwargs)
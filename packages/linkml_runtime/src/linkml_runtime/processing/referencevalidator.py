@@ -8,15 +8,20 @@ See:
 
 import datetime
 import decimal
+import json
 import re
 import sys
 import warnings
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Any, TextIO
+from io import StringIO
+from itertools import islice, repeat
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
 
 import click
 import yaml
@@ -37,6 +42,7 @@ from linkml_runtime.linkml_model.meta import (
     ClassDefinitionName,
     ClassRule,
 )
+from linkml_runtime.loaders import tsv_loader
 from linkml_runtime.processing.validation_datamodel import (
     ConstraintType,
     ValidationConfiguration,
@@ -311,6 +317,33 @@ def _simple_to_dict(obj: dict | Any, simple_value_slot_name: str) -> dict:
     return {simple_value_slot_name: obj}
 
 
+class _SlotPlan(NamedTuple):
+    """How values of a slot are normalized, resolved once from the derived schema"""
+
+    slot: SlotDefinition
+    range_element: Element | None
+    form: CollectionForm
+    pk_slot_name: SlotDefinitionName | None
+    simple_dict_value_slot: SlotDefinition | None
+    has_expression: bool
+    """True if values must be checked against the slot as a slot expression"""
+
+
+class _ClassPlan(NamedTuple):
+    """How instances of a class are normalized, resolved once from the derived schema"""
+
+    is_any: bool
+    slots: dict[SlotDefinitionName, _SlotPlan]
+    slot_names: dict[str, SlotDefinitionName]
+    """Slot names, by slot name and alias"""
+    presence_checks: list[tuple[SlotDefinition, str]]
+    """Slots that are required, recommended or designate the type, with their key in input objects"""
+    classification_rules: list[tuple[ClassDefinition, list[AnonymousClassExpression]]]
+    """Classification rules of the descendants of the class, in order"""
+    rules: list[ClassRule]
+    identifier_slot: SlotDefinition | None
+
+
 @dataclass
 class ReferenceValidator:
     """
@@ -352,6 +385,10 @@ class ReferenceValidator:
     expand_all: bool = None
     """If True, then expand all SimpleDict and CompactDict objects to ExpandedDicts"""
 
+    _class_plans: dict[ClassDefinitionName, _ClassPlan] = field(default_factory=dict, init=False, repr=False)
+    _python_types: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _permissible_values: dict[str, frozenset] = field(default_factory=dict, init=False, repr=False)
+
     def __post_init__(self):
         self.derived_schema = self.schemaview.materialize_derived_schema()
 
@@ -387,6 +424,36 @@ class ReferenceValidator:
             report = Report()
         return self.normalize_slot_value(input_object, parent_slot, report)
 
+    def normalize_iter(
+        self,
+        input_objects: Iterable[Any],
+        target: str | None = None,
+        report: Report | None = None,
+    ) -> Iterator[Any]:
+        """
+        Normalize instances one at a time, e.g. the items of an index slot read from a JSONL file
+
+        :param input_objects: instances of the target
+        :param target:
+        :param report: combines the results for all instances
+        :return: normalized instances, in order
+        """
+        if report is None:
+            report = Report()
+        # the index slot only depends on whether instances are lists, dicts or atoms
+        plans = {}
+        for input_object in input_objects:
+            if isinstance(input_object, list):
+                kind = list
+            elif input_object is None or isinstance(input_object, dict):
+                kind = dict
+            else:
+                kind = object
+            plan = plans.get(kind)
+            if plan is None:
+                plan = plans[kind] = self._slot_plan(self._create_index_slot(target, input_object))
+            yield self._normalize_slot_value(input_object, plan, report)
+
     def _create_index_slot(self, target: str | None = None, input_object: Any = None) -> SlotDefinition:
         """
         Create a parent slot that points at the target element.
@@ -414,15 +481,14 @@ class ReferenceValidator:
         return roots[0]
 
     def normalize_slot_value(self, input_object: Any, parent_slot: SlotDefinition, report: Report) -> Any:
-        pk_slot_name = None
-        range_element = self._slot_range_element(parent_slot)
+        return self._normalize_slot_value(input_object, self._slot_plan(parent_slot), report)
+
+    def _normalize_slot_value(self, input_object: Any, plan: _SlotPlan, report: Report) -> Any:
+        parent_slot = plan.slot
         # Infer collection form, and normalize to this form, if necessary
-        form = self.infer_slot_collection_form(parent_slot)
         normalized_object = copy(input_object)
-        if isinstance(range_element, ClassDefinition):
-            pk_slot_name = self._identifier_slot_name(range_element)
         normalized_object = self.normalize_to_collection_form(
-            form, normalized_object, parent_slot, pk_slot_name, report
+            plan.form, normalized_object, parent_slot, plan.pk_slot_name, report
         )
         # Validate
         new_report = Report()
@@ -434,12 +500,10 @@ class ReferenceValidator:
                 parent_slot.range,
                 str(input_object),
             )
-        simple_dict_value_slot = self._slot_as_simple_dict_value_slot(parent_slot)
+        simple_dict_value_slot = plan.simple_dict_value_slot
         if isinstance(normalized_object, dict) and parent_slot.multivalued:
             if not simple_dict_value_slot:
-                output_object = {
-                    k: self.normalize_instance(v, parent_slot, new_report) for k, v in normalized_object.items()
-                }
+                output_object = {k: self._normalize_instance(v, plan, new_report) for k, v in normalized_object.items()}
             else:
                 output_object = {
                     k: self.normalize_instance(v, simple_dict_value_slot, new_report)
@@ -448,10 +512,10 @@ class ReferenceValidator:
         elif _is_list_of_lists(normalized_object):
             raise NotImplementedError(f"List of Lists: {normalized_object}")
         elif isinstance(normalized_object, list):
-            output_object = [self.normalize_instance(v, parent_slot, new_report) for v in normalized_object]
+            output_object = [self._normalize_instance(v, plan, new_report) for v in normalized_object]
         else:
             # normalize an instance
-            output_object = self.normalize_instance(normalized_object, parent_slot, new_report)
+            output_object = self._normalize_instance(normalized_object, plan, new_report)
         report.combine(new_report)
         return output_object
 
@@ -701,7 +765,11 @@ class ReferenceValidator:
         return normalized_object
 
     def normalize_instance(self, input_object: Any, parent_slot: SlotDefinition, report: Report) -> Any:
-        range_element = self._slot_range_element(parent_slot)
+        return self._normalize_instance(input_object, self._slot_plan(parent_slot), report)
+
+    def _normalize_instance(self, input_object: Any, plan: _SlotPlan, report: Report) -> Any:
+        parent_slot = plan.slot
+        range_element = plan.range_element
         if input_object is None:
             return None
         if isinstance(range_element, ClassDefinition):
@@ -726,7 +794,7 @@ class ReferenceValidator:
             return input_object
 
     def normalize_reference(self, input_object: dict, target: ClassDefinition, report: Report) -> dict:
-        pk_slot = self._identifier_slot(target)
+        pk_slot = self._class_plan(target).identifier_slot
         if pk_slot is None:
             raise AssertionError(f"Cannot normalize: no primary key for {target.name}")
         return self.normalize_type(input_object, self.derived_schema.types.get(pk_slot.range, None), report)
@@ -734,14 +802,14 @@ class ReferenceValidator:
     def normalize_object(self, input_object: dict, target: ClassDefinition, report: Report) -> dict:
         if not isinstance(input_object, dict):
             raise AssertionError(f"Cannot normalize: expected dict, got {type(input_object)} for {input_object}")
-        if target.class_uri == "linkml:Any":
+        plan = self._class_plan(target)
+        if plan.is_any:
             # Nothing to normalize against, take the input as it is
             return input_object
         output_object = {}
         # Induced slot
-        for slot in target.attributes.values():
+        for slot, slot_key in plan.presence_checks:
             # TODO: required slots MUST be present UNLESS this is a CompactDict
-            slot_key = slot.alias or slot.name
             if slot.required and slot_key not in input_object and not (slot.identifier or slot.key):
                 report.add_problem(
                     ConstraintType.RequiredConstraint,
@@ -767,22 +835,15 @@ class ReferenceValidator:
                     )
                 target = new_target
         # deepen using classification rules
-        for desc_cn in self.schemaview.class_descendants(target.name, reflexive=False):
-            desc = self.derived_schema.classes[desc_cn]
-            for expr in desc.classification_rules:
+        for desc, classification_rules in self._class_plan(target).classification_rules:
+            for expr in classification_rules:
                 if self._matches_class_expression(input_object, target, expr):
                     target = desc
                     break
+        plan = self._class_plan(target)
         # Descend into slot values
         for k, v in input_object.items():
-            actual_k = None
-            if k in target.attributes:
-                actual_k = k
-            else:
-                for a in target.attributes.values():
-                    if a.alias == k:
-                        actual_k = a.name
-                        break
+            actual_k = plan.slot_names.get(k)
             if actual_k is None:
                 report.add_problem(
                     ConstraintType.ClosedClassConstraint,
@@ -793,16 +854,21 @@ class ReferenceValidator:
                 if not self.filter_invalid_objects:
                     output_object[k] = v
                 continue
-            slot = target.attributes[actual_k]
-            output_object[k] = self.normalize_slot_value(v, slot, report)
-            if not self._matches_slot_expression(output_object[k], slot, output_object):
+            slot_plan = plan.slots[actual_k]
+            output_object[k] = self._normalize_slot_value(v, slot_plan, report)
+            if slot_plan.has_expression and not self._matches_slot_expression(
+                output_object[k], slot_plan.slot, output_object
+            ):
                 report.add_problem(ConstraintType.ExpressionConstraint, target.name, output_object[k])
-        for rule in target.rules:
+        for rule in plan.rules:
             self.evaluate_rule(output_object, rule, report)
         return output_object
 
     def normalize_enum(self, input_object: Any, target: EnumDefinition, report: Report) -> Any:
-        if input_object not in target.permissible_values:
+        permissible_values = self._permissible_values.get(target.name)
+        if permissible_values is None:
+            permissible_values = self._permissible_values[target.name] = frozenset(target.permissible_values)
+        if input_object not in permissible_values:
             report.add_problem(ConstraintType.PermissibleValueConstraint, target.name, input_object)
         return input_object
 
@@ -818,13 +884,16 @@ class ReferenceValidator:
         if target is None:
             return input_object
         output_value = input_object
-        if target.base in XSD_OR_BASE_TO_PYTHON:
-            expected_python_type = XSD_OR_BASE_TO_PYTHON[target.base]
-        elif target.uri in XSD_OR_BASE_TO_PYTHON:
-            expected_python_type = XSD_OR_BASE_TO_PYTHON[target.uri]
-        else:
-            report.add_problem(ConstraintType.UnmappedTypeConstraint, target.name, input_object)
-            return output_value
+        expected_python_type = self._python_types.get(target.name)
+        if expected_python_type is None:
+            if target.base in XSD_OR_BASE_TO_PYTHON:
+                expected_python_type = XSD_OR_BASE_TO_PYTHON[target.base]
+            elif target.uri in XSD_OR_BASE_TO_PYTHON:
+                expected_python_type = XSD_OR_BASE_TO_PYTHON[target.uri]
+            else:
+                report.add_problem(ConstraintType.UnmappedTypeConstraint, target.name, input_object)
+                return output_value
+            self._python_types[target.name] = expected_python_type
         current_python_type = type(input_object)
         if isinstance(expected_python_type, tuple):
             expected_python_types = list(expected_python_type)
@@ -886,6 +955,71 @@ class ReferenceValidator:
     def subsumes(self, parent: ClassDefinition, child: ClassDefinition):
         return parent.name in self.schemaview.class_ancestors(child.name, reflexive=True)
 
+    def _class_plan(self, cls: ClassDefinition) -> _ClassPlan:
+        """
+        Returns how instances of a class are normalized, resolving it from the derived schema on first use
+
+        :param cls: class of the derived schema
+        :return:
+        """
+        plan = self._class_plans.get(cls.name)
+        if plan is not None:
+            return plan
+        slot_names = {}
+        for slot in cls.attributes.values():
+            if slot.alias and slot.alias not in slot_names:
+                slot_names[slot.alias] = slot.name
+        for slot_name in cls.attributes:
+            slot_names[slot_name] = slot_name
+        classification_rules = []
+        if cls.class_uri != "linkml:Any":
+            for desc_cn in self.schemaview.class_descendants(cls.name, reflexive=False):
+                desc = self.derived_schema.classes[desc_cn]
+                if desc.classification_rules:
+                    classification_rules.append((desc, list(desc.classification_rules)))
+        plan = _ClassPlan(
+            is_any=cls.class_uri == "linkml:Any",
+            slots={slot.name: self._slot_plan(slot) for slot in cls.attributes.values()},
+            slot_names=slot_names,
+            presence_checks=[
+                (slot, slot.alias or slot.name)
+                for slot in cls.attributes.values()
+                if slot.required or slot.recommended or slot.designates_type
+            ],
+            classification_rules=classification_rules,
+            rules=list(cls.rules),
+            identifier_slot=self._identifier_slot(cls),
+        )
+        self._class_plans[cls.name] = plan
+        return plan
+
+    def _slot_plan(self, slot: SlotDefinition) -> _SlotPlan:
+        """
+        Returns how values of a slot are normalized
+
+        :param slot:
+        :return:
+        """
+        range_element = self._slot_range_element(slot)
+        return _SlotPlan(
+            slot=slot,
+            range_element=range_element,
+            form=self.infer_slot_collection_form(slot),
+            pk_slot_name=(
+                self._identifier_slot_name(range_element) if isinstance(range_element, ClassDefinition) else None
+            ),
+            simple_dict_value_slot=self._slot_as_simple_dict_value_slot(slot),
+            has_expression=bool(
+                slot.none_of
+                or slot.exactly_one_of
+                or slot.any_of
+                or slot.all_of
+                or slot.equals_expression
+                or slot.equals_string
+                or slot.equals_number
+            ),
+        )
+
     def _slot_range_element(self, slot: SlotDefinition) -> Element | None:
         ds = self.derived_schema
         sr = slot.range
@@ -1002,6 +1136,84 @@ class ReferenceValidator:
         return True
 
 
+STREAMING_FORMATS = ("jsonl", "tsv")
+"""Input formats holding one instance of the target per line or row"""
+
+_worker_normalizer: ReferenceValidator | None = None
+
+
+def _init_worker(schema: str, kwargs: dict[str, Any]) -> None:
+    global _worker_normalizer
+    _worker_normalizer = ReferenceValidator(SchemaView(schema), **kwargs)
+
+
+def _normalize_in_worker(input_objects: list[Any], target: str | None) -> tuple[list[Any], Report]:
+    report = Report()
+    output_objects = list(_worker_normalizer.normalize_iter(input_objects, target=target, report=report))
+    return output_objects, report
+
+
+def _infer_index_slot(sv: SchemaView, target: str) -> SlotDefinitionName | None:
+    """
+    The multivalued slot of a container class that holds instances of the target, if there is exactly one
+    """
+    index_slots = {
+        sn
+        for cn in sv.all_classes()
+        for sn in sv.class_slots(cn)
+        if sv.induced_slot(sn, cn).multivalued and sv.induced_slot(sn, cn).range == target
+    }
+    return index_slots.pop() if len(index_slots) == 1 else None
+
+
+def _read_instances(
+    input: str, input_format: str, sv: SchemaView, index_slot: SlotDefinitionName | None, batch_size: int
+) -> Iterator[dict]:
+    """
+    Read instances from a JSONL or TSV file, one at a time
+
+    TSV rows are read as by the TSV loader, with the configuration of the index slot, batch_size rows at a time.
+    """
+    with open(input) as f:
+        if input_format == "tsv":
+            header = f.readline()
+            while rows := list(islice(f, batch_size)):
+                yield from tsv_loader._iter_dicts_to_load(
+                    StringIO(header + "".join(rows)), index_slot=index_slot, schemaview=sv
+                )
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _normalize_instances(
+    schema: str,
+    normalizer: ReferenceValidator,
+    instances: Iterator[dict],
+    target: str,
+    report: Report,
+    processes: int,
+    batch_size: int,
+    normalizer_args: dict[str, Any],
+) -> Iterator[Any]:
+    """
+    Normalize instances in order, across a pool of processes if processes > 1
+
+    Only batch_size instances are read ahead, so memory stays bounded.
+    """
+    if processes <= 1:
+        yield from normalizer.normalize_iter(instances, target=target, report=report)
+        return
+    with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(schema, normalizer_args)) as executor:
+        while batch := list(islice(instances, batch_size)):
+            chunk_size = max(1, len(batch) // (processes * 4))
+            chunks = [batch[i : i + chunk_size] for i in range(0, len(batch), chunk_size)]
+            for output_objects, chunk_report in executor.map(_normalize_in_worker, chunks, repeat(target)):
+                report.combine(chunk_report)
+                yield from output_objects
+
+
 @click.command
 @click.option("--schema", "-s", required=True, help="Path to LinkML schema")
 @click.option("--target", "-C", help="name of target class or element to normalize/validate against")
@@ -1010,8 +1222,45 @@ class ReferenceValidator:
 )
 @click.option("--output", "-o", type=click.File("w"), default=sys.stdout)
 @click.option("--expand-all/--no-expand-all", help="If True, expand all Dicts to ExpandedDicts")
+@click.option(
+    "--input-format",
+    "-f",
+    type=click.Choice(["yaml", *STREAMING_FORMATS]),
+    help="Format of the input; guessed from its suffix if not set. "
+    "jsonl and tsv inputs hold one instance of the target per line, and are written as JSONL",
+)
+@click.option(
+    "--processes",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes normalizing jsonl or tsv instances",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Number of jsonl or tsv instances read ahead when normalizing across processes",
+)
+@click.option(
+    "--index-slot",
+    help="Slot of the container class that holds the tsv instances; inferred from the schema if not set",
+)
 @click.argument("input")
-def cli(schema: str, target: str, input: str, report_file: TextIO, output: TextIO, **kwargs) -> None:
+def cli(
+    schema: str,
+    target: str,
+    input: str,
+    report_file: TextIO,
+    output: TextIO,
+    input_format: str | None,
+    processes: int,
+    batch_size: int,
+    index_slot: str | None,
+    **kwargs,
+) -> None:
     """Normalize and validate a YAML document against a schema.
 
     DEPRECATED: Use ``linkml validate --fix`` instead.
@@ -1019,18 +1268,40 @@ def cli(schema: str, target: str, input: str, report_file: TextIO, output: TextI
     Normalization coerces types (e.g. "5" to 5) and restructures data between
     LinkML collection forms (e.g. ExpandedDict to CompactDict).  Validation is
     performed using a derived schema, as per Part 5 of the LinkML specification.
+
+    JSONL and TSV inputs are normalized one instance at a time, e.g. the items of
+    an index slot, and written as JSONL, so large inputs can be streamed:
+
+        linkml-normalize -s personinfo.yaml -C Person -j 4 persons.jsonl > normalized.jsonl
     """
     warnings.warn(
         "linkml-normalize is deprecated and will be removed in a future release. Use 'linkml validate --fix' instead.",
         FutureWarning,
         stacklevel=2,
     )
+    if input_format is None:
+        suffix = Path(input).suffix.lstrip(".").lower()
+        input_format = suffix if suffix in STREAMING_FORMATS else "yaml"
     sv = SchemaView(schema)
     normalizer = ReferenceValidator(sv, **kwargs)
-    with open(input) as f:
-        input_object = yaml.safe_load(f)
     report = Report()
-    output_object = normalizer.normalize(input_object, target=target, report=report)
+    if input_format in STREAMING_FORMATS:
+        if target is None:
+            raise click.UsageError(f"--target is required for {input_format} input")
+        if input_format == "tsv" and index_slot is None:
+            index_slot = _infer_index_slot(sv, target)
+            if index_slot is None:
+                raise click.UsageError(f"--index-slot is required for tsv input: no single slot holds {target}")
+        instances = _read_instances(input, input_format, sv, index_slot, batch_size)
+        for output_object in _normalize_instances(
+            schema, normalizer, instances, target, report, processes, batch_size, kwargs
+        ):
+            output.write(json.dumps(output_object, default=str))
+            output.write("\n")
+    else:
+        with open(input) as f:
+            input_object = yaml.safe_load(f)
+        output_object = normalizer.normalize(input_object, target=target, report=report)
     if report.normalized_results():
         report_file.write("# Repaired:\n")
         for r in report.normalized_results():
@@ -1044,6 +1315,8 @@ def cli(schema: str, target: str, input: str, report_file: TextIO, output: TextI
         for r in report.errors():
             report_file.write(yaml_dumper.dumps(r))
         sys.exit(1)
+    if input_format in STREAMING_FORMATS:
+        return
     # TODO: https://stackoverflow.com/questions/45004464/yaml-dump-adding-unwanted-newlines-in-multiline-strings
     output_str = yaml.dump(output_object, sort_keys=False)
     output.write(output_str)
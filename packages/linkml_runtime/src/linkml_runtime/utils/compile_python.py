@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from logging import warning
-from types import ModuleType
+from types import CodeType, ModuleType
 
 
 def file_text(txt_or_fname: str) -> str:
@@ -19,6 +20,12 @@ def file_text(txt_or_fname: str) -> str:
     return txt_or_fname
 
 
+@lru_cache(maxsize=32)
+def _compile(python_txt: str, module_name: str) -> CodeType:
+    # Code objects are immutable, so the same text need only be compiled once; each call still runs it in a new module
+    return compile(python_txt, module_name, "exec")
+
+
 def compile_python(text_or_fn: str, package_path: str | None = None, module_name: str | None = "test") -> ModuleType:
     """
     Compile the text or file and return the resulting module
@@ -33,7 +40,7 @@ def compile_python(text_or_fn: str, package_path: str | None = None, module_name
     python_txt = file_text(text_or_fn)
     if package_path is None and python_txt != text_or_fn:
         package_path = text_or_fn
-    spec = compile(python_txt, module_name, "exec")
+    spec = _compile(python_txt, module_name)
     module = ModuleType(module_name)
     if package_path:
         package_path_abs = os.path.join(os.getcwd(), package_path)
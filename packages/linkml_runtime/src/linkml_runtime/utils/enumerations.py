@@ -6,17 +6,41 @@ from linkml_runtime.utils.yamlutils import YAMLRoot
 
 
 class EnumDefinitionMeta(type):
+    """
+    Metaclass of the generated enumerations
+
+    Permissible values that are not python identifiers are added by the ``_addvals`` hook of the generated class.
+    That is deferred until the enumeration is first used, so that importing a module with many enumerations does
+    not construct all of their values.
+    """
+
     def __init__(cls, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        cls._addvals()
+        cls._vals_added = False
+
+    def _add_all_vals(cls) -> None:
+        # Values are looked up through the MRO, so the values of every enumeration it holds are needed
+        for klass in reversed(cls.__mro__):
+            if isinstance(klass, EnumDefinitionMeta) and not klass.__dict__["_vals_added"]:
+                klass._vals_added = True
+                klass._addvals()
+
+    def __getattr__(cls, item):
+        # Only called when normal lookup fails, i.e. for a value that may not have been added yet
+        if item.startswith("__") or cls.__dict__.get("_vals_added", True):
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {item!r}")
+        cls._add_all_vals()
+        return getattr(cls, item)
 
     def __getitem__(cls, item):
+        cls._add_all_vals()
         for klass in cls.__mro__:
             if item in klass.__dict__:
                 return klass.__dict__[item]
         raise KeyError(item)
 
     def __setitem__(cls, key, value):
+        cls._add_all_vals()
         if key in cls.__dict__:
             raise ValueError(f"{cls.__name__} - {key} already assigned")
         cls.__dict__[key] = value
@@ -32,6 +56,7 @@ class EnumDefinitionMeta(type):
                 item = code.text
         elif isinstance_dt(item, "PermissibleValue"):
             item = item.text
+        cls._add_all_vals()
         return any(item in klass.__dict__ for klass in cls.__mro__)
 
 
@@ -6,10 +6,14 @@ meta-circular interpreter for evaluating python expressions
 
 import ast
 import operator as op
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
 
 # supported operators
 from typing import Any
 
+CompiledExpression = Callable[[Mapping[str, Any]], Any]
+
 operators = {
     ast.Add: op.add,
     ast.Sub: op.sub,
@@ -96,33 +100,90 @@ def eval_expr(expr: str, _distribute=True, **kwargs) -> Any:
     :param kwargs: variables to substitute
     :return: result of evaluation
     """
+    return compile_expr(expr, _distribute)(kwargs)
+
+
+def eval_expr_many(expr: str, bindings: Iterable[Mapping[str, Any]], _distribute=True) -> list[Any]:
+    """
+    Evaluates a given expression once for each set of variables
+
+    The expression is parsed once.
+
+    >>> eval_expr_many('{x} + 1', [{'x': 1}, {'x': None}, {'x': 3}])
+    [2, None, 4]
+
+    :param expr: expression to evaluate
+    :param bindings: variables to substitute, for each evaluation
+    :param _distribute: if True, distribute operations over collections and return array
+    :return: results of evaluation, in the order of bindings
+    """
+    compiled = compile_expr(expr, _distribute)
+    return [compiled(b) for b in bindings]
+
+
+@lru_cache(maxsize=1024)
+def compile_expr(expr: str, _distribute=True) -> CompiledExpression:
+    """
+    Compiles a given expression, with the restricted syntax of :func:`eval_expr`
+
+    The expression is parsed once, into a function that evaluates it against a mapping of variables.
+    The most recently used expressions are cached.
+
+    >>> f = compile_expr('{x} * 2')
+    >>> f({'x': 3}), f({'x': None})
+    (6, None)
+
+    :param expr: expression to compile
+    :param _distribute: if True, distribute operations over collections and return array
+    :return: function evaluating the expression against its variables
+    """
     # if kwargs:
     #    expr = expr.format(**kwargs)
     if "None" in expr:
         # TODO: do this as part of parsing
-        return None
-    else:
+        return lambda bindings: None
+    compiled = _compile(ast.parse(expr, mode="eval").body, distribute=_distribute)
+
+    def evaluate(bindings: Mapping[str, Any]) -> Any:
         try:
-            return eval_(ast.parse(expr, mode="eval").body, kwargs, distribute=_distribute)
+            return compiled(bindings)
         except UnsetValueException:
             return None
 
+    return evaluate
 
-def eval_(node, bindings=None, distribute=True):
-    if bindings is None:
-        bindings = {}
 
+def _raise(exception: Callable[[], Exception]) -> CompiledExpression:
+    """Defers an error in an expression to its evaluation, as when the expression is interpreted"""
+
+    def f(bindings):
+        raise exception()
+
+    return f
+
+
+def _compile(node, distribute=True) -> CompiledExpression:
+    """
+    Compiles an expression node into a function of the variables, with the semantics of :func:`eval_expr`
+    """
     if isinstance(node, ast.Constant):
-        return node.value
+        value = node.value
+        return lambda bindings: value
     elif isinstance(node, ast.Name):
-        return bindings.get(node.id)
+        name = node.id
+        return lambda bindings: bindings.get(name)
     elif isinstance(node, ast.Subscript):
-        k = eval_(node.slice, bindings)
-        v = eval_(node.value, bindings)
-        return v[k]
+        key = _compile(node.slice)
+        value = _compile(node.value)
+
+        def subscript(bindings):
+            k = key(bindings)
+            return value(bindings)[k]
+
+        return subscript
     elif isinstance(node, ast.Attribute):
-        # e.g. for person.name, this returns the val of person
-        v = eval_(node.value, bindings)
+        value = _compile(node.value)
+        attr = node.attr
 
         # lookup attribute, potentially distributing the results over collections
         def _get(obj: Any, k: str, recurse=distribute) -> Any:
@@ -140,58 +201,87 @@ def eval_(node, bindings=None, distribute=True):
             else:
                 return getattr(obj, k)
 
-        return _get(v, node.attr)
+        return lambda bindings: _get(value(bindings), attr)
     elif isinstance(node, ast.List):
-        return [eval_(x, bindings) for x in node.elts]
+        elts = [_compile(x) for x in node.elts]
+        return lambda bindings: [e(bindings) for e in elts]
     elif isinstance(node, ast.Set):
         # sets are not part of the language; we use {x} as notation for x
         if len(node.elts) != 1:
-            raise ValueError("The {} must enclose a single variable")
+            return _raise(lambda: ValueError("The {} must enclose a single variable"))
         e = node.elts[0]
         if not isinstance(e, ast.Name):
-            raise ValueError("The {} must enclose a variable")
-        v = eval_(e, bindings)
-        if v is None:
-            raise UnsetValueException(f"{e} is not set")
-        else:
-            return v
+            return _raise(lambda: ValueError("The {} must enclose a variable"))
+        name = e.id
+
+        def variable(bindings):
+            v = bindings.get(name)
+            if v is None:
+                raise UnsetValueException(f"{e} is not set")
+            else:
+                return v
+
+        return variable
     elif isinstance(node, ast.Tuple):
-        return tuple([eval_(x, bindings) for x in node.elts])
+        elts = [_compile(x) for x in node.elts]
+        return lambda bindings: tuple([e(bindings) for e in elts])
     elif isinstance(node, ast.Dict):
-        return {eval_(k, bindings): eval_(v, bindings) for k, v in zip(node.keys, node.values)}
+        items = [(_compile(k), _compile(v)) for k, v in zip(node.keys, node.values)]
+        return lambda bindings: {k(bindings): v(bindings) for k, v in items}
     elif isinstance(node, ast.Compare):  # <left> <operator> <right>
         if len(node.ops) != 1:
-            raise ValueError(f"Must be exactly one op in {node}")
+            return _raise(lambda: ValueError(f"Must be exactly one op in {node}"))
         if type(node.ops[0]) not in compare_operators:
-            raise NotImplementedError(f"Not implemented: {node.ops[0]} in {node}")
+            return _raise(lambda: NotImplementedError(f"Not implemented: {node.ops[0]} in {node}"))
         py_op = compare_operators[type(node.ops[0])]
         if len(node.comparators) != 1:
-            raise ValueError(f"Must be exactly one comparator in {node}")
-        right = node.comparators[0]
-        return py_op(eval_(node.left, bindings), eval_(right, bindings))
+            return _raise(lambda: ValueError(f"Must be exactly one comparator in {node}"))
+        left = _compile(node.left)
+        right = _compile(node.comparators[0])
+        return lambda bindings: py_op(left(bindings), right(bindings))
     elif isinstance(node, ast.BinOp):  # <left> <operator> <right>
-        return operators[type(node.op)](eval_(node.left, bindings), eval_(node.right, bindings))
+        if type(node.op) not in operators:
+            return _raise(lambda: KeyError(type(node.op)))
+        py_op = operators[type(node.op)]
+        left = _compile(node.left)
+        right = _compile(node.right)
+        return lambda bindings: py_op(left(bindings), right(bindings))
     elif isinstance(node, ast.UnaryOp):  # <operator> <operand> e.g., -1
-        return operators[type(node.op)](eval_(node.operand, bindings))
-    # elif isinstance(node, ast.Match):
-    #    # implementing this would restrict python version to 3.10
-    #    # https://stackoverflow.com/questions/60208/replacements-for-switch-statement-in-python
-    #    raise NotImplementedError(f'Not supported')
+        if type(node.op) not in operators:
+            return _raise(lambda: KeyError(type(node.op)))
+        py_op = operators[type(node.op)]
+        operand = _compile(node.operand)
+        return lambda bindings: py_op(operand(bindings))
     elif isinstance(node, ast.IfExp):
-        if eval_(node.test, bindings):
-            return eval_(node.body, bindings)
-        else:
-            return eval_(node.orelse, bindings)
+        test = _compile(node.test)
+        body = _compile(node.body)
+        orelse = _compile(node.orelse)
+        return lambda bindings: body(bindings) if test(bindings) else orelse(bindings)
     elif isinstance(node, ast.Call):
         if isinstance(node.func, ast.Name):
             fn = node.func.id
             if fn in funcs:
                 takes_list, func = funcs[fn]
-                args = [eval_(x, bindings) for x in node.args]
-                if isinstance(args[0], list) and not takes_list:
-                    return [func(*[x] + args[1:]) for x in args[0]]
-                else:
-                    return func(*args)
-        raise NotImplementedError(f"Call {node.func} not implemented. node = {node}")
+                args = [_compile(x) for x in node.args]
+
+                def call(bindings):
+                    arg_values = [a(bindings) for a in args]
+                    if isinstance(arg_values[0], list) and not takes_list:
+                        return [func(*[x] + arg_values[1:]) for x in arg_values[0]]
+                    else:
+                        return func(*arg_values)
+
+                return call
+        return _raise(lambda: NotImplementedError(f"Call {node.func} not implemented. node = {node}"))
     else:
-        raise TypeError(node)
+        return _raise(lambda: TypeError(node))
+
+
+def eval_(node, bindings: Mapping[str, Any] | None = None, distribute=True) -> Any:
+    """
+    Evaluates an expression node against a mapping of variables
+
+    The node is compiled by :func:`_compile` on every call; use :func:`compile_expr` to evaluate an expression
+    repeatedly.
+    """
+    return _compile(node, distribute)(bindings if bindings is not None else {})
@@ -173,26 +173,45 @@ def remove_empty_items(obj: Any, hide_protected_keys: bool = False, inside: bool
             if not is_empty(v)
         }
 
-        # https://github.com/linkml/linkml/issues/119
-        # Remove the additional level of nesting with enums
-        if len(obj_dict) == 1 and list(obj_dict.keys())[0] == "_code":
-            enum_text = list(obj_dict.values())[0].get("text", None)
-            if enum_text is not None:
-                return enum_text
-        if hide_protected_keys and len(obj_dict) == 1 and str(list(obj_dict.keys())[0]).startswith("_"):
-            inner_element = list(obj_dict.values())[0]
-            if isinstance(inner_element, dict):
-                obj_dict = inner_element
+        obj_dict = _unnest_single_entry(obj_dict, hide_protected_keys)
+        if not isinstance(obj_dict, dict):
+            return obj_dict
         return obj_dict if not inside or not is_empty(obj_dict) else None
     elif is_empty(obj):
         return None
     elif isinstance(obj, Decimal):
-        # note that attempting to implement https://bugs.python.org/issue16535
-        # will not work for yaml serializations
-        v = str(obj)
-        if "." in v and not v.endswith(".0"):
-            return float(obj)
-        else:
-            return int(obj)
+        return _decimal_as_number(obj)
     else:
         return obj
+
+
+def _unnest_single_entry(obj_dict: dict, hide_protected_keys: bool) -> Any:
+    """
+    The rules of :func:`remove_empty_items` for a cleaned dictionary with a single entry
+
+    :param obj_dict: dictionary whose empty entries have been removed
+    :param hide_protected_keys: True means a single protected key is replaced by its dictionary value
+    :return: the text of an enum, the value of a single protected key, or obj_dict itself
+    """
+    if len(obj_dict) == 1:
+        k, v = next(iter(obj_dict.items()))
+        # https://github.com/linkml/linkml/issues/119
+        # Remove the additional level of nesting with enums
+        if k == "_code":
+            enum_text = v.get("text", None)
+            if enum_text is not None:
+                return enum_text
+        if hide_protected_keys and str(k).startswith("_") and isinstance(v, dict):
+            return v
+    return obj_dict
+
+
+def _decimal_as_number(obj: Decimal) -> float | int:
+    """The float or int that :func:`remove_empty_items` emits for a Decimal"""
+    # note that attempting to implement https://bugs.python.org/issue16535
+    # will not work for yaml serializations
+    v = str(obj)
+    if "." in v and not v.endswith(".0"):
+        return float(obj)
+    else:
+        return int(obj)
@@ -2,13 +2,13 @@ import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
 
 from jsonasobj2 import JsonObj, items
 
 from linkml_runtime.linkml_model import ClassDefinitionName, PermissibleValue, SlotDefinitionName
 from linkml_runtime.utils.enumerations import EnumDefinitionImpl
-from linkml_runtime.utils.eval_utils import eval_expr
+from linkml_runtime.utils.eval_utils import CompiledExpression, compile_expr, eval_expr
 from linkml_runtime.utils.schemaview import SchemaView
 from linkml_runtime.utils.walker_utils import traverse_object_tree
 from linkml_runtime.utils.yamlutils import YAMLRoot
@@ -124,7 +124,20 @@ def infer_slot_value(
     if v is not None and policy == Policy.KEEP:
         return v
     new_v = generate_slot_value(obj, slot_name, schemaview, class_name=class_name, config=config)
-    logger.debug(f"SETTING {slot_name} = {new_v} // current={v}, {policy}")
+    _set_inferred_value(obj, slot_name, v, new_v, policy)
+
+
+def _set_inferred_value(obj: YAMLRoot, slot_name: str, v: Any, new_v: Any, policy: Policy):
+    """
+    Set an inferred value of a slot, according to the policy
+
+    :param obj: mutable object to be transformed
+    :param slot_name:
+    :param v: current value
+    :param new_v: inferred value
+    :param policy:
+    """
+    logger.debug("SETTING %s = %s // current=%s, %s", slot_name, new_v, v, policy)
     if new_v:
         # check if new value is different; not str check is necessary as enums may not be converted
         if v is not None and new_v != v and str(new_v) != str(v):
@@ -139,6 +152,109 @@ def infer_slot_value(
             obj.__post_init__()
 
 
+class _Derivation(NamedTuple):
+    """How the value of a slot is inferred"""
+
+    string_serialization: str | None
+    equals_expression: CompiledExpression | None
+
+
+class SlotValueInferrer:
+    """
+    Infers slot values of many objects, as :func:`infer_slot_value` does
+
+    How each slot of a class is derived is resolved once, for the first object of that class;
+    slots that cannot be derived are skipped for the other objects.
+
+    ::
+
+        inferrer = SlotValueInferrer(schemaview, config=Config(use_expressions=True))
+        for obj in objs:
+            inferrer.infer_all(obj)
+    """
+
+    def __init__(
+        self,
+        schemaview: SchemaView,
+        class_name: str | ClassDefinitionName = None,
+        policy: Policy = Policy.STRICT,
+        config: Config = Config(),
+    ):
+        """
+        :param schemaview:
+        :param class_name: class of all objects, the class of each object if None
+        :param policy: default is STRICT
+        :param config: determines which rules to apply
+        """
+        self.schemaview = schemaview
+        self.class_name = class_name
+        self.policy = policy
+        self.config = config
+        self._derivations: dict[tuple[type, str], _Derivation | None] = {}
+
+    def _derivation(self, obj: YAMLRoot, slot_name: str) -> _Derivation | None:
+        key = (type(obj), slot_name)
+        if key in self._derivations:
+            return self._derivations[key]
+        config = self.config
+        class_name = self.class_name if self.class_name is not None else type(obj).class_name
+        mapped_slot = self.schemaview.slot_name_mappings()[slot_name]
+        slot = self.schemaview.induced_slot(mapped_slot.name, class_name)
+        string_serialization = slot.string_serialization if config.use_string_serialization else None
+        equals_expression = None
+        if config.use_expressions and slot.equals_expression:
+            equals_expression = compile_expr(slot.equals_expression)
+        derivation = None
+        if string_serialization or equals_expression:
+            derivation = _Derivation(string_serialization, equals_expression)
+        self._derivations[key] = derivation
+        return derivation
+
+    def infer(self, obj: YAMLRoot):
+        """
+        Infer the values of all slots of an object, but not of the objects it contains
+
+        :param obj: mutable object to be transformed
+        """
+        config = self.config
+        if config.parse_string_serialization or config.use_rules:
+            # not implemented: fails as generate_slot_value does
+            for k in list(vars(obj)):
+                infer_slot_value(obj, k, self.schemaview, self.class_name, self.policy, config)
+            return
+        for k in list(vars(obj)):
+            derivation = self._derivation(obj, k)
+            if derivation is None or not isinstance(obj, JsonObj):
+                continue
+            v = getattr(obj, k, None)
+            if v is not None and self.policy == Policy.KEEP:
+                continue
+            obj_dict = obj_as_dict_nonrecursive(obj, config.resolve_function)
+            if derivation.string_serialization:
+                new_v = derivation.string_serialization.format(**obj_dict)
+            else:
+                new_v = derivation.equals_expression(obj_dict)
+            _set_inferred_value(obj, k, v, new_v, self.policy)
+
+    def infer_all(self, obj: YAMLRoot):
+        """
+        Walks object tree inferring all slot values
+
+        :param obj:
+        """
+
+        def infer(in_obj: YAMLRoot):
+            if (
+                isinstance(in_obj, YAMLRoot)
+                and not isinstance(in_obj, EnumDefinitionImpl)
+                and not isinstance(in_obj, PermissibleValue)
+            ):
+                self.infer(in_obj)
+            return in_obj
+
+        traverse_object_tree(obj, infer)
+
+
 def infer_all_slot_values(
     obj: YAMLRoot,
     schemaview: SchemaView,
@@ -160,16 +276,4 @@ def infer_all_slot_values(
     :return:
     """
 
-    def infer(in_obj: YAMLRoot):
-        logger.debug(f"INFER={in_obj}")
-        if (
-            isinstance(in_obj, YAMLRoot)
-            and not isinstance(in_obj, EnumDefinitionImpl)
-            and not isinstance(in_obj, PermissibleValue)
-        ):
-            for k, v in vars(in_obj).items():
-                # print(f'  ISV={k} curr={v} policy={policy} in_obj={type(in_obj)}')
-                infer_slot_value(in_obj, k, schemaview, class_name=class_name, policy=policy, config=config)
-        return in_obj
-
-    traverse_object_tree(obj, infer)
+    SlotValueInferrer(schemaview, class_name=class_name, policy=policy, config=config).infer_all(obj)
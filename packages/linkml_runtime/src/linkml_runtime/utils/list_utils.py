@@ -204,11 +204,38 @@ def enhance_configmap_for_multivalued_primitives(
     return configmap
 
 
+def get_multivalued_primitive_slots(schemaview: SchemaView, index_slot: SlotDefinitionName) -> set[str]:
+    """Return the names of multivalued slots with a non-class range on the index slot's range class.
+
+    Args:
+        schemaview: The schema view for looking up slot metadata.
+        index_slot: The top-level index slot name.
+
+    Returns:
+        The set of slot names whose values are serialized as delimited lists.
+    """
+    multivalued_slots: set[str] = set()
+    if schemaview is not None and index_slot is not None:
+        slot = schemaview.get_slot(index_slot)
+        if slot is not None and slot.range is not None:
+            target_class = slot.range
+            all_classes = schemaview.all_classes()
+            if target_class in all_classes:
+                for slot_name in schemaview.class_slots(target_class):
+                    induced_slot = schemaview.induced_slot(slot_name, target_class)
+                    if induced_slot.multivalued:
+                        slot_range = induced_slot.range
+                        if slot_range not in all_classes:
+                            multivalued_slots.add(slot_name)
+    return multivalued_slots
+
+
 def check_data_for_delimiter(
     objs: list[dict],
     delimiter: str,
     schemaview: SchemaView,
     index_slot: SlotDefinitionName,
+    multivalued_slots: set[str] | None = None,
 ) -> None:
     """Check that no string value in a multivalued slot contains the list delimiter.
 
@@ -220,24 +247,15 @@ def check_data_for_delimiter(
         delimiter: The list delimiter character (e.g. ``|``).
         schemaview: The schema view for looking up slot metadata.
         index_slot: The top-level index slot name.
+        multivalued_slots: Precomputed result of ``get_multivalued_primitive_slots``;
+            pass this when checking rows one at a time to avoid recomputing it.
 
     Raises:
         ValueError: If any string value in a multivalued slot contains the
             delimiter.
     """
-    multivalued_slots: set[str] = set()
-    if schemaview is not None and index_slot is not None:
-        slot = schemaview.get_slot(index_slot)
-        if slot is not None and slot.range is not None:
-            target_class = slot.range
-            all_classes = schemaview.all_classes()
-            if target_class in all_classes:
-                for slot_name in schemaview.class_slots(target_class):
-                    induced_slot = schemaview.induced_slot(slot_name, target_class)
-                    if induced_slot.multivalued:
-                        slot_range = induced_slot.range
-                        if slot_range not in all_classes:
-                            multivalued_slots.add(slot_name)
+    if multivalued_slots is None:
+        multivalued_slots = get_multivalued_primitive_slots(schemaview, index_slot)
 
     if not multivalued_slots:
         return
@@ -1,11 +1,9 @@
 import logging
+from collections.abc import Iterator, Mapping, MutableMapping
 from typing import Any
 
-from prefixcommons import curie_util
-from prefixmaps.io.parser import load_context
 from rdflib import BNode, Graph, Namespace, URIRef
 from rdflib.namespace import is_ncname
-from requests.structures import CaseInsensitiveDict
 
 from linkml_runtime.utils.uri_validator import validate_uri
 from linkml_runtime.utils.yamlutils import TypedNode
@@ -40,6 +38,49 @@ PREFIXMAPS_CONTEXTS = [
 ]
 
 
+class CaseInsensitiveDict(MutableMapping):
+    """A dictionary whose keys are looked up without regard to case, but that remembers the case they were set with.
+
+    The same behaviour as ``requests.structures.CaseInsensitiveDict``, kept here so that importing the
+    namespace manager does not import ``requests`` and the HTTP stack beneath it.
+    """
+
+    def __init__(self, data=None, **kwargs):
+        self._store = {}
+        self.update(data or {}, **kwargs)
+
+    def __setitem__(self, key: str, value) -> None:
+        # Look up by the lowercased key, but keep the key as it was given
+        self._store[key.lower()] = (key, value)
+
+    def __getitem__(self, key: str):
+        return self._store[key.lower()][1]
+
+    def __delitem__(self, key: str) -> None:
+        del self._store[key.lower()]
+
+    def __iter__(self) -> Iterator[str]:
+        return (cased_key for cased_key, _ in self._store.values())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def lower_items(self) -> Iterator[tuple[str, Any]]:
+        """Like items(), but with all keys lowercased"""
+        return ((lower_key, entry[1]) for lower_key, entry in self._store.items())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.lower_items()) == dict(CaseInsensitiveDict(other).lower_items())
+
+    def copy(self) -> "CaseInsensitiveDict":
+        return CaseInsensitiveDict(self._store.values())
+
+    def __repr__(self) -> str:
+        return str(dict(self.items()))
+
+
 class Namespaces(CaseInsensitiveDict):
     """Namespace manager.  Functions as both a dictionary and a python
     namespace.
@@ -285,9 +326,14 @@ class Namespaces(CaseInsensitiveDict):
         :return:
         """
 
+        # prefixcommons and prefixmaps are slow to import, and only needed here
         if map_name in BIOCONTEXT_CONTEXTS:
+            from prefixcommons import curie_util
+
             prefix_map = curie_util.read_biocontext(map_name)
         elif map_name in PREFIXMAPS_CONTEXTS:
+            from prefixmaps.io.parser import load_context
+
             context = load_context(map_name)
             prefix_map = context.as_dict()
         else:
@@ -0,0 +1,132 @@
+"""Read and write instance data in pyoxigraph stores.
+
+rdflib's in-memory Graph holds every triple as Python objects.  A
+:class:`pyoxigraph.Store` keeps them in Rust, in memory or on disk
+(``pyoxigraph.Store(path)``), so it can hold graphs that do not fit in an
+rdflib Graph.
+
+:class:`OxigraphGraph` presents one graph of a store with the part of the
+rdflib ``Graph`` API that :class:`~linkml_runtime.loaders.rdflib_loader.RDFLibLoader`
+reads.  :class:`OxigraphWriter` adds the triples produced by
+:class:`~linkml_runtime.dumpers.rdflib_dumper.RDFLibDumper` to a store in
+batches.
+
+Terms are converted between the two libraries one triple at a time.  As in
+:mod:`linkml_runtime.utils.rdf_canonicalize`, pyoxigraph follows RDF 1.1, so
+plain literals and ``xsd:string`` literals read back from a store have no
+datatype.
+"""
+
+from collections.abc import Iterator
+
+import pyoxigraph as ox
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import RDF, XSD, NamespaceManager
+from rdflib.term import Node
+
+_XSD_STRING = str(XSD.string)
+_RDF_LANG_STRING = str(RDF.langString)
+
+OxTerm = ox.NamedNode | ox.BlankNode | ox.Literal
+OxGraphName = ox.NamedNode | ox.BlankNode | ox.DefaultGraph
+
+
+def to_oxigraph(node: Node) -> OxTerm:
+    """Convert an rdflib term to a pyoxigraph term"""
+    if isinstance(node, Literal):
+        if node.language:
+            return ox.Literal(str(node), language=node.language)
+        if node.datatype:
+            return ox.Literal(str(node), datatype=ox.NamedNode(node.datatype))
+        return ox.Literal(str(node))
+    if isinstance(node, BNode):
+        return ox.BlankNode(str(node))
+    return ox.NamedNode(node)
+
+
+def from_oxigraph(term: OxTerm) -> Node:
+    """Convert a pyoxigraph term to an rdflib term"""
+    if isinstance(term, ox.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, ox.BlankNode):
+        return BNode(term.value)
+    datatype = term.datatype.value
+    if datatype == _XSD_STRING:
+        return Literal(term.value)
+    if datatype == _RDF_LANG_STRING:
+        return Literal(term.value, lang=term.language)
+    return Literal(term.value, datatype=URIRef(datatype))
+
+
+class OxigraphGraph:
+    """
+    One graph of a pyoxigraph Store, read through the rdflib Graph methods used by the RDF loader
+
+    Only ``triples``, ``subjects``, ``objects``, ``len`` and iteration are supported.
+    Namespace bindings are kept in a ``namespace_manager`` of their own; they are not stored.
+    """
+
+    def __init__(self, store: ox.Store, graph_name: OxGraphName | None = None) -> None:
+        """
+        :param store: store holding the data
+        :param graph_name: graph of the store to read, the default graph if None
+        """
+        self.store = store
+        self.graph_name = ox.DefaultGraph() if graph_name is None else graph_name
+        self.namespace_manager = NamespaceManager(Graph())
+
+    def triples(self, pattern: tuple[Node | None, Node | None, Node | None]) -> Iterator[tuple[Node, Node, Node]]:
+        s, p, o = (None if t is None else to_oxigraph(t) for t in pattern)
+        for quad in self.store.quads_for_pattern(s, p, o, self.graph_name):
+            yield from_oxigraph(quad.subject), from_oxigraph(quad.predicate), from_oxigraph(quad.object)
+
+    def subjects(self, predicate: Node | None = None, object: Node | None = None) -> Iterator[Node]:
+        for s, _, _ in self.triples((None, predicate, object)):
+            yield s
+
+    def objects(self, subject: Node | None = None, predicate: Node | None = None) -> Iterator[Node]:
+        for _, _, o in self.triples((subject, predicate, None)):
+            yield o
+
+    def __iter__(self) -> Iterator[tuple[Node, Node, Node]]:
+        return self.triples((None, None, None))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.store.quads_for_pattern(None, None, None, self.graph_name))
+
+
+class OxigraphWriter:
+    """
+    Add rdflib triples to one graph of a pyoxigraph Store, in batches
+
+    Use as a context manager, or call :meth:`flush` once all triples have been added.
+    """
+
+    def __init__(self, store: ox.Store, graph_name: OxGraphName | None = None, batch_size: int = 10000) -> None:
+        """
+        :param store: store to add the triples to
+        :param graph_name: graph of the store to add the triples to, the default graph if None
+        :param batch_size: number of triples added to the store at a time
+        """
+        self.store = store
+        self.graph_name = ox.DefaultGraph() if graph_name is None else graph_name
+        self.batch_size = batch_size
+        self._quads: list[ox.Quad] = []
+
+    def add(self, triple: tuple[Node, Node, Node]) -> None:
+        s, p, o = triple
+        self._quads.append(ox.Quad(to_oxigraph(s), to_oxigraph(p), to_oxigraph(o), self.graph_name))
+        if len(self._quads) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._quads:
+            self.store.extend(self._quads)
+            self._quads = []
+
+    def __enter__(self) -> "OxigraphWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if exc_info[0] is None:
+            self.flush()
@@ -14,10 +14,10 @@ with stable blank node labels and sorted triples.
 
 2. **Non-standard RDF**: Graphs with literal predicates (e.g. SHACL
    annotation mode) or relative IRIs (e.g. the metamodel's
-   ``bibo:status <testing>``) are rejected by pyoxigraph.  This function
-   falls back to rdflib's serializer for such graphs, but still
-   canonicalizes blank-node labels (and sorts line-oriented formats) so
-   the fallback output remains deterministic across processes.
+   ``bibo:status <testing>``) are rejected by pyoxigraph.  Such terms are
+   replaced by placeholder IRIs for RDFC-1.0 canonicalization, and the
+   canonical graph is serialized by rdflib (with line-oriented formats
+   sorted), so the fallback output remains deterministic across processes.
 
 3. **Numeric short forms**: pyoxigraph uses Turtle short forms for
    ``xsd:integer`` (``42``), ``xsd:boolean`` (``true``), and
@@ -32,17 +32,19 @@ with stable blank node labels and sorted triples.
 5. **Trailing escaped dot in PN_LOCAL**: pyoxigraph emits CURIEs like
    ``prefix:local\\.`` for IRIs whose local part ends with ``.``.  This
    is valid Turtle (PN_LOCAL_ESC), but rdflib's notation3 parser rejects
-   it because it conflicts with the statement-terminator dot.  We
-   post-process the output to expand such CURIEs to full ``<IRI>`` form.
+   it because it conflicts with the statement-terminator dot.  When the
+   graph has IRIs ending in ``.``, we post-process the output to expand
+   such CURIEs to full ``<IRI>`` form.
 """
 
-import io
 import re
+import urllib.parse
 import warnings
 
 import pyoxigraph as ox
 import rdflib
-from rdflib.compare import to_canonical_graph
+
+from linkml_runtime.utils.oxigraph_store import from_oxigraph, to_oxigraph
 
 
 class RDFCanonicalizationWarning(UserWarning):
@@ -80,8 +82,66 @@ _PREFIX_FORMATS = frozenset({ox.RdfFormat.TURTLE, ox.RdfFormat.TRIG, ox.RdfForma
 _LINE_ORIENTED_FORMATS = frozenset({"nt", "ntriples", "n-triples", "nt11", "nquads", "n-quads"})
 
 
-def _deterministic_fallback_serialize(graph: rdflib.Graph, output_format: str) -> str:
-    """Serialize a graph that pyoxigraph cannot canonicalize, deterministically.
+# Namespace of the IRIs that stand in for terms pyoxigraph rejects during canonicalization.
+_PLACEHOLDER_NAMESPACE = "urn:x-linkml-placeholder:"
+
+
+def _to_oxigraph_triples(
+    graph: rdflib.Graph, keep_xsd_string: bool = False
+) -> tuple[list["ox.Triple"], dict[str, rdflib.term.Node]]:
+    """Convert the triples of ``graph`` to pyoxigraph triples, term by term.
+
+    Terms that pyoxigraph rejects -- relative or otherwise invalid IRIs,
+    literals with invalid language tags, and literals in predicate position --
+    are replaced by placeholder IRIs derived from their N3 form, so they take
+    part in canonicalization like any other term.  Blank nodes get fresh
+    pyoxigraph labels; RDFC-1.0 relabels them anyway.
+
+    :param graph: The rdflib Graph to convert.
+    :param keep_xsd_string: Also replace ``xsd:string`` literals, which pyoxigraph
+        does not distinguish from plain literals, so rdflib can serialize them as they were.
+    :return: The triples, and the original term of each placeholder IRI.
+    """
+    blank_nodes: dict[rdflib.BNode, ox.BlankNode] = {}
+    terms: dict[tuple[rdflib.term.Node, bool], ox.NamedNode | ox.Literal] = {}
+    placeholders: dict[str, rdflib.term.Node] = {}
+
+    def convert(node: rdflib.term.Node, predicate: bool = False):
+        if isinstance(node, rdflib.BNode):
+            term = blank_nodes.get(node)
+            if term is None:
+                term = blank_nodes[node] = ox.BlankNode()
+            return term
+        term = terms.get((node, predicate))
+        if term is None:
+            try:
+                if isinstance(node, rdflib.Literal):
+                    if predicate or (keep_xsd_string and node.datatype == rdflib.XSD.string):
+                        raise ValueError(f"{node.n3()} cannot be a pyoxigraph term")
+                    term = to_oxigraph(node)
+                else:
+                    term = ox.NamedNode(node)
+            except ValueError:
+                placeholder = _PLACEHOLDER_NAMESPACE + urllib.parse.quote(node.n3(), safe="")
+                placeholders[placeholder] = node
+                term = ox.NamedNode(placeholder)
+            terms[(node, predicate)] = term
+        return term
+
+    triples = [ox.Triple(convert(s), convert(p, predicate=True), convert(o)) for s, p, o in graph]
+    if placeholders and not keep_xsd_string:
+        # The graph is serialized by rdflib after all: keep its xsd:string literals
+        return _to_oxigraph_triples(graph, keep_xsd_string=True)
+    return triples, placeholders
+
+
+def _deterministic_fallback_serialize(
+    graph: rdflib.Graph,
+    sorted_triples: list["ox.Triple"],
+    placeholders: dict[str, rdflib.term.Node],
+    output_format: str,
+) -> str:
+    """Serialize the canonicalized triples of a graph that pyoxigraph cannot serialize, deterministically.
 
     pyoxigraph rejects some graphs that rdflib accepts -- notably graphs
     containing relative IRIs (e.g. the metamodel's ``bibo:status <testing>``)
@@ -91,23 +151,32 @@ def _deterministic_fallback_serialize(graph: rdflib.Graph, output_format: str) -
     structure and grouping of the output varies run to run.
 
     To degrade gracefully instead of silently emitting non-deterministic
-    output, we canonicalize blank-node labels with rdflib's own
-    isomorphism-based canonicalization (:func:`rdflib.compare.to_canonical_graph`,
-    which uses a content-derived hash, not run-local ids) and preserve the
-    original prefix and base bindings that the canonical graph drops.  For
-    line-oriented formats we additionally sort the serialized lines, since
-    rdflib does not emit N-Triples/N-Quads in a stable order.
+    output, the triples have been canonicalized with RDFC-1.0, with the
+    rejected terms standing in as placeholder IRIs.  Here the placeholders are
+    swapped back, and rdflib serializes the resulting canonical graph with the
+    original prefix and base bindings.  For line-oriented formats we
+    additionally sort the serialized lines, since rdflib does not emit
+    N-Triples/N-Quads in a stable order.
 
     Relative IRIs are preserved verbatim (not resolved against the base): the
     goal is deterministic output, and silently rewriting ``<testing>`` into an
     absolute IRI would mask what is really a data problem in the source graph.
 
-    :param graph: The rdflib Graph that pyoxigraph could not parse.
+    :param graph: The rdflib Graph that pyoxigraph could not serialize.
+    :param sorted_triples: The canonicalized triples of ``graph``, with placeholders.
+    :param placeholders: The original term of each placeholder IRI.
     :param output_format: Target serialization format (e.g. ``"turtle"``, ``"nt"``).
     :return: Deterministic string serialization of the graph.
     """
-    canonical = to_canonical_graph(graph)
-    # to_canonical_graph builds a fresh graph without the source's namespace
+
+    def convert(term) -> rdflib.term.Node:
+        if isinstance(term, ox.NamedNode) and term.value in placeholders:
+            return placeholders[term.value]
+        return from_oxigraph(term)
+
+    canonical = rdflib.Graph()
+    canonical.addN((convert(t.subject), convert(t.predicate), convert(t.object), canonical) for t in sorted_triples)
+    # The canonical graph is a fresh graph without the source's namespace
     # bindings; rebind them so the output does not fall back to rdflib's
     # non-deterministic auto-generated ``ns1:``/``ns2:`` prefixes.
     for prefix, namespace in graph.namespace_manager.namespaces():
@@ -290,13 +359,14 @@ def canonicalize_rdf_graph(
 ) -> str:
     """Serialize an rdflib Graph deterministically using RDFC-1.0 canonicalization.
 
-    The graph is transferred to pyoxigraph via N-Triples, canonicalized
+    The graph is transferred to pyoxigraph term by term, canonicalized
     with RDFC-1.0, sorted, and serialized back to the requested format.
     Prefix bindings from the rdflib Graph are preserved in the output
     for formats that support them (Turtle, TriG, N3, RDF/XML).
 
-    Falls back to plain rdflib serialization for unsupported formats or
-    graphs containing non-standard RDF (e.g. literal predicates).
+    Falls back to plain rdflib serialization for unsupported formats, and
+    to rdflib serialization of the canonicalized graph for graphs containing
+    non-standard RDF (e.g. literal predicates).
 
     :param graph: The rdflib Graph to serialize.
     :param output_format: Target serialization format (e.g. ``"turtle"``, ``"nt"``).
@@ -312,34 +382,18 @@ def canonicalize_rdf_graph(
         )
         return graph.serialize(format=output_format)
 
-    # 1. Transfer rdflib graph to pyoxigraph via N-Triples.
-    nt_data = graph.serialize(format="nt")
-    nt_bytes = nt_data.encode("utf-8") if isinstance(nt_data, str) else nt_data
-
-    # 2. Parse into pyoxigraph and build a Dataset for canonicalization.
-    #    Fall back to rdflib if the graph contains non-standard RDF
-    #    (e.g. literal predicates from annotations) that pyoxigraph rejects.
-    try:
-        triples = list(ox.parse(io.BytesIO(nt_bytes), format=ox.RdfFormat.N_TRIPLES))
-    except SyntaxError:
-        warnings.warn(
-            "Graph contains non-standard RDF (e.g. relative IRIs or literal predicates) "
-            "that pyoxigraph cannot parse; falling back to rdflib. Output is still "
-            "deterministic (blank-node labels are canonicalized via rdflib) but is not "
-            "canonicalized with pyoxigraph RDFC-1.0.",
-            RDFCanonicalizationWarning,
-            stacklevel=2,
-        )
-        return _deterministic_fallback_serialize(graph, output_format)
+    # 1. Transfer rdflib graph to pyoxigraph, term by term.
+    #    Terms that pyoxigraph rejects (e.g. relative IRIs, or literal
+    #    predicates from annotations) are replaced by placeholder IRIs.
+    triples, placeholders = _to_oxigraph_triples(graph)
 
+    # 2. Build a Dataset and canonicalize blank node labels with RDFC-1.0.
     dataset = ox.Dataset()
     for triple in triples:
         dataset.add(ox.Quad(triple.subject, triple.predicate, triple.object, ox.DefaultGraph()))
-
-    # 3. Canonicalize blank node labels with RDFC-1.0.
     dataset.canonicalize(ox.CanonicalizationAlgorithm.RDFC_1_0)
 
-    # 4. Sort triples for deterministic ordering.
+    # 3. Sort triples for deterministic ordering.
     # RDFC-1.0 stabilizes blank-node labels but pyoxigraph's Dataset
     # iteration order is not sorted and varies across processes (verified
     # empirically against pyoxigraph 0.5.8). The explicit string-key sort
@@ -351,9 +405,23 @@ def canonicalize_rdf_graph(
         key=lambda t: (str(t.subject), str(t.predicate), str(t.object)),
     )
 
+    # 4. Fall back to rdflib's serializer if the graph contains non-standard
+    #    RDF that pyoxigraph cannot serialize.
+    if placeholders:
+        warnings.warn(
+            "Graph contains non-standard RDF (e.g. relative IRIs or literal predicates) "
+            "that pyoxigraph cannot serialize; falling back to rdflib. Output is still "
+            "deterministic (blank-node labels are canonicalized with RDFC-1.0) but is "
+            "serialized by rdflib.",
+            RDFCanonicalizationWarning,
+            stacklevel=2,
+        )
+        return _deterministic_fallback_serialize(graph, sorted_triples, placeholders, output_format)
+
     # 5. Collect prefixes for formats that support them.
     base_iri = str(graph.base) if graph.base else None
     prefixes: dict[str, str] | None = None
+    has_trailing_dot_iris = False
     if ox_format in _PREFIX_FORMATS:
         prefixes = {}
         for prefix, namespace in graph.namespace_manager.namespaces():
@@ -377,7 +445,10 @@ def canonicalize_rdf_graph(
         # bindings (~30 well-known vocabularies) from being emitted into
         # every output file regardless of whether the schema actually uses
         # them.
-        prefixes = _filter_prefixes_to_used(prefixes, _iri_terms(sorted_triples))
+        used_iris = _iri_terms(sorted_triples)
+        prefixes = _filter_prefixes_to_used(prefixes, used_iris)
+        # Only IRIs ending in '.' can be compacted into CURIEs that end in '\.'.
+        has_trailing_dot_iris = any(iri.endswith(".") for iri in used_iris)
     used_prefixes = prefixes
     try:
         result_bytes = ox.serialize(
@@ -407,6 +478,6 @@ def canonicalize_rdf_graph(
         )
         used_prefixes = None
     result = result_bytes.decode("utf-8")
-    if ox_format in _PREFIX_FORMATS and used_prefixes:
+    if ox_format in _PREFIX_FORMATS and used_prefixes and has_trailing_dot_iris:
         result = _expand_trailing_dot_curies(result, used_prefixes)
     return result
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: CC0-1.0
 
 import re
+from functools import cache
 
 """
 Regular-expression-based URI and CURIE validation functions
@@ -323,18 +324,42 @@ safe_CURIE = rf"""(?P<safe_CURIE>
 # -----------------------------------------------------------------------------
 #
 ### Compile the regular expressions for better performance
+#
+# These are large patterns that take a noticeable part of a second to compile, so each is
+# compiled the first time it is used rather than when this module is imported.
+
+_PATTERNS = {
+    "uri_validator": URI,
+    # "uri_ref_validator": URI_reference,
+    "uri_relative_ref_validator": relative_ref,
+    "abs_uri_validator": absolute_URI,
+    "curie_validator": CURIE,
+    "safe_curie_validator": safe_CURIE,
+}
+
 
-uri_validator = re.compile(f"^{URI}$", re.VERBOSE)
+# The great majority of URIs seen in practice are simple ones such as http://example.org/a/b#c.  This pattern only
+# matches URIs that the full URI pattern also matches (a scheme, a registered name with an optional port, and a
+# path, query and fragment without percent-encoding), so that they can be validated without compiling the full one.
+_simple_uri_validator = re.compile(
+    r"^[A-Za-z][A-Za-z0-9+.-]*://[A-Za-z0-9._~-]*(?::[0-9]*)?"
+    r"(?:/[A-Za-z0-9._~!$&'()*+,;=:@-]*)*"
+    r"(?:\?[A-Za-z0-9._~!$&'()*+,;=:@/?-]*)?"
+    r"(?:#[A-Za-z0-9._~!$&'()*+,;=:@/?-]*)?$"
+)
 
-# uri_ref_validator = re.compile(f"^{URI_reference}$", re.VERBOSE)
 
-uri_relative_ref_validator = re.compile(f"^{relative_ref}$", re.VERBOSE)
+@cache
+def _validator(name: str) -> re.Pattern:
+    return re.compile(f"^{_PATTERNS[name]}$", re.VERBOSE)
 
-abs_uri_validator = re.compile(f"^{absolute_URI}$", re.VERBOSE)
 
-curie_validator = re.compile(f"^{CURIE}$", re.VERBOSE)
+def __getattr__(name: str) -> re.Pattern:
+    # uri_validator, curie_validator etc. remain importable from this module
+    if name in _PATTERNS:
+        return _validator(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-safe_curie_validator = re.compile(f"^{safe_CURIE}$", re.VERBOSE)
 
 # -----------------------------------------------------------------------------
 #
@@ -342,7 +367,7 @@ safe_curie_validator = re.compile(f"^{safe_CURIE}$", re.VERBOSE)
 
 
 def validate_uri(input):
-    return uri_validator.match(input)
+    return _simple_uri_validator.match(input) or _validator("uri_validator").match(input)
 
 
 def validate_uri_reference(input):
@@ -353,8 +378,8 @@ def validate_uri_reference(input):
     #
 
     #   URI-reference = URI / relative-ref
-    return uri_validator.match(input) or uri_relative_ref_validator.match(input)
+    return validate_uri(input) or _validator("uri_relative_ref_validator").match(input)
 
 
 def validate_curie(input):
-    return curie_validator.match(input)
+    return _validator("curie_validator").match(input)
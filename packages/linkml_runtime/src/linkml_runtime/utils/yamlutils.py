@@ -3,6 +3,7 @@ import re
 import textwrap
 from collections.abc import Callable
 from copy import copy
+from functools import cache
 from json import JSONDecoder
 from pprint import pformat
 from typing import Any, Union
@@ -122,23 +123,23 @@ class YAMLRoot(JsonObj):
         @param is_list: True means inlined as list
         """
         raw_slot: list | dict | JsonObj = self[slot_name]
-        if raw_slot is None:
-            raw_slot = []
-        elif not isinstance(raw_slot, dict | list | JsonObj):
+        if raw_slot is None or (isinstance(raw_slot, list | dict) and not raw_slot):
+            # Nothing to normalize -- by far the most common case
+            self[slot_name] = list() if is_list else dict()
+            return
+        if not isinstance(raw_slot, dict | list | JsonObj):
             raw_slot = [raw_slot]
         cooked_slot = list() if is_list else dict()
         cooked_keys = set()
 
-        # For SimpleDict patterns (key:value shorthand), find the first
-        # non-key field so we can use kwargs instead of positional args.
-        try:
-            _value_field = next((f.name for f in dataclasses.fields(slot_type) if f.name != key_name), None)
-        except TypeError:
-            _value_field = None
+        # The non-key fields of the range class in declaration order.  For SimpleDict patterns
+        # (key:value shorthand), the first one takes the value so we can use kwargs instead of positional args.
+        non_key_fields = _non_key_fields(slot_type, key_name)
+        _value_field = non_key_fields[0] if non_key_fields else None
 
         def order_up(key: Any, cooked_entry: YAMLRoot) -> None:
             """A cooked entry is ready to be added to the return slot"""
-            if cooked_entry[key_name] != key:
+            if getattr(cooked_entry, key_name) != key:
                 raise ValueError(
                     f"Slot: {loc(slot_name)} - attribute {loc(key_name)} "
                     f"value ({loc(cooked_entry[key_name])}) does not match key ({loc(key)})"
@@ -158,18 +159,22 @@ class YAMLRoot(JsonObj):
                 loc_str = ""
             return loc_str + str(s)
 
+        def cook(key: Any, raw_obj: dict | JsonObj | None) -> YAMLRoot:
+            """Construct the slot_type instance for the raw_obj that is stored under key"""
+            if raw_obj is None:
+                return slot_type(**{key_name: key})
+            if issubclass(type(raw_obj), slot_type):
+                return raw_obj
+            kwargs = as_dict(raw_obj)
+            if key_name not in kwargs:
+                # Merge instead of assigning -- kwargs may be the caller's own dictionary
+                return slot_type(**kwargs, **{key_name: key})
+            return slot_type(**kwargs)
+
         def form_1(entries: dict[Any, dict | JsonObj | None]) -> None:
             """A dictionary of key:dict entries where key is the identifier and dict is an instance of slot_type"""
             for key, raw_obj in items(entries):
-                if raw_obj is None:
-                    raw_obj = {}
-                if key_name not in raw_obj:
-                    raw_obj = copy(raw_obj)
-                    raw_obj[key_name] = key
-                if not issubclass(type(raw_obj), slot_type):
-                    order_up(key, slot_type(**as_dict(raw_obj)))
-                else:
-                    order_up(key, raw_obj)
+                order_up(key, cook(key, raw_obj))
 
         # TODO: Make an external function extract a root JSON list
         if isinstance(raw_slot, JsonObj):
@@ -179,7 +184,7 @@ class YAMLRoot(JsonObj):
             # We have a list of entries
             for list_entry in raw_slot:
                 if isinstance(list_entry, slot_type):
-                    order_up(list_entry[key_name], list_entry)
+                    order_up(getattr(list_entry, key_name), list_entry)
                 elif isinstance(list_entry, dict | JsonObj):
                     # list_entry is either a key:dict, key_name:value or **kwargs
                     if len(list_entry) == 1:
@@ -200,15 +205,14 @@ class YAMLRoot(JsonObj):
                     else:
                         # **kwargs
                         cooked_obj = slot_type(**as_dict(list_entry))
-                        order_up(cooked_obj[key_name], cooked_obj)
+                        order_up(getattr(cooked_obj, key_name), cooked_obj)
                 elif isinstance(list_entry, list):
                     # First element is the key; remaining map to non-key fields in order
-                    non_key_fields = [f.name for f in dataclasses.fields(slot_type) if f.name != key_name]
                     kwargs = {key_name: list_entry[0]}
                     for fname, val in zip(non_key_fields, list_entry[1:]):
                         kwargs[fname] = val
                     cooked_obj = slot_type(**kwargs)
-                    order_up(cooked_obj[key_name], cooked_obj)
+                    order_up(getattr(cooked_obj, key_name), cooked_obj)
                 else:
                     # lone key [key1: , key2: ... }
                     order_up(list_entry, slot_type(**{key_name: list_entry}))
@@ -224,12 +228,8 @@ class YAMLRoot(JsonObj):
             else:
                 # We have either {key1: {obj1}, key2: {obj2}...} or {key1:, key2:, ...}
                 for k, v in items(raw_slot):
-                    if v is None:
-                        v = dict()
-                    if isinstance(v, slot_type):
-                        order_up(k, v)
-                    elif isinstance(v, dict | JsonObj):
-                        form_1({k: v})
+                    if v is None or isinstance(v, dict | JsonObj):
+                        order_up(k, cook(k, v))
                     else:
                         # SimpleDict form: value may be scalar or list (multivalued)
                         kwargs = {key_name: k}
@@ -309,6 +309,15 @@ class YAMLRoot(JsonObj):
         return repr(self)
 
 
+@cache
+def _non_key_fields(slot_type: type, key_name: str) -> tuple[str, ...]:
+    """The names of the fields of slot_type other than key_name, in declaration order"""
+    try:
+        return tuple(f.name for f in dataclasses.fields(slot_type) if f.name != key_name)
+    except TypeError:
+        return ()
+
+
 def _pformat(fields: dict, cls_name: str, indent: str = "  ") -> str:
     """
     pretty format the fields of the items of a ``YAMLRoot`` object without the wonky indentation of pformat.
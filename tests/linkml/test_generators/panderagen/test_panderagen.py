@@ -65,6 +65,12 @@ def test_dump_schema_code(synthetic_pandera_schema):
     assert all(column in code for column in MODEL_COLUMNS)
 
 
+def test_processes(synthetic_pandera_schema, synthetic_flat_dataframe_model):
+    """Classes built in worker processes give the same code"""
+    generator = type(synthetic_pandera_schema)(synthetic_flat_dataframe_model, processes=2)
+    assert generator.serialize() == synthetic_pandera_schema.serialize()
+
+
 def test_get_metadata(compiled_synthetic_pandera_schema_module):
     logger.info(compiled_synthetic_pandera_schema_module.PanderaSyntheticTable.get_metadata())
 
@@ -1105,6 +1105,18 @@ def test_subfolder_type_separation(kitchen_sink_path, tmp_path):
     )
 
 
+def test_processes(kitchen_sink_path, tmp_path):
+    """Pages rendered in worker processes are the same as pages rendered one after another"""
+    for processes in (1, 2):
+        gen = DocGenerator(kitchen_sink_path, mergeimports=True, subfolder_type_separation=True, processes=processes)
+        gen.serialize(directory=str(tmp_path / str(processes)))
+    expected = sorted(p.relative_to(tmp_path / "1") for p in (tmp_path / "1").rglob("*.md"))
+    assert expected
+    assert sorted(p.relative_to(tmp_path / "2") for p in (tmp_path / "2").rglob("*.md")) == expected
+    for path in expected:
+        assert (tmp_path / "2" / path).read_text() == (tmp_path / "1" / path).read_text()
+
+
 def test_uml_diagram_er(kitchen_sink_path, tmp_path):
     gen = DocGenerator(
         kitchen_sink_path,
@@ -1,4 +1,11 @@
-from linkml.generators.projectgen import ProjectConfiguration, ProjectGenerator
+import multiprocessing
+
+import pytest
+
+from linkml.generators.projectgen import GEN_MAP, ProjectConfiguration, ProjectGenerator
+from linkml.generators.shexgen import ShExGenerator
+from linkml.utils.generator import SchemaContext
+from linkml_runtime.dumpers import yaml_dumper
 
 
 def test_projectgen(kitchen_sink_path, tmp_path):
@@ -20,3 +27,58 @@ def test_projectgen(kitchen_sink_path, tmp_path):
     check_contains("CREATE TABLE", "sqlschema", "kitchen_sink.sql")
     check_contains("ks:age_in_years a owl:DatatypeProperty", "owl", "kitchen_sink.owl.ttl")
     check_contains('"additionalProperties": false', "jsonschema", "kitchen_sink.schema.json")
+
+
+@pytest.mark.parametrize("gen_name", ["python", "jsonld", "jsonschema", "sqltable"])
+def test_shared_schema_context(kitchen_sink_path, gen_name):
+    """Generators give the same output for a shared SchemaContext as for the schema path, and leave it unchanged"""
+    gen_cls, _, _ = GEN_MAP[gen_name]
+    context = SchemaContext(str(kitchen_sink_path), metadata=False)
+    before = yaml_dumper.dumps(context.loader.schema), yaml_dumper.dumps(context.schemaview.schema)
+    from_context = gen_cls(context, metadata=False).serialize()
+    from_path = gen_cls(kitchen_sink_path, metadata=False).serialize()
+    # sqltable emits indexes in no fixed order, and jsonld always stamps the generation date
+    assert sorted(line for line in from_context.splitlines() if "generation_date" not in line) == sorted(
+        line for line in from_path.splitlines() if "generation_date" not in line
+    )
+    assert (yaml_dumper.dumps(context.loader.schema), yaml_dumper.dumps(context.schemaview.schema)) == before
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs forked worker processes")
+def test_projectgen_processes(kitchen_sink_path, tmp_path):
+    """Generators run in worker processes write the same files, and report the time each took"""
+    config = ProjectConfiguration(directory=tmp_path, includes=["shex", "jsonschema", "owl"], processes=2)
+    timings = ProjectGenerator().generate(kitchen_sink_path, config)
+    assert set(timings) == {"shex", "jsonschema", "owl"}
+    assert (tmp_path / "shex" / "kitchen_sink.shex").read_text() == ShExGenerator(kitchen_sink_path).serialize()
+
+
+def test_projectgen_build_cache(tmp_path):
+    """Artefacts are only regenerated when the schema files or options change, or when forced"""
+    schema_dir = tmp_path / "schema"
+    schema_dir.mkdir()
+    schema_path = schema_dir / "main.yaml"
+    schema_path.write_text(
+        "id: https://example.org/main\nname: main\nimports:\n  - linkml:types\n  - core\n"
+        "prefixes:\n  linkml: https://w3id.org/linkml/\ndefault_range: string\n"
+        "classes:\n  Person:\n    slots:\n      - name\n"
+    )
+    core_path = schema_dir / "core.yaml"
+    core_path.write_text("id: https://example.org/core\nname: core\nslots:\n  name:\n")
+    config = ProjectConfiguration(directory=tmp_path / "out", includes=["python", "jsonschema"])
+    config.mergeimports = True
+
+    assert set(ProjectGenerator.generate(str(schema_path), config)) == {"python", "jsonschema"}
+    assert ProjectGenerator.generate(str(schema_path), config) == {}
+
+    config.generator_args["jsonschema"] = {"top_class": "Person"}
+    assert set(ProjectGenerator.generate(str(schema_path), config)) == {"jsonschema"}
+
+    core_path.write_text("id: https://example.org/core\nname: core\nslots:\n  name:\n  age:\n")
+    assert set(ProjectGenerator.generate(str(schema_path), config)) == {"python", "jsonschema"}
+
+    (tmp_path / "out" / "main.py").unlink()
+    assert set(ProjectGenerator.generate(str(schema_path), config)) == {"python"}
+
+    config.force = True
+    assert set(ProjectGenerator.generate(str(schema_path), config)) == {"python", "jsonschema"}
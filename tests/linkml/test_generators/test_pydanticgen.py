@@ -2778,6 +2778,13 @@ def test_lifecycle_slots(kitchen_sink_path):
             assert attr.meta["extra_meta_field"]
 
 
+@pytest.mark.parametrize("split", [False, True])
+def test_processes(kitchen_sink_path, split):
+    """Classes built in worker processes give the same module as classes built one after another"""
+    expected = PydanticGenerator(kitchen_sink_path, split=split).serialize()
+    assert PydanticGenerator(kitchen_sink_path, split=split, processes=2).serialize() == expected
+
+
 def test_union_of():
     """
     Test that classes with union_of generate proper type aliases
@@ -1326,3 +1326,54 @@ def test_subproperty_of_cargo_check(temp_dir):
         pytest.fail(
             f"cargo check failed for subproperty_of schema.\nstdout:\n{result.stdout}\n\nstderr:\n{result.stderr}\n"
         )
+
+
+def test_processes(temp_dir):
+    """Classes built in worker processes give the same file, including the subproperty enums they generate."""
+    schema_yaml = textwrap.dedent(
+        """
+        id: https://example.org/test
+        name: test_processes
+        prefixes:
+          ex: https://example.org/
+          linkml: https://w3id.org/linkml/
+        default_prefix: ex
+        imports:
+          - linkml:types
+
+        slots:
+          related_to:
+            slot_uri: ex:related_to
+          causes:
+            is_a: related_to
+            slot_uri: ex:causes
+          predicate:
+            range: uriorcurie
+            subproperty_of: related_to
+          qualifier:
+            range: string
+            subproperty_of: causes
+
+        classes:
+          Association:
+            slots:
+              - predicate
+          Qualified:
+            slots:
+              - qualifier
+          Other:
+            slots:
+              - predicate
+              - qualifier
+        """
+    )
+    schema_path = Path(temp_dir) / "rustgen_processes.yaml"
+    schema_path.write_text(schema_yaml, encoding="utf-8")
+
+    outputs = []
+    for processes in (1, 3):
+        gen = RustGenerator(str(schema_path), mode="file", processes=processes)
+        outputs.append(gen.serialize(output=Path(temp_dir) / f"processes_{processes}.rs", force=True))
+    assert "PredicateEnum" in outputs[0]
+    assert "QualifierEnum" in outputs[0]
+    assert outputs[1] == outputs[0]
@@ -0,0 +1,65 @@
+"""
+tests the ``linkml`` entrypoint, whose subcommands are imported only when they are used
+"""
+
+import subprocess
+import sys
+
+import click
+import pytest
+
+from linkml.cli.main import dev, generate, linkml
+
+
+@pytest.mark.parametrize("group", [linkml, generate, dev], ids=lambda group: group.name)
+def test_lazy_subcommands(group):
+    """Each lazy subcommand can be imported, and the help kept for it lists the same as the command's own"""
+    for name, (_, help) in group.lazy_subcommands.items():
+        cmd = group.get_command(click.Context(group), name)
+        assert isinstance(cmd, click.Command), name
+        for limit in (45, 1000):
+            assert click.Command(name, help=help).get_short_help_str(limit) == cmd.get_short_help_str(limit), name
+
+
+# Runs the entrypoint, then lists the modules it imported once it has exited
+_RUN_LINKML = """
+import atexit, sys
+atexit.register(lambda: print(*sys.modules, sep="\\n", file=sys.__stderr__))
+from linkml.cli.main import linkml
+linkml(sys.argv[1:])
+"""
+
+
+def _imported_modules(*args: str) -> set[str]:
+    """Modules imported by running ``linkml`` with the given arguments"""
+    result = subprocess.run([sys.executable, "-c", _RUN_LINKML, *args], capture_output=True, text=True, check=True)
+    return set(result.stderr.split())
+
+
+@pytest.mark.parametrize(
+    "args,imported,not_imported",
+    [
+        (
+            ["--help"],
+            [],
+            ["linkml.generators", "linkml.validator", "linkml.linter", "jinja2", "sqlalchemy", "openpyxl"],
+        ),
+        (
+            ["generate", "--help"],
+            [],
+            ["linkml.generators", "jinja2", "sqlalchemy", "openpyxl"],
+        ),
+        (
+            ["generate", "csv", "--help"],
+            ["linkml.generators.csvgen"],
+            ["linkml.generators.pydanticgen", "linkml.generators.owlgen", "sqlalchemy", "openpyxl"],
+        ),
+    ],
+)
+def test_import_time(args, imported, not_imported):
+    """Only the subcommand that is run is imported"""
+    modules = _imported_modules(*args)
+    for module in imported:
+        assert module in modules
+    for module in not_imported:
+        assert module not in modules
@@ -398,6 +398,45 @@ def test_visitors(input_path):
     assert expected5 == gen.visited
 
 
+@dataclass
+class FragmentGenerator(Generator):
+    generatorname = os.path.basename(__file__)
+    generatorversion = "0.0.1"
+    valid_formats = ["txt"]
+
+    head: str = ""
+    tail: str = ""
+    emit_classes: bool = True
+
+    def visit_schema(self, **kwargs) -> str:
+        return self.head
+
+    def visit_class(self, cls: ClassDefinition) -> str | None:
+        return f"{cls.name}  \n\n" if self.emit_classes else None
+
+    def end_schema(self, **kwargs) -> str:
+        return self.tail
+
+
+@pytest.mark.parametrize(
+    "head,tail,emit_classes,expected_end",
+    [
+        ("", "", True, "mixin2\n"),
+        ("classes:\n", " \n \n", True, "mixin2\n"),
+        ("ht", "tp://example.org/ \n", True, "mixin2  \n\ntp://example.org/\n"),
+        ("ht", "tp://example.org/ \n", False, "http://example.org/"),
+        ("", "http://example.org/\n", False, "http://example.org/"),
+    ],
+)
+def test_serialize_to(input_path, head, tail, emit_classes, expected_end):
+    """serialize_to writes what serialize returns, with the same trailing whitespace"""
+    gen = FragmentGenerator(str(input_path("generator1.yaml")), head=head, tail=tail, emit_classes=emit_classes)
+    out = StringIO()
+    gen.serialize_to(out)
+    assert out.getvalue() == gen.serialize()
+    assert out.getvalue().endswith(expected_end)
+
+
 def test_default_prefix():
     """Test default prefix utility"""
     model = """
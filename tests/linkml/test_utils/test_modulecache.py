@@ -0,0 +1,101 @@
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from linkml.generators.pydanticgen import PydanticGenerator
+from linkml.generators.pythongen import PythonGenerator
+from linkml.utils import rawloader
+from linkml.utils.modulecache import ModuleCache, module_cache, module_key
+from linkml_runtime.utils.compile_python import compile_python
+
+SCHEMA = """
+id: https://example.org/test
+name: test
+prefixes:
+  linkml: https://w3id.org/linkml/
+imports:
+  - linkml:types
+default_range: string
+classes:
+  Person:
+    attributes:
+      name:
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_module_cache():
+    module_cache.clear()
+    yield
+    module_cache.clear()
+
+
+@pytest.mark.parametrize("generator", [PythonGenerator, PydanticGenerator])
+def test_compile_module_shared(generator, monkeypatch):
+    """A second generator with the same schema and options gets the module of the first without generating code"""
+    module = generator(SCHEMA).compile_module()
+    monkeypatch.setattr(generator, "serialize", lambda *args, **kwargs: pytest.fail("generated again"))
+    assert generator(SCHEMA).compile_module() is module
+    assert sys.modules["test"] is module
+
+
+@pytest.mark.parametrize("generator", [PythonGenerator, PydanticGenerator])
+def test_compile_module_key(generator):
+    """Changing the schema, the options or the generator gives another module"""
+    module = generator(SCHEMA).compile_module()
+    changed_schema = generator(SCHEMA.replace("      name:", "      full_name:")).compile_module()
+    assert changed_schema is not module
+    fields = getattr(changed_schema.Person, "model_fields", None) or changed_schema.Person.__dataclass_fields__
+    assert "full_name" in fields
+    assert generator(SCHEMA, metadata=False).compile_module() is not module
+    assert generator(SCHEMA).compile_module() is module
+
+
+@pytest.mark.parametrize("generator", [PythonGenerator, PydanticGenerator])
+def test_module_key_ignores_load_time(generator, monkeypatch):
+    """Schemas loaded on different clock ticks, and so with different generation dates, have the same key"""
+
+    class _Ticking(datetime):
+        now_calls = 0
+
+        @classmethod
+        def now(cls, tz=None):
+            cls.now_calls += 1
+            return datetime(2024, 1, 1) + timedelta(seconds=cls.now_calls)
+
+    monkeypatch.setattr(rawloader, "datetime", _Ticking)
+    first, second = generator(SCHEMA), generator(SCHEMA)
+    if generator.uses_schemaloader:
+        assert first.schema.generation_date != second.schema.generation_date
+    assert module_key(first) == module_key(second)
+
+
+def test_module_key():
+    assert module_key(PythonGenerator(SCHEMA)) == module_key(PythonGenerator(SCHEMA))
+    assert module_key(PythonGenerator(SCHEMA)) != module_key(PydanticGenerator(SCHEMA))
+    # Options that do not change the code do not change the key
+    assert module_key(PydanticGenerator(SCHEMA)) == module_key(PydanticGenerator(SCHEMA, processes=2))
+
+
+def test_cache_directory(tmp_path):
+    """Generated code written to the cache directory is loaded from there by another cache"""
+    source = PydanticGenerator(SCHEMA).serialize()
+    ModuleCache(tmp_path).put("k", compile_python(source), source)
+    assert (tmp_path / "linkml_k.py").read_text() == source
+
+    cache = ModuleCache(tmp_path)
+    module = cache.get("k")
+    assert module.Person(name="x").name == "x"
+    assert sys.modules["test"] is module
+    assert cache.get("k") is module
+    assert cache.get("other") is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_size():
+    cache = ModuleCache(maxsize=2)
+    for key in "abc":
+        cache.put(key, compile_python(f"x = {key!r}\n"), "")
+    assert list(cache.modules) == ["b", "c"]
+    assert cache.get("a") is None
@@ -7,6 +7,8 @@ import pytest
 from jsonasobj2 import as_json
 
 from linkml.utils.schemaloader import SchemaLoader
+from linkml_runtime import SchemaView
+from linkml_runtime.dumpers import yaml_dumper
 
 
 @pytest.mark.skip(reason="Disabled until we get SchemaDefinitionList implemented")
@@ -41,6 +43,22 @@ def test_imports(input_path, snapshot):
     assert loader.synopsis.errors() == []
 
 
+@pytest.mark.parametrize("schema", ["base.yaml", "relative_import_test/main.yaml"])
+def test_schemaview_parsed_schemas(input_path, schema):
+    """A loader given a SchemaView copies the files it has read, and resolves the same schema"""
+    sv = SchemaView(input_path(schema))
+    sv.imports_closure(inject_metadata=False)
+    before = yaml_dumper.dumps(sv.schema)
+    loader = SchemaLoader(input_path(schema), schemaview=sv)
+    assert len(loader.parsed_schemas) == len(sv.schema_map) > 1
+    expected = SchemaLoader(input_path(schema)).resolve()
+    expected.generation_date = None
+    resolved = loader.resolve()
+    resolved.generation_date = None
+    assert as_json(resolved) == as_json(expected)
+    assert yaml_dumper.dumps(sv.schema) == before
+
+
 def test_imports_relative(input_path):
     loader = SchemaLoader(input_path("relative_import_test/main.yaml"))
     loader.resolve()
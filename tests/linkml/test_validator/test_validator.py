@@ -4,7 +4,7 @@ import pytest
 
 from linkml.utils.exceptions import ValidationError
 from linkml.validator import Validator
-from linkml.validator.loaders import Loader
+from linkml.validator.loaders import Loader, YamlLoader
 from linkml.validator.plugins import ValidationPlugin
 from linkml.validator.report import Severity, ValidationResult
 from linkml.validator.validation_context import ValidationContext
@@ -139,6 +139,25 @@ def test_iter_results_from_source():
     assert len(results) == 10
 
 
+def test_iter_results_from_source_with_location(tmp_file_factory):
+    plugins = [AcceptNothingValidationPlugin(1)]
+    validator = Validator(SCHEMA, plugins)
+    yaml_path = tmp_file_factory(
+        "data.yaml",
+        """- id: 1
+- id: 2
+  name: two
+- id: 3
+""",
+    )
+    results = list(validator.iter_results_from_source(YamlLoader(yaml_path)))
+    assert [r.instance_index for r in results] == [0, 1, 2]
+    assert [r.instance_line for r in results] == [1, 2, 4]
+
+    results = list(validator.iter_results_from_source(TestDataLoader(None, 2)))
+    assert [r.instance_line for r in results] == [None, None]
+
+
 def test_no_plugins():
     validator = Validator(SCHEMA)
     report = validator.validate({"foo": "bar"})
@@ -59,3 +59,33 @@ b: two
     assert next(instances) == {"a": 5, "b": "six"}
     with pytest.raises(StopIteration):
         next(instances)
+
+
+def test_instance_locations(tmp_file_factory):
+    yaml_path = tmp_file_factory(
+        "data.yaml",
+        """a: 1
+---
+- a: 2
+  b: &shared
+    c: 3
+- a: 4
+  b: *shared
+---
+""",
+    )
+
+    loader = YamlLoader(yaml_path)
+    assert list(loader.iter_instances_with_location()) == [
+        ({"a": 1}, 1),
+        ({"a": 2, "b": {"c": 3}}, 3),
+        ({"a": 4, "b": {"c": 3}}, 6),
+        (None, 9),
+    ]
+
+
+def test_empty_file(tmp_file_factory):
+    yaml_path = tmp_file_factory("data.yaml", "")
+
+    loader = YamlLoader(yaml_path)
+    assert list(loader.iter_instances()) == []
@@ -122,3 +122,36 @@ def test_object_index(schema_view, container, object_index):
     config = Config(use_expressions=True)
     infer_slot_value(person, "description", schemaview=schema_view, class_name="Person", config=config)
     assert person.description == "name: fred bloggs address: 1 oak street"
+
+
+def test_lazy_indexing(container, schema_view):
+    """The tree is only indexed as far as lookups need it."""
+    oix = ObjectIndex(container, schemaview=schema_view)
+    assert oix.bless(container.persons[0]).has_familial_relationships[0].related_to.name == "Alison Wu"
+    assert ("Organization", "ROR:1") not in oix._source_object_cache
+    assert oix.source_object_cache_size > 4
+    assert ("Organization", "ROR:1") in oix._source_object_cache
+
+
+def test_referencing_objects(container, schema_view, object_index):
+    """Objects that refer to an object without inlining it are found through the inverse of the slot."""
+    person = object_index.bless(container.persons[1])
+    relationships = person.related_to__inverse
+    assert len(relationships) == 1
+    assert isinstance(relationships[0], ProxyObject)
+    assert relationships[0].related_to.id == "P:002"
+    assert object_index.referencing_objects(("Person", "P:001"), "related_to") == [
+        container.persons[1].has_familial_relationships[0]
+    ]
+
+
+def test_bounded_proxy_cache(container, schema_view):
+    """The proxy cache keeps at most proxy_cache_size proxies, dropping the least recently used."""
+    oix = ObjectIndex(container, schemaview=schema_view, proxy_cache_size=2)
+    p1 = oix.bless(container.persons[0])
+    oix.bless(container.persons[1])
+    assert oix.bless(container.persons[0]) is p1
+    oix.bless(container)
+    assert oix.proxy_object_cache_size == 2
+    assert ("Person", "P:002") not in oix._proxy_object_cache
+    assert oix.bless(container.persons[0]) is p1
@@ -1,3 +1,4 @@
+import io
 import json
 import logging
 import os
@@ -5,7 +6,7 @@ import os
 import pytest
 from jsonasobj2 import as_json_obj
 
-from linkml_runtime.dumpers import csv_dumper, json_dumper, tsv_dumper, yaml_dumper
+from linkml_runtime.dumpers import csv_dumper, delimited_file_dumper, json_dumper, tsv_dumper, yaml_dumper
 from linkml_runtime.loaders import csv_loader, tsv_loader, yaml_loader
 from linkml_runtime.utils.list_utils import (
     check_data_for_delimiter,
@@ -105,6 +106,48 @@ def test_tsvgen_roundtrip_to_dict():
     assert roundtrip == json_dumper.to_dict(data)
 
 
+def test_dump_to_stream(tmp_path):
+    schemaview = SchemaView(SCHEMA)
+    data = yaml_loader.load(DATA, target_class=Shop)
+    output_file = tmp_path / "books.tsv"
+    with open(output_file, "w") as stream:
+        tsv_dumper.dump_to_stream(data, stream, index_slot="all_book_series", schemaview=schemaview)
+    assert output_file.read_text() == tsv_dumper.dumps(data, index_slot="all_book_series", schemaview=schemaview)
+    roundtrip = tsv_loader.load(
+        str(output_file), target_class=Shop, index_slot="all_book_series", schemaview=schemaview
+    )
+    assert roundtrip == data
+
+
+def test_dump_to_stream_walks_collection_once(monkeypatch):
+    schemaview = SchemaView(SCHEMA)
+    data = yaml_loader.load(DATA, target_class=Shop)
+    walks = []
+
+    def _iter_collection(element, index_slot):
+        walks.append(index_slot)
+        return iter(getattr(element, index_slot))
+
+    monkeypatch.setattr(delimited_file_dumper, "_iter_collection", _iter_collection)
+    output = tsv_dumper.dumps(data, index_slot="all_book_series", schemaview=schemaview)
+    assert walks == ["all_book_series"]
+    roundtrip = tsv_loader.load(
+        io.StringIO(output), target_class=Shop, index_slot="all_book_series", schemaview=schemaview
+    )
+    assert roundtrip == data
+
+
+def test_tsv_iter_objects():
+    schemaview = SchemaView(SCHEMA)
+    data = yaml_loader.load(DATA, target_class=Shop)
+    tsv_dumper.dump(data, to_file=OUTPUT, index_slot="all_book_series", schemaview=schemaview)
+    objs = tsv_loader.iter_objects(OUTPUT, target_class=BookSeries, index_slot="all_book_series", schemaview=schemaview)
+    assert not isinstance(objs, list)
+    assert list(objs) == data.all_book_series
+    objs = tsv_loader.load_many(OUTPUT, target_class=BookSeries, index_slot="all_book_series", schemaview=schemaview)
+    assert objs == data.all_book_series
+
+
 def test_csvgen_unroundtrippable():
     schemaview = SchemaView(SCHEMA)
     data = yaml_loader.load(DATA2, target_class=Shop)
@@ -1,10 +1,18 @@
+import json
 import os
+from datetime import date
+from decimal import Decimal
 from typing import cast
 
 import pytest
 from rdflib import SKOS, Literal, Namespace
 
 from linkml_runtime.dumpers import json_dumper, rdf_dumper, yaml_dumper
+from linkml_runtime.dumpers.json_dumper import _default, _remove_empty_items
+from linkml_runtime.linkml_model import meta
+from linkml_runtime.linkml_model.meta import SchemaDefinition
+from linkml_runtime.loaders import yaml_loader
+from linkml_runtime.utils.formatutils import remove_empty_items
 from linkml_runtime.utils.yamlutils import as_json_object
 from tests.linkml_runtime.support.clicktestcase import ClickTestCase
 from tests.linkml_runtime.test_loaders_dumpers import (
@@ -17,6 +25,7 @@ from tests.linkml_runtime.test_loaders_dumpers import (
     LD_11_SVR,
 )
 from tests.linkml_runtime.test_loaders_dumpers.environment import env
+from tests.linkml_runtime.test_loaders_dumpers.models import kitchen_sink_pydantic, personinfo
 from tests.linkml_runtime.test_loaders_dumpers.models.termci_schema import ConceptReference, ConceptSystem, Package
 
 OBO = Namespace("http://purl.obolibrary.org/obo/")
@@ -101,6 +110,49 @@ def test_json_dumper(test_package):
     )
 
 
+def test_json_dumper_to_dict(test_package):
+    """to_dict converts directly, but must agree with parsing the serialized JSON"""
+    assert json_dumper.to_dict(test_package) == json.loads(json_dumper.dumps(test_package, inject_type=False))
+
+    data = {"a": [1, (2, 3), {}, None, {"b": Decimal("1.5")}], 1: date(2020, 1, 1), None: True, "c": test_package}
+    expected = json.loads(json_dumper.dumps(data, inject_type=False))
+    assert json_dumper.to_dict(data) == expected
+    assert expected["a"] == [1, [2, 3], {}, None, {"b": "1.5"}]
+    assert expected["1"] == "2020-01-01"
+    assert expected["null"] is True
+    assert "@type" not in expected["c"]
+
+
+@pytest.mark.parametrize("value", [1.5, 1e16, 1e-7, -0.0, float("nan"), float("inf"), float("-inf"), 2**70])
+def test_json_dumper_numbers(value):
+    """Numbers are written as the stdlib json module writes them, whichever JSON libraries are installed"""
+    data = {"x": value, "y": [value]}
+    assert json_dumper.dumps(data, inject_type=False) == json.dumps(data, ensure_ascii=False, indent="  ")
+
+
+PARITY_INSTANCES = {
+    "kitchen_sink": lambda: yaml_loader.load(
+        env.input_path("kitchen_sink_normalized_inst_01.yaml"), kitchen_sink_pydantic.Dataset
+    ).model_dump(),
+    "kitchen_sink_schema": lambda: yaml_loader.load(
+        os.path.join(env.cwd, "models", "kitchen_sink.yaml"), SchemaDefinition
+    ),
+    "personinfo": lambda: yaml_loader.load(env.input_path("example_personinfo_data.yaml"), personinfo.Container),
+    "metamodel": lambda: yaml_loader.load(
+        os.path.join(os.path.dirname(meta.__file__), "model", "schema", "meta.yaml"), SchemaDefinition
+    ),
+    "dict": lambda: {"a": Decimal("1.5"), "b": [Decimal("2.0"), {}], "_c": {"d": None}, "e": {"_f": {"g": 1}}},
+}
+
+
+@pytest.mark.parametrize("name", PARITY_INSTANCES)
+def test_json_dumper_remove_empty_items_parity(name):
+    """The fused cleaning of to_dict and dumps keeps the rules of formatutils.remove_empty_items"""
+    instance = PARITY_INSTANCES[name]()
+    expected = json.loads(json.dumps(remove_empty_items(instance, hide_protected_keys=True), default=_default))
+    assert _remove_empty_items(instance, inside=False) == expected
+
+
 @pytest.mark.skip(reason="This needs an enhanced (https://github.com/hsolbrig/pyld) version of pyld")
 def test_rdf_dumper(test_package):
     """Test the rdf dumper"""
@@ -4,6 +4,7 @@ from typing import Optional, TextIO, Union
 
 import pytest
 from hbreader import FileInfo
+from pydantic import BaseModel
 
 from linkml_runtime.dumpers import yaml_dumper
 from linkml_runtime.linkml_model.meta import SchemaDefinition
@@ -191,6 +192,34 @@ def test_yaml_load_to_dict():
     assert "system" in data
 
 
+class _NamedModel(BaseModel):
+    id: str
+    name: str
+
+
+@pytest.mark.parametrize(
+    "loader,source",
+    [
+        (yaml_loader, "- id: ex:s1\n  name: s1\n- id: ex:s2\n  name: s2\n"),
+        (json_loader, '[{"id": "ex:s1", "name": "s1"},\n {"id": "ex:s2", "name": "s2"}]'),
+    ],
+)
+@pytest.mark.parametrize("target_class", [SchemaDefinition, _NamedModel])
+def test_load_many(loader, source, target_class):
+    """load_many and iter_load construct one target_class instance per list member"""
+    objs = loader.load_many(source, target_class)
+    assert [type(o) for o in objs] == [target_class, target_class]
+    assert [o.name for o in objs] == ["s1", "s2"]
+    assert list(loader.iter_load(source, target_class)) == objs
+    assert loader.load_any(source, target_class) == objs
+
+
+def test_load_many_single_object():
+    """A source holding one object loads as a one element list"""
+    objs = yaml_loader.load_many("id: ex:s1\nname: s1\n", SchemaDefinition)
+    assert objs == [SchemaDefinition(id="ex:s1", name="s1")]
+
+
 @pytest.mark.skip(reason="This test will not work until https://github.com/digitalbazaar/pyld/issues/149 is fixed")
 def test_rdf_loader(context_server):
     """Load obo_sample.ttl and obo_sample.jsonld, emit yaml and check the results"""
@@ -93,6 +93,29 @@ def test_load_from_list(loader_dumper_setup):
         assert p2.gender.code.text == "transgender man"
 
 
+@pytest.mark.parametrize("dumper", [json_dumper, yaml_dumper])
+def test_streaming_dump_matches_dumps(dumper, tmp_path):
+    """dump() writes the document field by field; the result must equal dumps()"""
+    container = yaml_loader.load(DATA, target_class=Container)
+    out = tmp_path / "container"
+    dumper.dump(container, to_file=str(out))
+    assert out.read_text(encoding="UTF-8") == dumper.dumps(container)
+
+    empty = Container()
+    dumper.dump(empty, to_file=str(out))
+    assert out.read_text(encoding="UTF-8") == dumper.dumps(empty)
+
+
+def test_json_dump_lines(tmp_path):
+    container = yaml_loader.load(DATA, target_class=Container)
+    out = tmp_path / "persons.jsonl"
+    json_dumper.dump_lines(container, str(out), index_slot="persons")
+    lines = out.read_text(encoding="UTF-8").splitlines()
+    assert len(lines) == len(container.persons)
+    assert [json.loads(line) for line in lines] == [json_dumper.to_dict(p) for p in container.persons]
+    assert json_loader.loads(lines[1], target_class=Person) == container.persons[1]
+
+
 def test_encoding(loader_dumper_setup):
     """
     This will reveal if generated yaml or json files are utf-8 encoded
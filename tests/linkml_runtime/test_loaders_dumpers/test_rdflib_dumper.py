@@ -1,16 +1,19 @@
 import logging
 from pathlib import Path
 
+import pyoxigraph
 import pytest
 from curies import Converter
 from pydantic import BaseModel
 from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
 from rdflib.namespace import RDF, SKOS, XSD
 
 from linkml_runtime import DataNotFoundError, MappingError
 from linkml_runtime.dumpers import rdflib_dumper, yaml_dumper
 from linkml_runtime.linkml_model import Prefix
 from linkml_runtime.loaders import rdflib_loader, yaml_loader
+from linkml_runtime.utils.oxigraph_store import OxigraphGraph
 from linkml_runtime.utils.schemaview import SchemaView
 from tests.linkml_runtime.test_loaders_dumpers import INPUT_DIR, OUTPUT_DIR
 from tests.linkml_runtime.test_loaders_dumpers.models.node_object import NodeObject, Triple
@@ -121,6 +124,34 @@ def test_rdflib_dumper(prefix_map):
     _check_objs(view, container)
 
 
+def test_dump_ntriples():
+    """Streamed N-Triples hold the same graph as as_rdf_graph."""
+    view = SchemaView(str(SCHEMA))
+    container = yaml_loader.load(str(DATA), target_class=Container)
+    container.persons[0].description = 'says "hi"\\there\nand\rleaves'
+    out = OUTPUT_PATH / "example_personinfo_data.nt"
+    rdflib_dumper.dump_ntriples(container, to_file=str(out), schemaview=view, prefix_map=PREFIX_MAP)
+    g = Graph()
+    g.parse(str(out), format="nt")
+    assert (P["001"], SDO.description, Literal('says "hi"\\there\nand\rleaves')) in g
+    assert isomorphic(g, rdflib_dumper.as_rdf_graph(container, schemaview=view, prefix_map=PREFIX_MAP))
+
+
+def test_oxigraph_store(tmp_path):
+    """Instances can be dumped to and loaded from an on-disk pyoxigraph store."""
+    view = SchemaView(str(SCHEMA))
+    container = yaml_loader.load(str(DATA), target_class=Container)
+    store = rdflib_dumper.as_oxigraph_store(
+        container, schemaview=view, prefix_map=PREFIX_MAP, store=pyoxigraph.Store(str(tmp_path / "store"))
+    )
+    g = Graph()
+    for t in OxigraphGraph(store):
+        g.add(t)
+    assert isomorphic(g, rdflib_dumper.as_rdf_graph(container, schemaview=view, prefix_map=PREFIX_MAP))
+    container = rdflib_loader.load(store, target_class=Container, schemaview=view, prefix_map=PREFIX_MAP)
+    _check_objs(view, container)
+
+
 @pytest.mark.parametrize("prefix_map", [PREFIX_MAP, Converter.from_prefix_map(PREFIX_MAP)])
 def test_enums(prefix_map):
     """Test enum handling in RDFLib dumper."""
@@ -176,6 +207,28 @@ def test_rdflib_loader(prefix_map):
     yaml_dumper.dump(container, to_file=str(DATA_ROUNDTRIP))
 
 
+def test_iter_rdf_graph():
+    """Root objects are yielded one at a time, and unprocessed triples are reported after the last one."""
+    view = SchemaView(str(SCHEMA))
+    g = Graph()
+    g.parse(str(DATA_TTL), format="ttl")
+    persons = rdflib_loader.from_rdf_graph(g, target_class=Person, schemaview=view, prefix_map=PREFIX_MAP)
+    it = rdflib_loader.iter_rdf_graph(g, target_class=Person, schemaview=view, prefix_map=PREFIX_MAP)
+    first = next(it)
+    assert [first, *it] == persons
+    assert len(persons) > 1
+    assert {p.id for p in persons} >= {"P:001", "P:002"}
+    it = rdflib_loader.iter_rdf_graph(
+        g, target_class=Person, schemaview=view, prefix_map=PREFIX_MAP, allow_unprocessed_triples=False
+    )
+    with pytest.raises(ValueError, match="Unprocessed triples"):
+        list(it)
+    [container] = rdflib_loader.from_rdf_graph(
+        g, target_class=Container, schemaview=view, prefix_map=PREFIX_MAP, allow_unprocessed_triples=False
+    )
+    _check_objs(view, container)
+
+
 @pytest.mark.parametrize("prefix_map", [PREFIX_MAP, Converter.from_prefix_map(PREFIX_MAP)])
 def test_unmapped_predicates(prefix_map):
     """
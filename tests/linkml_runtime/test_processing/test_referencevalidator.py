@@ -11,6 +11,7 @@ from typing import Any, Optional, Union
 
 import pytest
 import yaml
+from click.testing import CliRunner
 
 from linkml_runtime.dumpers import json_dumper, yaml_dumper
 from linkml_runtime.linkml_model import PermissibleValue, SlotDefinition, SlotDefinitionName
@@ -19,6 +20,7 @@ from linkml_runtime.processing.referencevalidator import (
     ConstraintType,
     ReferenceValidator,
     Report,
+    cli,
 )
 from linkml_runtime.utils.introspection import package_schemaview
 from linkml_runtime.utils.schema_builder import SchemaBuilder
@@ -1074,6 +1076,26 @@ class ReferenceValidatorTestCase(unittest.TestCase):
                 self.assertEqual(len(report.normalized_results()), len(expected_repairs))
                 self._assert_unrepaired_types_the_same(report, expected_unrepaired, v, expected_value)
 
+    def test_09_slot_aliases(self):
+        sb = SchemaBuilder()
+        sb.add_slot("id", identifier=True)
+        sb.add_slot("full_name", alias="fullName", required=True)
+        sb.add_class("Person", slots=["id", "full_name"])
+        normalizer = self._get_normalizer(sb)
+        person = normalizer.derived_schema.classes["Person"]
+        cases = [
+            ({"id": "P:1", "fullName": "x"}, []),
+            ({"id": "P:1", "full_name": "x"}, [ConstraintType.RequiredConstraint]),
+            ({"id": "P:1"}, [ConstraintType.RequiredConstraint]),
+            ({"id": "P:1", "fullName": "x", "name": "x"}, [ConstraintType.ClosedClassConstraint]),
+        ]
+        # the normalization plan of the class is reused for all objects
+        for inst, expected_problems in cases:
+            report = Report()
+            output = normalizer.normalize_object(inst, person, report)
+            self.assertEqual(inst, output)
+            self._assert_unrepaired_types_the_same(report, expected_problems, inst, output)
+
     def test_derived_schema_for_metadata(self):
         view = package_schemaview("linkml_runtime.linkml_model.meta")
         validator = ReferenceValidator(view)
@@ -1156,5 +1178,88 @@ class ReferenceValidatorTestCase(unittest.TestCase):
         self.assertEqual(num_warnings, len(report.warnings()))
 
 
+STREAMING_SCHEMA = """
+id: http://example.org/streaming
+name: streaming
+prefixes:
+  linkml: https://w3id.org/linkml/
+default_prefix: http://example.org/streaming/
+imports:
+  - linkml:types
+default_range: string
+classes:
+  Person:
+    attributes:
+      id:
+        identifier: true
+      name:
+        required: true
+      age:
+        range: integer
+      aliases:
+        multivalued: true
+  Container:
+    attributes:
+      persons:
+        range: Person
+        multivalued: true
+        inlined_as_list: true
+"""
+
+
+@pytest.mark.parametrize(
+    "input_name,input_text,processes",
+    [
+        (
+            "persons.jsonl",
+            '{"id": "P:1", "name": "a", "age": "5", "aliases": ["b", "c"]}\n{"id": "P:2", "age": 3}\n',
+            1,
+        ),
+        (
+            "persons.jsonl",
+            '{"id": "P:1", "name": "a", "age": "5", "aliases": ["b", "c"]}\n{"id": "P:2", "age": 3}\n',
+            2,
+        ),
+        ("persons.tsv", "id\tname\tage\taliases\nP:1\ta\t5\t[b|c]\nP:2\t\t3\t\n", 1),
+        ("persons.tsv", "id\tname\tage\taliases\nP:1\ta\t5\t[b|c]\nP:2\t\t3\t\n", 2),
+    ],
+)
+def test_cli_streaming(tmp_path, input_name, input_text, processes):
+    """JSONL and TSV inputs are normalized one instance at a time, and the reports combined."""
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(STREAMING_SCHEMA)
+    input_path = tmp_path / input_name
+    input_path.write_text(input_text)
+    output_path = tmp_path / "output.jsonl"
+    report_path = tmp_path / "report.yaml"
+    args = ["-s", schema_path, "-C", "Person", "-o", output_path, "-R", report_path, "-j", processes]
+    # One instance per batch, so a TSV input is read in several parts
+    args += ["--batch-size", 1, input_path]
+    with pytest.warns(FutureWarning):
+        result = CliRunner().invoke(cli, [str(a) for a in args])
+    assert result.exit_code == 1
+    assert [json.loads(line) for line in output_path.read_text().splitlines()] == [
+        {"id": "P:1", "name": "a", "age": 5, "aliases": ["b", "c"]},
+        {"id": "P:2", "age": 3},
+    ]
+    report = report_path.read_text()
+    if input_name.endswith(".jsonl"):
+        # The TSV loader already reads numbers as numbers
+        assert "type: TypeConstraint" in report
+    assert "type: RequiredConstraint" in report
+
+
+@pytest.mark.parametrize("option", ["--processes", "--batch-size"])
+def test_cli_streaming_option_range(tmp_path, option):
+    """A batch size or number of processes below 1 is rejected rather than silently dropping input."""
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(STREAMING_SCHEMA)
+    input_path = tmp_path / "persons.jsonl"
+    input_path.write_text('{"id": "P:1", "name": "a"}\n')
+    result = CliRunner().invoke(cli, ["-s", str(schema_path), "-C", "Person", option, "0", str(input_path)])
+    assert result.exit_code == 2
+    assert "0 is not in the range x>=1" in result.output
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -90,3 +90,59 @@ def test_enum_value_is_hashable(cls):
     assert hash(value) == hash(cls("A"))
     assert {value, cls("A")} == {value}
     assert {value: "x"}[cls("A")] == "x"
+
+
+def _lazy_enums():
+    """A parent and child enumeration whose non-identifier values are added by ``_addvals``, counting the calls"""
+    calls = []
+
+    class _LazyParent(EnumDefinitionImpl):
+        _defn = EnumDefinition(name="_LazyParent")
+        A = PermissibleValue(text="A")
+
+        @classmethod
+        def _addvals(cls):
+            calls.append(cls.__name__)
+            setattr(cls, "a b", PermissibleValue(text="a b"))
+
+    class _LazyChild(_LazyParent):
+        _defn = EnumDefinition(name="_LazyChild")
+
+        @classmethod
+        def _addvals(cls):
+            calls.append(cls.__name__)
+            setattr(cls, "c-d", PermissibleValue(text="c-d"))
+
+    return _LazyParent, _LazyChild, calls
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda cls: "a b" in cls,
+        lambda cls: cls["a b"],
+        lambda cls: getattr(cls, "a b"),
+        lambda cls: cls("a b"),
+    ],
+    ids=["contains", "getitem", "getattr", "construct"],
+)
+def test_addvals_deferred_until_used(use):
+    """Values added by ``_addvals`` are only built when the enumeration is used, and then for its whole MRO"""
+    parent, child, calls = _lazy_enums()
+    assert calls == []
+    assert parent.A.text == "A"
+    assert calls == []
+    assert use(child)
+    assert calls == ["_LazyParent", "_LazyChild"]
+    assert str(child("c-d")) == "c-d"
+    assert calls == ["_LazyParent", "_LazyChild"]
+
+
+def test_missing_attribute_after_addvals():
+    parent, _, calls = _lazy_enums()
+    with pytest.raises(AttributeError):
+        parent.DOES_NOT_EXIST
+    assert calls == ["_LazyParent"]
+    with pytest.raises(AttributeError):
+        parent.DOES_NOT_EXIST
+    assert calls == ["_LazyParent"]
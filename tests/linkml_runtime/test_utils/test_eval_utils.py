@@ -1,8 +1,15 @@
+import ast
 from dataclasses import dataclass
 
 import pytest
 
-from linkml_runtime.utils.eval_utils import eval_expr
+from linkml_runtime.utils.eval_utils import (
+    UnsetValueException,
+    compile_expr,
+    eval_,
+    eval_expr,
+    eval_expr_many,
+)
 
 
 @dataclass
@@ -81,3 +88,27 @@ def test_no_eval_prohibited():
 def test_funcs():
     with pytest.raises(NotImplementedError):
         eval_expr("my_func([1,2,3])")
+
+
+def test_compile_expr():
+    """Expressions are parsed once, and errors are raised when they are evaluated, as when interpreted."""
+    assert compile_expr("{x} + 1") is compile_expr("{x} + 1")
+    f = compile_expr("p.address.street")
+    assert f({"p": Person(address=Address(street="1 x street"))}) == "1 x street"
+    assert f({"p": None}) is None
+    assert compile_expr("x if True else {x, y}")({"x": 1}) == 1
+    with pytest.raises(ValueError):
+        compile_expr("{x, y}")({})
+
+
+def test_eval_expr_many():
+    persons = [Person(name="x", aliases=["a"]), Person(name="yz", aliases=[])]
+    assert eval_expr_many("strlen(p.name)", [{"p": p} for p in persons]) == [1, 2]
+    assert eval_expr_many("{n} + 1", [{"n": 1}, {"n": None}, {"n": 3}]) == [2, None, 4]
+
+
+def test_eval_node():
+    assert eval_(ast.parse("{x} * 2", mode="eval").body, {"x": 3}) == 6
+    assert eval_(ast.parse("1 + 2", mode="eval").body) == 3
+    with pytest.raises(UnsetValueException):
+        eval_(ast.parse("{x} * 2", mode="eval").body)
@@ -0,0 +1,54 @@
+"""
+Importing linkml_runtime stays cheap: dependencies only some features need are imported when those features are used
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Slow to import, and only needed for prefix maps, remote schemas, loaders and dumpers
+DEFERRED_MODULES = ["requests", "urllib3", "prefixcommons", "prefixmaps", "curies", "pydantic"]
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Modules imported by running a statement in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{statement}\nprint(*sys.modules, sep='\\n')"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import linkml_runtime",
+        "from linkml_runtime.linkml_model.meta import SchemaDefinition",
+        "from linkml_runtime.utils.schemaview import SchemaView",
+    ],
+)
+def test_deferred_imports(statement):
+    modules = _imported_modules(statement)
+    assert "linkml_runtime.utils.schemaview" in modules
+    for module in DEFERRED_MODULES:
+        assert module not in modules
+
+
+def test_uri_patterns_not_compiled_on_import():
+    """The full URI and CURIE patterns are compiled on first use, not when the metamodel is imported"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import linkml_runtime\n"
+            "from linkml_runtime.utils.uri_validator import _validator\n"
+            "print(_validator.cache_info().currsize)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "0"
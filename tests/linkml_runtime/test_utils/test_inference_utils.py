@@ -6,6 +6,7 @@ import pytest
 from linkml_runtime.utils.inference_utils import (
     Config,
     Policy,
+    SlotValueInferrer,
     generate_slot_value,
     infer_all_slot_values,
     infer_slot_value,
@@ -158,3 +159,18 @@ def test_nesting():
     infer_all_slot_values(r, schemaview=sv)
     assert '"b, a" IS SIBLING_OF "d, c"' == r.description
     assert '"a b" IS SIBLING_OF "c d"' == r.description2
+
+
+def test_slot_value_inferrer():
+    """Tests inferring slot values of many objects with one inferrer"""
+    sv = SchemaView(SCHEMA)
+    inferrer = SlotValueInferrer(sv, config=Config(use_expressions=True))
+    persons = [Person(first_name=f"x{i}", last_name="y", age_in_years=Decimal(i)) for i in range(1, 20)]
+    inferrer.infer_all(Container(persons=persons))
+    for i, p in enumerate(persons, start=1):
+        assert p.full_name == f"x{i} y"
+        assert p.age_in_months == i * 12
+        assert bool(p.is_juvenile) == (i < 18)
+    p = Person(first_name=FIRST, last_name=LAST, full_name=REPLACE_ME)
+    with pytest.raises(ValueError):
+        inferrer.infer(p)
@@ -0,0 +1,48 @@
+"""Tests for reading and writing rdflib triples in pyoxigraph stores."""
+
+import pyoxigraph as ox
+import pytest
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import XSD
+
+from linkml_runtime.utils.oxigraph_store import OxigraphGraph, OxigraphWriter, from_oxigraph, to_oxigraph
+
+EX = "http://example.com/"
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        URIRef(EX + "a"),
+        BNode("b1"),
+        Literal("hello"),
+        Literal("bonjour", lang="fr"),
+        Literal(42),
+        Literal("2019-01-01", datatype=XSD.date),
+        Literal('quote " and \\ backslash\nnewline'),
+    ],
+)
+def test_term_roundtrip(node):
+    """Terms convert to pyoxigraph and back unchanged."""
+    assert from_oxigraph(to_oxigraph(node)) == node
+
+
+def test_xsd_string_is_plain():
+    """xsd:string literals read back as plain literals, as in RDF 1.1."""
+    assert from_oxigraph(to_oxigraph(Literal("x", datatype=XSD.string))) == Literal("x")
+
+
+def test_writer_and_graph():
+    """Triples written in batches are read back by pattern, from the graph they were written to."""
+    store = ox.Store()
+    p = URIRef(EX + "p")
+    graph_name = ox.NamedNode(EX + "g")
+    with OxigraphWriter(store, graph_name, batch_size=2) as writer:
+        for i in range(5):
+            writer.add((URIRef(f"{EX}s{i}"), p, Literal(i)))
+    g = OxigraphGraph(store, graph_name)
+    assert len(g) == 5
+    assert len(OxigraphGraph(store)) == 0
+    assert sorted(g.objects(URIRef(EX + "s3"), p)) == [Literal(3)]
+    assert sorted(g.subjects(p, Literal(1))) == [URIRef(EX + "s1")]
+    assert len(list(g.triples((None, p, None)))) == 5
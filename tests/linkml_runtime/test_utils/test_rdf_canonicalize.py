@@ -10,7 +10,7 @@ import pyoxigraph as ox
 import pytest
 import rdflib
 from rdflib import BNode, Graph, Literal, URIRef
-from rdflib.namespace import RDF
+from rdflib.namespace import RDF, XSD
 
 from linkml_runtime.utils import rdf_canonicalize as rdf_canon_mod
 from linkml_runtime.utils.rdf_canonicalize import (
@@ -455,6 +455,25 @@ def test_fallback_preserves_relative_iri():
     assert "<testing>" in result
 
 
+def test_fallback_keeps_terms_pyoxigraph_rejects():
+    """The fallback output holds exactly the triples of the graph, including ones pyoxigraph cannot represent."""
+    g = Graph()
+    g.bind("ex", "http://example.com/")
+    s = URIRef("http://example.com/s")
+    bn = BNode()
+    g.add((s, URIRef("http://example.com/p"), URIRef("testing")))
+    g.add((s, URIRef("http://example.com/p"), Literal("typed", datatype=XSD.string)))
+    g.add((s, URIRef("http://example.com/p"), Literal("long tag", lang="en-toolongsubtag")))
+    g.add((s, URIRef("http://example.com/has"), bn))
+    g.add((bn, Literal("literal predicate"), Literal("value")))
+    with pytest.warns(RDFCanonicalizationWarning, match="non-standard RDF"):
+        result = canonicalize_rdf_graph(g, output_format="nt")
+    assert len(result.splitlines()) == len(g)
+    assert '"typed"^^<http://www.w3.org/2001/XMLSchema#string>' in result
+    assert '"long tag"@en-toolongsubtag' in result
+    assert '"literal predicate"' in result
+
+
 @pytest.mark.parametrize("output_format", ["turtle", "nt"])
 def test_fallback_is_deterministic_across_processes(output_format):
     """The rdflib fallback produces byte-identical output across processes.
@@ -0,0 +1,39 @@
+import pytest
+
+from linkml_runtime.utils import uri_validator
+from linkml_runtime.utils.uri_validator import validate_curie, validate_uri, validate_uri_reference
+
+
+@pytest.mark.parametrize(
+    "value,is_uri,is_uri_reference",
+    [
+        ("http://www.w3.org/1999/02/22-rdf-syntax-ns#subject", True, True),
+        ("https://w3id.org/linkml/", True, True),
+        ("http://example.org:8080/a/b?c=d&e=f#g", True, True),
+        ("http://example.org/a%20b", True, True),
+        ("urn:isbn:0451450523", True, True),
+        ("file:///tmp/schema.yaml", True, True),
+        ("http://[::1]/a", True, True),
+        ("a/b/c", False, True),
+        ("#fragment", False, True),
+        ("http://example.org/a b", False, False),
+        ("http://example.org/a%2", False, False),
+        ("http://example.org/<a>", False, False),
+    ],
+)
+def test_validate_uri(value, is_uri, is_uri_reference):
+    assert bool(validate_uri(value)) is is_uri
+    assert bool(validate_uri_reference(value)) is is_uri_reference
+
+
+@pytest.mark.parametrize("value", ["http://a.b/c", "h://", "x+y.z-1://host:80/p;q=1/@:!$&'()*+,~?q/?#f/?"])
+def test_simple_uri_pattern_is_subset(value):
+    """URIs accepted by the quick pattern are accepted by the full one"""
+    assert uri_validator._simple_uri_validator.match(value)
+    assert uri_validator.uri_validator.match(value)
+
+
+def test_validate_curie():
+    assert validate_curie("rdf:type")
+    assert validate_curie("[rdf:type]") is None
+    assert uri_validator.safe_curie_validator.match("[rdf:type]")
@@ -293,6 +293,25 @@ def test_normalize_inlined_simple_dict_in_dict():
     }
 
 
+def test_normalize_inlined_dict_of_dicts_leaves_input_unchanged():
+    """{key: {...}} entries without the key are completed without modifying the caller's dictionaries."""
+    raw = {"n1": {"title": "t1"}, "n2": None}
+    c = _ContainerDict(items=raw)
+    assert c.items == {
+        "n1": _ChildClass(notation="n1", title="t1"),
+        "n2": _ChildClass(notation="n2"),
+    }
+    assert raw == {"n1": {"title": "t1"}, "n2": None}
+
+
+@pytest.mark.parametrize("container", [_ContainerList, _ContainerDict])
+@pytest.mark.parametrize("raw", [None, [], {}])
+def test_normalize_inlined_empty(container, raw):
+    """Empty inlined slots normalize to an empty collection of the inlined form."""
+    c = container(items=raw)
+    assert c.items == ([] if container is _ContainerList else {})
+
+
 def test_normalize_inlined_duplicate_keys():
     """Duplicate key detection must still work after the kwargs fix."""
     with pytest.raises(ValueError, match="duplicate key"):